@@ -0,0 +1,203 @@
+#!/usr/bin/env python
+"""Benchmark calculate_moving_average and gate on throughput regressions.
+
+Each case is timed (best of ``--repeat`` runs) and then re-run under
+tracemalloc to record peak allocated memory. Results are written as JSON;
+when a baseline file exists, the run fails if any case's throughput drops
+by more than ``--threshold`` relative to it. The baseline is tracked in git
+and should be recorded on the same kind of machine that runs the gate.
+
+Usage:
+    python scripts/benchmark.py                      # quick grid
+    python scripts/benchmark.py --preset full        # 1e3..1e7 points
+    python scripts/benchmark.py --save-baseline      # record a new baseline
+"""
+
+import argparse
+import json
+import platform
+import random
+import sys
+import timeit
+import tracemalloc
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Any
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from src.example import DataPoint, calculate_moving_average
+from src.series import DataPointSeries
+
+PRESETS = {
+    "quick": {"sizes": [1_000, 100_000], "windows": [2, 100, 1_440]},
+    "full": {
+        "sizes": [1_000, 10_000, 100_000, 1_000_000, 10_000_000],
+        "windows": [2, 10, 100, 1_440, 10_000],
+    },
+}
+# The baseline is committed so CI can gate on it; local runs stay ignored.
+DEFAULT_BASELINE = Path("benchmarks/baseline.json")
+DEFAULT_OUTPUT = Path(".benchmarks/latest.json")
+
+
+def make_points(size: int, seed: int = 0) -> list[DataPoint]:
+    """Build a regularly sampled random walk of ``size`` points."""
+    rng = random.Random(seed)  # noqa: S311 - reproducible test data
+    start = datetime(2024, 1, 1)
+    step = timedelta(seconds=1)
+    value = 0.0
+    points = []
+    for i in range(size):
+        value += rng.gauss(0.0, 1.0)
+        points.append(DataPoint(start + i * step, value))
+    return points
+
+
+def run_case(data: Any, window: int, backend: str, repeat: int) -> dict[str, Any]:
+    """Time one configuration, then measure its peak memory.
+
+    Small cases are looped (as ``timeit`` does) until one measurement takes
+    at least 0.2s, so per-call noise does not trip the regression gate.
+    """
+    timer = timeit.Timer(
+        lambda: calculate_moving_average(data, window, backend=backend)
+    )
+    number, _ = timer.autorange()
+    best = min(timer.repeat(repeat, number)) / number
+
+    tracemalloc.start()
+    calculate_moving_average(data, window, backend=backend)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return {
+        "seconds": best,
+        "points_per_second": len(data) / best if best else float("inf"),
+        "peak_bytes": peak,
+    }
+
+
+def run(args: argparse.Namespace) -> list[dict[str, Any]]:
+    """Run every case in the configured grid."""
+    results = []
+    for size in args.sizes:
+        points = make_points(size)
+        inputs = {"list": points, "series": DataPointSeries.from_points(points)}
+        for form in args.forms:
+            for backend in args.backends:
+                for window in args.windows:
+                    if window > size:
+                        continue
+                    name = f"{form}/{backend}/n={size}/w={window}"
+                    try:
+                        case = run_case(inputs[form], window, backend, args.repeat)
+                    except ImportError:
+                        print(f"skip  {name} (backend unavailable)")
+                        break
+                    case.update(
+                        name=name, form=form, backend=backend, size=size, window=window
+                    )
+                    results.append(case)
+                    print(
+                        f"{name:<40} {case['seconds'] * 1e3:10.2f} ms "
+                        f"{case['points_per_second'] / 1e6:8.2f} Mpts/s "
+                        f"{case['peak_bytes'] / 2**20:8.2f} MiB peak"
+                    )
+    return results
+
+
+def compare(
+    results: list[dict[str, Any]], baseline: dict[str, Any], threshold: float
+) -> list[str]:
+    """Return a message for each case whose throughput regressed."""
+    previous = {case["name"]: case for case in baseline.get("results", [])}
+    regressions = []
+    for case in results:
+        old = previous.get(case["name"])
+        if old is None:
+            continue
+        ratio = case["points_per_second"] / old["points_per_second"]
+        if ratio < 1 - threshold:
+            regressions.append(
+                f"{case['name']}: {ratio:.0%} of baseline throughput "
+                f"({case['points_per_second']:.0f} vs "
+                f"{old['points_per_second']:.0f} points/s)"
+            )
+    return regressions
+
+
+def write_json(path: Path, results: list[dict[str, Any]]) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    payload = {
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "machine": platform.machine(),
+        "results": results,
+    }
+    path.write_text(json.dumps(payload, indent=2) + "\n")
+
+
+def parse_args(argv: list[str]) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--preset", choices=sorted(PRESETS), default="quick")
+    parser.add_argument("--sizes", type=int, nargs="+", help="Override preset sizes")
+    parser.add_argument(
+        "--windows", type=int, nargs="+", help="Override preset windows"
+    )
+    parser.add_argument(
+        "--forms", nargs="+", choices=["list", "series"], default=["list", "series"]
+    )
+    parser.add_argument(
+        "--backends",
+        nargs="+",
+        choices=["python", "numpy"],
+        default=["python", "numpy"],
+    )
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--output", type=Path, default=DEFAULT_OUTPUT)
+    parser.add_argument("--baseline", type=Path, default=DEFAULT_BASELINE)
+    parser.add_argument(
+        "--save-baseline", action="store_true", help="Write results as the baseline"
+    )
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=0.2,
+        help="Fail when throughput drops by more than this fraction (default 0.2)",
+    )
+    args = parser.parse_args(argv)
+    preset = PRESETS[args.preset]
+    args.sizes = args.sizes or preset["sizes"]
+    args.windows = args.windows or preset["windows"]
+    return args
+
+
+def main(argv: list[str]) -> int:
+    args = parse_args(argv)
+    results = run(args)
+    write_json(args.output, results)
+    print(f"\nResults written to {args.output}")
+
+    if args.save_baseline:
+        write_json(args.baseline, results)
+        print(f"Baseline saved to {args.baseline}")
+        return 0
+    if not args.baseline.exists():
+        print(f"No baseline at {args.baseline}; run with --save-baseline to create one")
+        return 0
+
+    regressions = compare(
+        results, json.loads(args.baseline.read_text()), args.threshold
+    )
+    if regressions:
+        print(f"\n{len(regressions)} regression(s) beyond {args.threshold:.0%}:")
+        for message in regressions:
+            print(f"  {message}")
+        return 1
+    print(f"No regressions beyond {args.threshold:.0%} against {args.baseline}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
@@ -1,11 +1,115 @@
+"""Initialize a new project from this template.
+
+Run without arguments for the interactive setup. Pass flags or a TOML
+config file to run non-interactively, or ``--batch`` to stamp out many
+projects in parallel::
+
+    python scripts/init_project.py
+    python scripts/init_project.py -y --name my-service --no-docs
+    python scripts/init_project.py --config project.toml
+    python scripts/init_project.py --batch services.toml --jobs 8
+
+A config file holds the same keys as :class:`ProjectConfig`. A batch file
+has an optional ``[defaults]`` table and one ``[[projects]]`` entry per
+project, each with a ``path`` to create it at.
+
+All edits to a project go through a :class:`ProjectTransaction`, which
+reads ``pyproject.toml`` and the Makefile once, stages every change in
+memory and writes each file once on commit.
+"""
+
+import argparse
 import os
+import re
+import shutil
 import subprocess
 import sys
+from collections.abc import Iterable, Mapping
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, fields
 from pathlib import Path
-from typing import Optional
+from typing import Any, Callable, Optional, Union
+
 import tomli
 import tomli_w
 
+TEMPLATE_ROOT = Path(__file__).resolve().parent.parent
+EXAMPLE_CODE_CHOICES = {"1": "keep", "2": "minimal", "3": "remove"}
+TEMPLATE_DIR_NAMES = ("python-collab-template", "python-project-test")
+DOCS_DEPENDENCIES = [
+    "mkdocs-material>=9.6.14",
+    "mkdocstrings[python]>=0.26.1",
+]
+DOCS_TEMPLATES = {
+    "templates/mkdocs.yml.template": "mkdocs.yml",
+    "templates/docs/index.md.template": "docs/index.md",
+    "templates/docs/getting-started.md.template": "docs/getting-started.md",
+    "templates/docs/reference/api.md.template": "docs/reference/api.md",
+    "templates/.github/workflows/docs.yml.template": ".github/workflows/docs.yml",
+}
+# Never copied into new projects, whatever the template's .gitignore says.
+COPY_IGNORE = (".git",)
+
+_PLACEHOLDER = re.compile(r"\{(\w+)\}")
+_SRC_IMPORT = re.compile(r"^(\s*(?:from|import) )src\b", re.MULTILINE)
+# ``python -m src`` as a command string or an argument list.
+_SRC_RUN = re.compile(r"""(-m(?:\s+|["'],\s*["']))src\b""")
+# Tests of the template itself, kept whatever happens to the example code.
+TEMPLATE_TESTS = ("test_docs_setup.py", "test_init_project.py")
+
+Log = Callable[[str], None]
+
+
+class ScaffoldError(Exception):
+    """Raised when a project cannot be initialized."""
+
+
+@dataclass
+class ProjectConfig:
+    """Answers to every question the interactive setup asks."""
+
+    project_name: str = "my-python-project"
+    project_description: str = "A Python project"
+    author_name: str = ""
+    author_email: str = ""
+    example_code: str = "keep"  # keep, minimal or remove
+    docs: bool = True
+    github_username: str = ""
+    precommit: bool = True
+    setup: bool = True
+    git: bool = True
+
+    def __post_init__(self) -> None:
+        self.example_code = EXAMPLE_CODE_CHOICES.get(
+            self.example_code, self.example_code
+        )
+        if self.example_code not in EXAMPLE_CODE_CHOICES.values():
+            raise ScaffoldError(
+                f"example_code must be keep, minimal or remove, "
+                f"got {self.example_code!r}"
+            )
+
+    @property
+    def module_name(self) -> str:
+        return self.project_name.replace("-", "_").lower()
+
+    @classmethod
+    def from_mapping(cls, values: Mapping[str, Any]) -> "ProjectConfig":
+        known = {f.name for f in fields(cls)}
+        unknown = sorted(set(values) - known)
+        if unknown:
+            raise ScaffoldError(f"unknown config keys: {', '.join(unknown)}")
+        return cls(**values)
+
+    def with_git_defaults(self, root: Path) -> "ProjectConfig":
+        """Fill in author and GitHub user from git config where unset."""
+        self.author_name = self.author_name or get_git_config("name") or "Your Name"
+        self.author_email = (
+            self.author_email or get_git_config("email") or "your.email@example.com"
+        )
+        self.github_username = self.github_username or github_username(root)
+        return self
+
 
 def prompt_with_default(prompt: str, default: str) -> str:
     """Prompt for input with a default value."""
@@ -16,258 +120,402 @@ def prompt_with_default(prompt: str, default: str) -> str:
 def get_git_config(key: str) -> Optional[str]:
     """Get git config value."""
     try:
-        return subprocess.check_output(
-            ["git", "config", "user."+key], text=True
+        return subprocess.check_output(  # noqa: S603
+            ["git", "config", "user." + key],  # noqa: S607
+            text=True,
         ).strip()
-    except subprocess.CalledProcessError:
+    except (subprocess.CalledProcessError, OSError):
         return None
 
 
-def update_pyproject_toml(
-    project_name: str,
-    project_description: str,
-    author_name: str,
-    author_email: str
-) -> None:
-    """Update pyproject.toml with new project information."""
-    pyproject_path = Path("pyproject.toml")
-    
-    # Read existing toml
-    with open(pyproject_path, "rb") as f:
-        config = tomli.load(f)
-    
-    # Update project information
-    config["project"]["name"] = project_name
-    config["project"]["description"] = project_description
-    config["project"]["authors"] = [
-        {"name": author_name, "email": author_email}
-    ]
-    
-    # Write updated toml
-    with open(pyproject_path, "wb") as f:
-        tomli_w.dump(config, f)
+def github_username(root: Path) -> str:
+    """Extract the GitHub user from the origin remote, if there is one."""
+    try:
+        url = subprocess.check_output(
+            ["git", "config", "remote.origin.url"],  # noqa: S607
+            text=True,
+            cwd=root,
+        ).strip()
+    except (subprocess.CalledProcessError, OSError):
+        return "your-username"
+    if url.startswith("git@github.com:"):
+        return url.split(":")[1].split("/")[0]
+    if url.startswith("https://github.com/"):
+        return url.split("/")[3]
+    return "your-username"
 
 
-def run_command(command: str) -> None:
-    """Run a shell command and exit if it fails."""
+def run_command(args: list[str], cwd: Path) -> None:
+    """Run a command without a shell, raising ScaffoldError if it fails."""
     try:
-        subprocess.run(command, shell=True, check=True)
-    except subprocess.CalledProcessError as e:
-        print(f"Error running command: {command}")
-        print(f"Error: {e}")
-        sys.exit(1)
+        subprocess.run(args, cwd=cwd, check=True)  # noqa: S603
+    except (subprocess.CalledProcessError, OSError) as e:
+        raise ScaffoldError(f"Error running command: {' '.join(args)}: {e}") from e
+
+
+_compiled_templates: dict[str, tuple[str, ...]] = {}
+
+
+def compile_template(template: str, root: Path = TEMPLATE_ROOT) -> tuple[str, ...]:
+    """Split ``root / template`` into alternating literal text and placeholders.
+
+    Cached on ``template``, the path relative to the project, so every
+    project of a batch, all copied from the same template, shares one parse.
+    """
+    parts = _compiled_templates.get(template)
+    if parts is None:
+        parts = tuple(_PLACEHOLDER.split((root / template).read_text()))
+        parts = _compiled_templates.setdefault(template, parts)
+    return parts
+
+
+def _fill(parts: Iterable[str], replacements: Mapping[str, str]) -> str:
+    filled = list(parts)
+    for i in range(1, len(filled), 2):
+        name = filled[i]
+        filled[i] = replacements.get(name, f"{{{name}}}")
+    return "".join(filled)
 
 
-def template_file(template_path: str, output_path: str, replacements: dict) -> None:
+def render_template(
+    template: str, replacements: Mapping[str, str], root: Path = TEMPLATE_ROOT
+) -> str:
+    """Fill ``{placeholder}`` fields in one pass; unknown ones are kept."""
+    return _fill(compile_template(template, root), replacements)
+
+
+def template_file(
+    template_path: Union[str, Path],
+    output_path: Union[str, Path],
+    replacements: Mapping[str, str],
+) -> None:
     """Template a file by replacing placeholders with values."""
-    with open(template_path, "r") as f:
-        content = f.read()
-    
-    for placeholder, value in replacements.items():
-        content = content.replace(f"{{{placeholder}}}", value)
-    
-    # Ensure parent directory exists (only if there is a parent directory)
-    parent_dir = os.path.dirname(output_path)
-    if parent_dir:
-        os.makedirs(parent_dir, exist_ok=True)
-    
-    with open(output_path, "w") as f:
-        f.write(content)
+    output = Path(output_path)
+    output.parent.mkdir(parents=True, exist_ok=True)
+    parts = _PLACEHOLDER.split(Path(template_path).read_text())
+    output.write_text(_fill(parts, replacements))
+
+
+class ProjectTransaction:
+    """Stages every change to a project and applies them on :meth:`commit`.
+
+    ``pyproject.toml`` and the Makefile are parsed once and edited in
+    memory; other file writes, moves and deletions are queued in order.
+    """
+
+    def __init__(self, root: Path) -> None:
+        self.root = root
+        with (root / "pyproject.toml").open("rb") as f:
+            self.pyproject: dict[str, Any] = tomli.load(f)
+        self.makefile = (root / "Makefile").read_text()
+        self._operations: list[tuple[str, Path, Any]] = []
+
+    def write(self, path: Union[str, Path], content: str) -> None:
+        self._operations.append(("write", self.root / path, content))
+
+    def move(self, source: Union[str, Path], target: Union[str, Path]) -> None:
+        self._operations.append(("move", self.root / source, self.root / target))
+
+    def remove(self, path: Union[str, Path]) -> None:
+        self._operations.append(("remove", self.root / path, None))
+
+    def commit(self) -> None:
+        """Apply queued operations, then write pyproject and Makefile once."""
+        for action, path, argument in self._operations:
+            if action == "write":
+                path.parent.mkdir(parents=True, exist_ok=True)
+                path.write_text(argument)
+            elif action == "move":
+                shutil.move(str(path), str(argument))
+            elif path.is_dir():
+                shutil.rmtree(path)
+            elif path.exists():
+                path.unlink()
+        self._operations.clear()
+        with (self.root / "pyproject.toml").open("wb") as f:
+            tomli_w.dump(self.pyproject, f)
+        (self.root / "Makefile").write_text(self.makefile)
+
+
+def _table(config: dict[str, Any], *keys: str) -> Optional[dict[str, Any]]:
+    """Return a nested table, or None if any level is missing."""
+    for key in keys:
+        config = config.get(key)  # type: ignore[assignment]
+        if not isinstance(config, dict):
+            return None
+    return config
+
+
+def _example_files(root: Path, module: str) -> list[Path]:
+    """Files making up the example library and its tests and benchmark."""
+    files = [p for p in (root / module).glob("*.py") if p.name != "__init__.py"]
+    files += [
+        p for p in (root / "tests").glob("test_*.py") if p.name not in TEMPLATE_TESTS
+    ]
+    benchmark = root / "scripts" / "benchmark.py"
+    if benchmark.exists():
+        files.append(benchmark)
+    return files
+
+
+def update_project(tx: ProjectTransaction, config: ProjectConfig, log: Log) -> None:
+    """Stage project metadata, module rename and example code handling."""
+    module = config.module_name
+    project = tx.pyproject["project"]
+    project["name"] = config.project_name
+    project["description"] = config.project_description
+    project["authors"] = [{"name": config.author_name, "email": config.author_email}]
+
+    log(f"🔧 Updating Makefile and pyproject.toml for module: {module}")
+    tx.makefile = tx.makefile.replace(
+        "MODULE_NAME := src", f"MODULE_NAME := {module}"
+    ).replace("python-collab-template", config.project_name)
+    wheel = _table(tx.pyproject, "tool", "hatch", "build", "targets", "wheel")
+    if wheel is not None:
+        wheel["packages"] = [module]
+    isort = _table(tx.pyproject, "tool", "ruff", "lint", "isort")
+    if isort is not None:
+        isort["known-first-party"] = [module]
+
+    root = tx.root
+    source = root / "src"
+    if module != "src":
+        if (root / module).exists():
+            raise ScaffoldError(f"module directory {module} already exists")
+        if source.exists():
+            log(f"📦 Moving src to {module}...")
+            tx.move("src", module)
+        else:
+            tx.write(
+                Path(module) / "__init__.py",
+                f'"""Main package for {config.project_name}."""\n',
+            )
+
+    scripts = project.get("scripts", {})
+    if config.example_code == "keep":
+        log("📚 Updating example code imports for new module name...")
+        if module != "src":
+            for path in _example_files(root, "src"):
+                if path.parent.name == "src":
+                    continue
+                text = path.read_text()
+                updated = _SRC_IMPORT.sub(rf"\g<1>{module}", text)
+                updated = _SRC_RUN.sub(rf"\g<1>{module}", updated)
+                if updated != text:
+                    tx.write(path.relative_to(root), updated)
+            for name, target in scripts.items():
+                if target.startswith("src."):
+                    scripts[name] = module + target[len("src") :]
+        return
+
+    # The example library spans the whole module, so both other modes drop
+    # it along with its tests, benchmark and console scripts.
+    for path in _example_files(root, "src" if source.exists() else module):
+        relative = path.relative_to(root)
+        if relative.parts[0] == "src":
+            relative = Path(module, *relative.parts[1:])
+        tx.remove(relative)
+    tx.remove("benchmarks")
+    project.pop("scripts", None)
+    tx.write("tests/__init__.py", "")
+
+    if config.example_code == "minimal":
+        log("📝 Creating minimal placeholder test...")
+        tx.write(
+            Path(module) / "example.py",
+            'def add(a: int, b: int) -> int:\n    """Add two numbers."""\n'
+            "    return a + b\n",
+        )
+        tx.write(
+            "tests/test_example.py",
+            f"from {module}.example import add\n\n\n"
+            "def test_add():\n    assert add(1, 2) == 3\n",
+        )
+    else:
+        log("🧹 Removing all example code...")
 
 
 def setup_documentation(
-    project_name: str,
-    project_description: str,
-    author_name: str,
-    author_email: str,
-    project_module_name: str,
-    github_username: str = "your-username"
+    tx: ProjectTransaction, config: ProjectConfig, log: Log = print
 ) -> None:
-    """Set up documentation with MkDocs + Material theme."""
-    print("📚 Setting up documentation...")
-    
-    # Define template replacements
+    """Stage MkDocs + Material documentation for the project."""
+    log("📚 Setting up documentation...")
     replacements = {
-        "project_name": project_name,
-        "project_description": project_description,
-        "author_name": author_name,
-        "author_email": author_email,
-        "project_module_name": project_module_name,
-        "github_username": github_username,
+        "project_name": config.project_name,
+        "project_description": config.project_description,
+        "author_name": config.author_name,
+        "author_email": config.author_email,
+        "project_module_name": config.module_name,
+        "github_username": config.github_username,
     }
-    
-    # Template and create documentation files
-    template_file("templates/mkdocs.yml.template", "mkdocs.yml", replacements)
-    template_file("templates/docs/index.md.template", "docs/index.md", replacements)
-    template_file("templates/docs/getting-started.md.template", "docs/getting-started.md", replacements)
-    template_file("templates/docs/reference/api.md.template", "docs/reference/api.md", replacements)
-    template_file("templates/.github/workflows/docs.yml.template", ".github/workflows/docs.yml", replacements)
-    
-    # Add documentation dependencies to pyproject.toml
-    pyproject_path = Path("pyproject.toml")
-    with open(pyproject_path, "rb") as f:
-        config = tomli.load(f)
-    
-    # Ensure dependency-groups exists
-    if "dependency-groups" not in config:
-        config["dependency-groups"] = {}
-    
-    # Add docs dependencies to dev group
-    if "dev" not in config["dependency-groups"]:
-        config["dependency-groups"]["dev"] = []
-    
-    docs_deps = [
-        "mkdocs-material>=9.6.14",
-        "mkdocstrings[python]>=0.26.1",
-    ]
-    
-    for dep in docs_deps:
-        if dep not in config["dependency-groups"]["dev"]:
-            config["dependency-groups"]["dev"].append(dep)
-    
-    with open(pyproject_path, "wb") as f:
-        tomli_w.dump(config, f)
-    
-    print("✅ Documentation setup complete")
-    print("   - MkDocs configuration created")
-    print("   - Documentation structure created")
-    print("   - GitHub Actions workflow added")
-    print("   - Dependencies added to pyproject.toml")
-
-
-def main() -> None:
-    print("🚀 Initializing new Python project...")
-
-    # Get project information
-    project_name = prompt_with_default(
-        "Project name", "my-python-project"
-    )
-    project_description = prompt_with_default(
-        "Project description", "A Python project"
+    for template, output in DOCS_TEMPLATES.items():
+        tx.write(output, render_template(template, replacements, tx.root))
+
+    dev = tx.pyproject.setdefault("dependency-groups", {}).setdefault("dev", [])
+    for dep in DOCS_DEPENDENCIES:
+        if dep not in dev:
+            dev.append(dep)
+
+
+def finish_environment(root: Path, config: ProjectConfig, log: Log) -> None:
+    """Install dependencies, create the git repository and commit."""
+    if config.setup:
+        log("🔨 Setting up development environment...")
+        run_command(["make", "setup"], root)
+    if not config.git:
+        return
+
+    log("🔄 Initializing git repository...")
+    shutil.rmtree(root / ".git", ignore_errors=True)
+    run_command(["git", "init", "-q"], root)
+    if config.precommit:
+        log("🔧 Setting up pre-commit hooks...")
+        run_command(["uv", "run", "pre-commit", "install"], root)
+    run_command(["git", "add", "."], root)
+    run_command(
+        ["git", "commit", "-q", "-m", "feat: Initial project setup", "--no-verify"],
+        root,
     )
-    author_name = prompt_with_default(
-        "Author name", get_git_config("name") or "Your Name"
+
+
+def initialize(root: Path, config: ProjectConfig, log: Log = print) -> None:
+    """Initialize the project at ``root`` without asking any questions."""
+    config.with_git_defaults(root)
+    tx = ProjectTransaction(root)
+    log("📝 Updating project configuration...")
+    update_project(tx, config, log)
+    if config.docs:
+        setup_documentation(tx, config, log)
+    else:
+        log("⏩ Skipping documentation setup")
+    tx.commit()
+    finish_environment(root, config, log)
+
+
+def template_files(root: Path) -> Optional[list[str]]:
+    """List the files git would commit in ``root``, or None if it is no checkout.
+
+    Tracked files plus untracked ones that ``.gitignore`` does not exclude,
+    so virtualenvs, caches, build output and secrets stay behind.
+    """
+    if not (root / ".git").exists():
+        return None
+    args = ["git", "ls-files", "-z", "--cached", "--others", "--exclude-standard"]
+    try:
+        listing = subprocess.run(  # noqa: S603
+            args, cwd=root, check=True, capture_output=True
+        ).stdout
+    except (subprocess.CalledProcessError, OSError):
+        return None
+    return [name for name in os.fsdecode(listing).split("\0") if name]
+
+
+def gitignore_patterns(root: Path) -> list[str]:
+    """Read the ``.gitignore`` patterns of ``root`` as ``shutil`` name globs."""
+    patterns = list(COPY_IGNORE)
+    gitignore = root / ".gitignore"
+    if gitignore.exists():
+        for line in gitignore.read_text().splitlines():
+            line = line.strip()
+            if line and not line.startswith(("#", "!")):
+                patterns.append(line.strip("/"))
+    return patterns
+
+
+def copy_template(root: Path, destination: Path) -> None:
+    """Copy the template at ``root`` to ``destination``, minus ignored files.
+
+    Uses ``git ls-files`` when ``root`` is a checkout and falls back to
+    the ``.gitignore`` patterns otherwise.
+    """
+    files = template_files(root)
+    if files is None:
+        ignore = shutil.ignore_patterns(*gitignore_patterns(root))
+        shutil.copytree(root, destination, ignore=ignore, symlinks=True)
+        return
+    destination.mkdir(parents=True)
+    for name in files:
+        source = root / name
+        # Tracked files deleted from the working tree are still listed.
+        if not source.is_symlink() and not source.is_file():
+            continue
+        target = destination / name
+        target.parent.mkdir(parents=True, exist_ok=True)
+        shutil.copy2(source, target, follow_symlinks=False)
+
+
+def _create_one(destination: Path, config: ProjectConfig) -> Path:
+    def log(message: str) -> None:
+        print(f"[{config.project_name}] {message}")
+
+    if destination.exists():
+        raise ScaffoldError(f"{destination} already exists")
+    copy_template(TEMPLATE_ROOT, destination)
+    initialize(destination, config, log)
+    return destination
+
+
+def initialize_batch(
+    projects: Iterable[tuple[Path, ProjectConfig]], jobs: Optional[int] = None
+) -> list[Union[Path, Exception]]:
+    """Copy the template to each path and initialize it, in parallel.
+
+    Returns:
+        The created path, or the exception raised, for each project in order
+    """
+
+    def create(item: tuple[Path, ProjectConfig]) -> Union[Path, Exception]:
+        try:
+            return _create_one(*item)
+        except Exception as e:
+            return e
+
+    with ThreadPoolExecutor(max_workers=jobs) as pool:
+        return list(pool.map(create, projects))
+
+
+def load_toml(path: Path) -> dict[str, Any]:
+    with path.open("rb") as f:
+        return tomli.load(f)
+
+
+def load_batch(path: Path) -> list[tuple[Path, ProjectConfig]]:
+    """Read a batch file of ``[defaults]`` and ``[[projects]]`` tables."""
+    data = load_toml(path)
+    defaults = data.get("defaults", {})
+    projects = []
+    for entry in data.get("projects", []):
+        entry = {**defaults, **entry}
+        if "path" not in entry:
+            raise ScaffoldError("every [[projects]] entry needs a path")
+        destination = (path.parent / entry.pop("path")).resolve()
+        entry.setdefault("project_name", destination.name)
+        projects.append((destination, ProjectConfig.from_mapping(entry)))
+    return projects
+
+
+def interactive_config(config: ProjectConfig) -> ProjectConfig:
+    """Ask every question, offering ``config`` values as defaults."""
+    config.project_name = prompt_with_default("Project name", config.project_name)
+    config.project_description = prompt_with_default(
+        "Project description", config.project_description
     )
-    author_email = prompt_with_default(
-        "Author email", get_git_config("email") or "your.email@example.com"
+    config.author_name = prompt_with_default(
+        "Author name", config.author_name or get_git_config("name") or "Your Name"
     )
-
-    # Update project information
-    print("📝 Updating project configuration...")
-    update_pyproject_toml(
-        project_name,
-        project_description,
-        author_name,
-        author_email
+    config.author_email = prompt_with_default(
+        "Author email",
+        config.author_email or get_git_config("email") or "your.email@example.com",
     )
-
-    # Handle example code
-    code_choice = prompt_with_default(
+    choice = prompt_with_default(
         "How would you like to handle example code?\n"
         "1. Keep example code (useful for reference)\n"
         "2. Create minimal placeholder test (ensures checks pass)\n"
         "3. Remove all example code (clean slate)\n"
-        "Choose option (1/2/3)", "1"
+        "Choose option (1/2/3)",
+        "1",
     )
-
-    # Create module directory with project name (replacing src)
-    project_module_name = project_name.replace("-", "_").lower()
-    
-    # Always update the Makefile to use the new module name
-    print(f"🔧 Updating Makefile to use module name: {project_module_name}")
-    makefile_path = Path("Makefile")
-    with open(makefile_path, "r") as f:
-        makefile_content = f.read()
-    
-    # Replace module name in Makefile
-    updated_makefile = makefile_content.replace("MODULE_NAME := src", f"MODULE_NAME := {project_module_name}")
-    
-    with open(makefile_path, "w") as f:
-        f.write(updated_makefile)
-    
-    # Always update pyproject.toml to point to the new module directory
-    print(f"📦 Updating pyproject.toml for module: {project_module_name}")
-    pyproject_path = Path("pyproject.toml")
-    with open(pyproject_path, "rb") as f:
-        config = tomli.load(f)
-    
-    # Update packages from src to new module name
-    if "tool" in config and "hatch" in config["tool"] and "build" in config["tool"]["hatch"] and "targets" in config["tool"]["hatch"]["build"] and "wheel" in config["tool"]["hatch"]["build"]["targets"]:
-        config["tool"]["hatch"]["build"]["targets"]["wheel"]["packages"] = [project_module_name]
-    
-    # Update ruff known-first-party if ruff config exists
-    if "tool" in config and "ruff" in config["tool"] and "lint" in config["tool"]["ruff"] and "isort" in config["tool"]["ruff"]["lint"]:
-        config["tool"]["ruff"]["lint"]["isort"]["known-first-party"] = [project_module_name]
-    
-    with open(pyproject_path, "wb") as f:
-        tomli_w.dump(config, f)
-    
-    # Create the new module directory if it doesn't exist
-    if not os.path.exists(project_module_name):
-        print(f"📁 Creating module directory: {project_module_name}")
-        os.mkdir(project_module_name)
-        # Create __init__.py
-        with open(f"{project_module_name}/__init__.py", "w") as f:
-            f.write(f'"""Main package for {project_name}."""\n')
-    
-    # Copy src content to new module directory if src exists
-    if os.path.exists("src") and project_module_name != "src":
-        print(f"📦 Copying content from src to {project_module_name}...")
-        for item in os.listdir("src"):
-            src_path = os.path.join("src", item)
-            dest_path = os.path.join(project_module_name, item)
-            
-            if os.path.isfile(src_path):
-                with open(src_path, "r") as src_file:
-                    content = src_file.read()
-                with open(dest_path, "w") as dest_file:
-                    dest_file.write(content)
-        
-        # Remove the old src directory after copying
-        print("🗑️ Removing old src directory...")
-        run_command("rm -rf src")
-    
-    if code_choice == "2":
-        print("📝 Creating minimal placeholder test...")
-        # Create minimal module
-        with open(f"{project_module_name}/example.py", "w") as f:
-            f.write("""def add(a: int, b: int) -> int:
-    \"\"\"Add two numbers.\"\"\"
-    return a + b
-""")
-        
-        # Create minimal test
-        with open("tests/test_example.py", "w") as f:
-            f.write(f"""from {project_module_name}.example import add
-
-def test_add():
-    assert add(1, 2) == 3
-""")
-    elif code_choice == "3":
-        print("🧹 Removing all example code...")
-        run_command("make clean-example")
-        # Create __init__.py in tests
-        with open("tests/__init__.py", "w") as f:
-            f.write("")
-    else:
-        print("📚 Updating example code imports for new module name...")
-        # Update example.py to use new module name
-        if os.path.exists("src/example.py"):
-            with open("src/example.py", "r") as f:
-                example_content = f.read()
-            # Save it to new module directory
-            with open(f"{project_module_name}/example.py", "w") as f:
-                f.write(example_content)
-        
-        # Update test imports 
-        if os.path.exists("tests/test_example.py"):
-            with open("tests/test_example.py", "r") as f:
-                test_content = f.read()
-            updated_test = test_content.replace("from src.", f"from {project_module_name}.")
-            with open("tests/test_example.py", "w") as f:
-                f.write(updated_test)
-
-    # Documentation setup
+    config.example_code = EXAMPLE_CODE_CHOICES.get(choice, "keep")
     docs_choice = prompt_with_default(
         "\nWould you like to set up documentation with MkDocs?\n"
         "This includes:\n"
@@ -275,68 +523,10 @@ def test_add():
         "- Auto-generated API documentation\n"
         "- GitHub Pages deployment\n"
         "- Local development server\n"
-        "\nSet up documentation? (Y/n)", "y"
+        "\nSet up documentation? (Y/n)",
+        "y",
     )
-    
-    docs_enabled = docs_choice.lower() in ('y', 'yes', '')
-    if docs_enabled:
-        # Extract GitHub username from git config or use placeholder
-        try:
-            github_url = subprocess.check_output(["git", "config", "remote.origin.url"], text=True).strip()
-            if "github.com" in github_url:
-                # Extract username from GitHub URL
-                if github_url.startswith("git@github.com:"):
-                    github_username = github_url.split(":")[1].split("/")[0]
-                elif github_url.startswith("https://github.com/"):
-                    github_username = github_url.split("/")[3]
-                else:
-                    github_username = "your-username"
-            else:
-                github_username = "your-username"
-        except (subprocess.CalledProcessError, IndexError):
-            github_username = "your-username"
-        
-        setup_documentation(
-            project_name,
-            project_description,
-            author_name,
-            author_email,
-            project_module_name,
-            github_username
-        )
-    else:
-        print("⏩ Skipping documentation setup")
-
-    # Get current directory name and handle renaming
-    current_dir = os.path.basename(os.getcwd())
-    if current_dir == "python-collab-template" or current_dir == "python-project-test":
-        parent_dir = os.path.dirname(os.getcwd())
-        new_dir = os.path.join(parent_dir, project_name)
-        print(f"📁 Renaming project directory to {project_name}...")
-        if os.path.exists(new_dir):
-            print(f"⚠️  Directory {project_name} already exists. Keeping current directory name.")
-        else:
-            # Update source code directory references in Makefile
-            makefile_path = Path("Makefile")
-            with open(makefile_path, "r") as f:
-                makefile_content = f.read()
-            
-            # Replace any hardcoded references to python-collab-template in the Makefile
-            updated_makefile = makefile_content.replace("python-collab-template", project_name)
-            
-            with open(makefile_path, "w") as f:
-                f.write(updated_makefile)
-                
-            # Now rename the directory
-            os.chdir(parent_dir)
-            os.rename(current_dir, project_name)
-            os.chdir(project_name)
-
-    # Install dependencies and set up environment
-    print("🔨 Setting up development environment...")
-    run_command("make setup")
-
-    # Configure pre-commit hooks
+    config.docs = docs_choice.lower() in ("y", "yes", "")
     precommit_choice = prompt_with_default(
         "\nWould you like to enable pre-commit hooks?\n"
         "These hooks run automatically before each commit to ensure code quality:\n"
@@ -344,46 +534,142 @@ def test_add():
         "- Linting (ruff)\n"
         "- Formatting (ruff)\n"
         "- Tests (pytest)\n"
-        "\nEnable pre-commit hooks? (y/n)", "y"
+        "\nEnable pre-commit hooks? (y/n)",
+        "y",
     )
-    
-    # Initialize new git repository
-    print("🔄 Initializing git repository...")
-    if os.path.exists(".git"):
-        run_command("rm -rf .git")
-    run_command("git init")
-    
-    if precommit_choice.lower() in ('y', 'yes'):
-        print("🔧 Setting up pre-commit hooks...")
-        run_command("uv run pre-commit install")
-    else:
-        print("⏩ Skipping pre-commit hooks setup")
+    config.precommit = precommit_choice.lower() in ("y", "yes")
+    return config
 
-    # Initial commit without running pre-commit hooks
-    run_command("git add .")
-    run_command('git commit -m "feat: Initial project setup" --no-verify')
 
+def rename_template_dir(root: Path, project_name: str, log: Log) -> Path:
+    """Rename a fresh template checkout after the project, if possible."""
+    if root.name not in TEMPLATE_DIR_NAMES:
+        return root
+    target = root.parent / project_name
+    log(f"📁 Renaming project directory to {project_name}...")
+    if target.exists():
+        log(
+            f"⚠️  Directory {project_name} already exists. "
+            "Keeping current directory name."
+        )
+        return root
+    root.rename(target)
+    os.chdir(target)
+    return target
+
+
+def print_next_steps(config: ProjectConfig) -> None:
     print("✨ Project initialized successfully!")
     next_steps = [
         "1. Update README.md with your project details",
-        "2. Review and update CHANGELOG.md", 
-        f"3. Start adding your code in {project_module_name}/",
-        "4. Run 'make check' to verify everything works"
+        "2. Review and update CHANGELOG.md",
+        f"3. Start adding your code in {config.module_name}/",
+        "4. Run 'make check' to verify everything works",
     ]
-    
-    if docs_enabled:
-        next_steps.extend([
-            "5. Serve documentation locally: 'make docs-serve'",
-            "6. Update docs content in docs/ directory",
-            "7. Enable GitHub Pages in repository settings for automatic deployment"
-        ])
-    
+    if config.docs:
+        next_steps.extend(
+            [
+                "5. Serve documentation locally: 'make docs-serve'",
+                "6. Update docs content in docs/ directory",
+                "7. Enable GitHub Pages in repository settings for automatic "
+                "deployment",
+            ]
+        )
     print("\nNext steps:")
     for step in next_steps:
         print(step)
-    
     print("\nHappy coding! 🎉")
 
 
+def parse_args(argv: list[str]) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--config", type=Path, help="TOML file of ProjectConfig keys")
+    parser.add_argument(
+        "--batch", type=Path, help="TOML file listing many projects to create"
+    )
+    parser.add_argument(
+        "--jobs", type=int, help="Projects initialized in parallel in batch mode"
+    )
+    parser.add_argument(
+        "-y",
+        "--non-interactive",
+        action="store_true",
+        help="Use flags, config file and defaults without prompting",
+    )
+    parser.add_argument("--name", dest="project_name")
+    parser.add_argument("--description", dest="project_description")
+    parser.add_argument("--author-name")
+    parser.add_argument("--author-email")
+    parser.add_argument("--github-username")
+    parser.add_argument(
+        "--example-code", choices=["keep", "minimal", "remove"], default=None
+    )
+    for flag, help_text in [
+        ("docs", "MkDocs documentation"),
+        ("precommit", "pre-commit hooks"),
+        ("setup", "running `make setup`"),
+        ("git", "creating a fresh git repository and initial commit"),
+    ]:
+        parser.add_argument(
+            f"--{flag}",
+            action=argparse.BooleanOptionalAction,
+            default=None,
+            help=f"Enable or disable {help_text}",
+        )
+    return parser.parse_args(argv)
+
+
+_FLAG_FIELDS = (
+    "project_name",
+    "project_description",
+    "author_name",
+    "author_email",
+    "github_username",
+    "example_code",
+    "docs",
+    "precommit",
+    "setup",
+    "git",
+)
+
+
+def main(argv: Optional[list[str]] = None) -> int:
+    args = parse_args(sys.argv[1:] if argv is None else argv)
+    try:
+        if args.batch is not None:
+            projects = load_batch(args.batch)
+            print(f"🚀 Initializing {len(projects)} projects...")
+            results = initialize_batch(projects, args.jobs)
+            failures = [r for r in results if isinstance(r, Exception)]
+            for (path, _), result in zip(projects, results):
+                status = f"❌ {result}" if isinstance(result, Exception) else "✅"
+                print(f"{status} {path}")
+            return 1 if failures else 0
+
+        values = load_toml(args.config) if args.config is not None else {}
+        values.update(
+            {
+                name: getattr(args, name)
+                for name in _FLAG_FIELDS
+                if getattr(args, name) is not None
+            }
+        )
+        config = ProjectConfig.from_mapping(values)
+        print("🚀 Initializing new Python project...")
+        interactive = not (args.non_interactive or args.config or values)
+        if interactive:
+            interactive_config(config)
+
+        root = Path.cwd()
+        config.with_git_defaults(root)
+        root = rename_template_dir(root, config.project_name, print)
+        initialize(root, config)
+    except ScaffoldError as e:
+        print(f"❌ {e}")
+        return 1
+    print_next_steps(config)
+    return 0
+
+
 if __name__ == "__main__":
-    main()
+    sys.exit(main())
@@ -0,0 +1,7 @@
+"""Allow ``python -m src`` to run the moving-average CLI."""
+
+import sys
+
+from .cli import main
+
+sys.exit(main())
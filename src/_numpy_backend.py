@@ -0,0 +1,143 @@
+"""Optional NumPy kernels, installed with the ``fast`` extra.
+
+NumPy is imported lazily so that importing the package stays cheap when
+the backend is never selected.
+
+Windows are evaluated block by block from a local cumulative sum; blocks
+are aligned to the same absolute ``anchor_interval`` boundaries as the
+pure-Python engine, so any aligned sub-range reproduces the full pass
+exactly. The absolute error of each mean is bounded by roughly
+``2 * anchor_interval(window_size) * 2**-52 * max(abs(x))``.
+"""
+
+import importlib.util
+from collections.abc import Sequence
+from functools import cache
+from typing import Any, Optional
+
+from ._sliding import anchor_interval
+
+
+@cache
+def available() -> bool:
+    """Return whether NumPy can be imported."""
+    return importlib.util.find_spec("numpy") is not None
+
+
+def as_array(values: Sequence[float]) -> Any:
+    """Return ``values`` as a float64 array, without copying buffers."""
+    import numpy as np
+
+    return np.asarray(values, dtype=np.float64)
+
+
+def _block_means(
+    np: Any,
+    segment: Any,
+    lo: int,
+    start: int,
+    stop: int,
+    w: int,
+    min_periods: Optional[int] = None,
+) -> Any:
+    """Means for absolute indices ``[start, stop)`` given ``segment = x[lo:stop]``.
+
+    With ``min_periods`` set, NaN values are skipped and windows with fewer
+    than ``min_periods`` other values are NaN.
+    """
+    idx = np.arange(start, stop)
+    upper = idx + 1 - lo
+    lower = np.maximum(idx - w + 1, 0) - lo
+    counts = np.minimum(idx + 1, w)
+
+    def window_count(mask: Any) -> Any:
+        c = np.zeros(len(segment) + 1, dtype=np.int64)
+        np.cumsum(mask, out=c[1:])
+        return c[upper] - c[lower]
+
+    finite = np.isfinite(segment)
+    if finite.all():
+        cs = np.zeros(len(segment) + 1)
+        np.cumsum(segment, out=cs[1:])
+        means = (cs[upper] - cs[lower]) / counts
+        if min_periods is None:
+            return means
+        return np.where(counts < min_periods, np.nan, means)
+
+    # Keep inf/nan out of the cumulative sum and reproduce Python's
+    # ``sum(window)`` semantics for windows that contain them.
+    cs = np.zeros(len(segment) + 1)
+    np.cumsum(np.where(finite, segment, 0.0), out=cs[1:])
+    nans = window_count(np.isnan(segment))
+    if min_periods is not None:
+        counts = counts - nans
+    with np.errstate(invalid="ignore", divide="ignore"):
+        means = (cs[upper] - cs[lower]) / counts
+
+    pos = window_count(segment == np.inf)
+    neg = window_count(segment == -np.inf)
+    means = np.where(pos > 0, np.inf, means)
+    means = np.where(neg > 0, -np.inf, means)
+    invalid = (pos > 0) & (neg > 0)
+    if min_periods is None:
+        invalid |= nans > 0
+    else:
+        invalid |= counts < min_periods
+    return np.where(invalid, np.nan, means)
+
+
+def _sliding_means(
+    values: Sequence[float],
+    window_size: int,
+    start: int,
+    stop: Optional[int],
+    min_periods: Optional[int],
+) -> list[float]:
+    import numpy as np
+
+    n = len(values) if stop is None else stop
+    if n <= start:
+        return []
+    base = max(0, start - window_size + 1)
+    x = as_array(values[base:n])
+    interval = anchor_interval(window_size)
+    out = np.empty(n - start)
+
+    block_start = start
+    while block_start < n:
+        block_stop = min((block_start // interval + 1) * interval, n)
+        lo = max(0, block_start - window_size + 1)
+        out[block_start - start : block_stop - start] = _block_means(
+            np,
+            x[lo - base : block_stop - base],
+            lo,
+            block_start,
+            block_stop,
+            window_size,
+            min_periods,
+        )
+        block_start = block_stop
+
+    return out.tolist()
+
+
+def sliding_mean(
+    values: Sequence[float],
+    window_size: int,
+    start: int = 0,
+    stop: Optional[int] = None,
+) -> list[float]:
+    """NumPy counterpart of :func:`src._sliding.sliding_mean`."""
+    return _sliding_means(values, window_size, start, stop, None)
+
+
+def sliding_nanmean(
+    values: Sequence[float],
+    window_size: int,
+    start: int = 0,
+    stop: Optional[int] = None,
+    *,
+    min_periods: int = 1,
+) -> list[float]:
+    """NumPy counterpart of :func:`src._sliding.sliding_nanmean`."""
+    return _sliding_means(values, window_size, start, stop, min_periods)
@@ -0,0 +1,148 @@
+"""asyncio adapters over the incremental moving-average engine.
+
+Points are read from the source by a background task into a bounded
+``asyncio.Queue``, so a slow consumer applies backpressure to the source
+instead of buffering without limit. The consumer drains whatever is
+queued, up to ``batch_size`` points, and updates one
+:class:`~src.streaming.MovingAverage` per batch: under a high message rate
+batches fill up and per-point overhead is amortized, while a trickle of
+points is still averaged one at a time with no added latency.
+
+Large batches can be handed to a thread or process executor so the event
+loop stays responsive; results are identical either way.
+"""
+
+import asyncio
+from collections.abc import AsyncIterable, AsyncIterator
+from concurrent.futures import Executor
+from typing import Any, Optional
+
+from .example import DataPoint
+from .streaming import MovingAverage
+
+DEFAULT_BATCH_SIZE = 256
+DEFAULT_QUEUE_SIZE = 1024
+
+# Marks the end of the source in the queue.
+_DONE = object()
+
+
+class _SourceError:
+    """Carries an exception raised by the source through the queue."""
+
+    def __init__(self, error: BaseException) -> None:
+        self.error = error
+
+
+def _extend(
+    accumulator: MovingAverage, values: list[float]
+) -> tuple[MovingAverage, list[float]]:
+    """Executor entry point; returns the accumulator for process executors."""
+    return accumulator, accumulator.extend(values)
+
+
+async def _pump(source: AsyncIterable[DataPoint], queue: asyncio.Queue) -> None:
+    try:
+        async for point in source:
+            await queue.put(point.value)
+    except Exception as error:
+        await queue.put(_SourceError(error))
+    else:
+        await queue.put(_DONE)
+
+
+async def amoving_average_batches(
+    source: AsyncIterable[DataPoint],
+    window_size: int = 3,
+    *,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    queue_size: int = DEFAULT_QUEUE_SIZE,
+    executor: Optional[Executor] = None,
+    offload_size: Optional[int] = None,
+) -> AsyncIterator[list[float]]:
+    """Yield moving averages of an async source one micro-batch at a time.
+
+    Args:
+        source: Async iterable of DataPoint objects
+        window_size: Size of moving window
+        batch_size: Most points averaged per batch
+        queue_size: Points buffered ahead of the consumer before the source
+            is paused
+        executor: Thread or process pool for large batches
+        offload_size: Batches at least this long run in ``executor``,
+            defaults to ``batch_size``
+
+    Yields:
+        Lists of moving averages, in input order
+
+    Raises:
+        ValueError: If a size argument is not positive
+    """
+    if batch_size < 1:
+        raise ValueError(f"batch_size must be at least 1, got {batch_size}")
+    if queue_size < 1:
+        raise ValueError(f"queue_size must be at least 1, got {queue_size}")
+    accumulator = MovingAverage(window_size)
+    offload_size = batch_size if offload_size is None else offload_size
+
+    queue: asyncio.Queue[Any] = asyncio.Queue(queue_size)
+    loop = asyncio.get_running_loop()
+    pump = loop.create_task(_pump(source, queue))
+    try:
+        done = False
+        while not done:
+            batch = [await queue.get()]
+            while len(batch) < batch_size and not queue.empty():
+                batch.append(queue.get_nowait())
+
+            end = batch[-1]
+            if end is _DONE or isinstance(end, _SourceError):
+                batch.pop()
+                done = True
+            if batch:
+                if executor is not None and len(batch) >= offload_size:
+                    accumulator, means = await loop.run_in_executor(
+                        executor, _extend, accumulator, batch
+                    )
+                else:
+                    means = accumulator.extend(batch)
+                yield means
+            if isinstance(end, _SourceError):
+                raise end.error
+    finally:
+        pump.cancel()
+        try:
+            await pump
+        except asyncio.CancelledError:
+            pass
+
+
+async def amoving_average(
+    source: AsyncIterable[DataPoint],
+    window_size: int = 3,
+    *,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    queue_size: int = DEFAULT_QUEUE_SIZE,
+    executor: Optional[Executor] = None,
+    offload_size: Optional[int] = None,
+) -> AsyncIterator[float]:
+    """Yield the moving average after each point of an async source.
+
+    Produces the same values as ``calculate_moving_average`` on the
+    collected points. Arguments are as for :func:`amoving_average_batches`.
+
+    Example::
+
+        async for average in amoving_average(ticks(), window_size=20):
+            publish(average)
+    """
+    async for means in amoving_average_batches(
+        source,
+        window_size,
+        batch_size=batch_size,
+        queue_size=queue_size,
+        executor=executor,
+        offload_size=offload_size,
+    ):
+        for mean in means:
+            yield mean
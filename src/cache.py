@@ -0,0 +1,192 @@
+"""Memoized moving averages for series that are recomputed repeatedly.
+
+:class:`MovingAverageCache` keeps results per (series key, window size)
+in an LRU bounded by memory. When a series has only been appended to since
+it was cached, the result is extended instead of recomputed: the kernels
+re-anchor at absolute multiples of ``anchor_interval(window_size)``, so
+recomputing from the last anchor boundary reproduces the full pass
+exactly, at a cost of at most one anchor interval plus the new points.
+"""
+
+from array import array
+from collections import OrderedDict
+from collections.abc import Hashable, Sequence
+from dataclasses import dataclass
+from typing import Any, Optional
+
+from ._sliding import anchor_interval
+from .example import (
+    _KERNELS,
+    SeriesLike,
+    _extract_values,
+    _run,
+    _select_backend,
+)
+from .series import DataPointSeries
+
+DEFAULT_MAX_BYTES = 64 * 2**20
+
+
+@dataclass
+class CacheStats:
+    """Counters for sizing a :class:`MovingAverageCache`."""
+
+    hits: int = 0
+    misses: int = 0
+    extends: int = 0
+    evictions: int = 0
+
+
+@dataclass
+class _Entry:
+    version: Any
+    backend: str
+    tail: bytes
+    result: array
+
+    @property
+    def nbytes(self) -> int:
+        return len(self.result) * self.result.itemsize + len(self.tail)
+
+
+def _tail(values: Sequence[float], stop: int, window_size: int) -> bytes:
+    """Raw bytes of the last window ending at ``stop``, NaN-safe to compare."""
+    return array("d", values[max(0, stop - window_size) : stop]).tobytes()
+
+
+class MovingAverageCache:
+    """LRU cache of moving averages bounded by result memory.
+
+    Args:
+        max_bytes: Upper bound on the bytes held by cached results
+
+    Attributes:
+        stats: Hit, miss, extend and eviction counters
+    """
+
+    def __init__(self, max_bytes: int = DEFAULT_MAX_BYTES) -> None:
+        if max_bytes < 0:
+            raise ValueError(f"max_bytes must not be negative, got {max_bytes}")
+        self.max_bytes = max_bytes
+        self.stats = CacheStats()
+        self._entries: OrderedDict[tuple[Hashable, int], _Entry] = OrderedDict()
+        self._nbytes = 0
+
+    @property
+    def nbytes(self) -> int:
+        """Bytes currently held by cached results."""
+        return self._nbytes
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def moving_average(
+        self,
+        data: SeriesLike,
+        window_size: int = 3,
+        *,
+        key: Optional[Hashable] = None,
+        version: Any = None,
+        backend: str = "auto",
+    ) -> list[float]:
+        """Return ``calculate_moving_average(data, window_size)``, memoized.
+
+        A cached result is reused when the series has the same length, and
+        extended when it has grown and its previously last window is
+        unchanged. Anything else, including a different ``version`` or a
+        shorter series, recomputes from scratch.
+
+        Args:
+            data: DataPoint objects or a columnar DataPointSeries
+            window_size: Number of points per window
+            key: Identity of the series, defaults to ``id(data)``; pass a
+                stable key when the series is rebuilt between calls
+            version: Changes whenever the series is modified other than by
+                appending; edits outside the last window are not detected
+                otherwise
+            backend: As for ``calculate_moving_average``
+
+        Returns:
+            List of moving averages
+
+        Raises:
+            ValueError: If ``window_size`` is not a positive integer or
+                ``backend`` is unknown
+        """
+        if isinstance(window_size, bool) or not isinstance(window_size, int):
+            raise ValueError(f"window_size must be an integer, got {window_size!r}")
+        if window_size < 1:
+            raise ValueError(f"window_size must be at least 1, got {window_size}")
+
+        values = _extract_values(data)
+        n = len(values)
+        kernel = _select_backend(backend, n, columnar=isinstance(data, DataPointSeries))
+        cache_key = (id(data) if key is None else key, window_size)
+        entry = self._entries.get(cache_key)
+
+        if entry is not None and self._reusable(entry, values, version, kernel):
+            old = len(entry.result)
+            if n == old:
+                self.stats.hits += 1
+                self._entries.move_to_end(cache_key)
+                return entry.result.tolist()
+            self.stats.extends += 1
+            start = old // anchor_interval(window_size) * anchor_interval(window_size)
+            tail = _run(
+                kernel,
+                n - start,
+                window_size,
+                lambda: _KERNELS[kernel](values, window_size, start, n),
+            )
+            result = entry.result[:start]
+            result.fromlist(tail)
+        else:
+            self.stats.misses += 1
+            result = array(
+                "d",
+                _run(
+                    kernel,
+                    n,
+                    window_size,
+                    lambda: _KERNELS[kernel](values, window_size),
+                ),
+            )
+
+        self._store(
+            cache_key,
+            _Entry(version, kernel, _tail(values, n, window_size), result),
+        )
+        return result.tolist()
+
+    def _reusable(
+        self, entry: _Entry, values: Sequence[float], version: Any, kernel: str
+    ) -> bool:
+        old = len(entry.result)
+        if entry.version != version or entry.backend != kernel or len(values) < old:
+            return False
+        window = len(entry.tail) // array("d").itemsize
+        return _tail(values, old, window) == entry.tail
+
+    def _store(self, cache_key: tuple[Hashable, int], entry: _Entry) -> None:
+        previous = self._entries.pop(cache_key, None)
+        if previous is not None:
+            self._nbytes -= previous.nbytes
+        if entry.nbytes > self.max_bytes:
+            return
+        self._entries[cache_key] = entry
+        self._nbytes += entry.nbytes
+        while self._nbytes > self.max_bytes:
+            _, evicted = self._entries.popitem(last=False)
+            self._nbytes -= evicted.nbytes
+            self.stats.evictions += 1
+
+    def invalidate(self, key: Hashable, window_size: Optional[int] = None) -> None:
+        """Drop cached results for ``key``, for one or every window size."""
+        for cache_key in [k for k in self._entries if k[0] == key]:
+            if window_size is None or cache_key[1] == window_size:
+                self._nbytes -= self._entries.pop(cache_key).nbytes
+
+    def clear(self) -> None:
+        """Drop every cached result; counters are kept."""
+        self._entries.clear()
+        self._nbytes = 0
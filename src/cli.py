@@ -0,0 +1,212 @@
+"""Command-line entry point streaming moving averages over CSV or JSONL.
+
+Input is read in columnar batches of ``--batch-size`` points and each batch
+is averaged as soon as it is read, continuing from the state left by the
+previous one, so memory stays bounded by the batch size and the results
+do not depend on it. Output
+is one ``timestamp,moving_average`` CSV row per input point, written with
+one bulk write per batch. Several inputs are treated as one continuous
+stream, in the order given.
+
+Usage::
+
+    moving-average --window 60 readings.csv > averages.csv
+    cat readings.jsonl | python -m src --format jsonl --window 5 --stats
+"""
+
+import argparse
+import os
+import sys
+import time
+from collections.abc import Iterator, Sequence
+from typing import IO, Any, Callable, Optional
+
+DEFAULT_BATCH_SIZE = 65_536
+
+FORMATS = ("csv", "jsonl")
+_JSONL_SUFFIXES = (".jsonl", ".ndjson")
+
+
+def parse_args(argv: Optional[Sequence[str]] = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        prog="moving-average",
+        description="Stream moving averages of CSV or JSON Lines data points.",
+    )
+    parser.add_argument(
+        "inputs",
+        nargs="*",
+        default=["-"],
+        help="Input files, '-' for stdin (default)",
+    )
+    parser.add_argument(
+        "-w", "--window", type=int, default=3, help="Window size in points"
+    )
+    parser.add_argument(
+        "-f",
+        "--format",
+        choices=FORMATS,
+        help="Input format, inferred from the file suffix (default: csv)",
+    )
+    parser.add_argument(
+        "-b",
+        "--backend",
+        choices=["auto", "python", "numpy"],
+        default="auto",
+        help="Averaging engine (default: auto)",
+    )
+    parser.add_argument(
+        "--batch-size",
+        type=int,
+        default=DEFAULT_BATCH_SIZE,
+        help=f"Points read and written per batch (default: {DEFAULT_BATCH_SIZE})",
+    )
+    parser.add_argument("--timestamp-field", default="timestamp")
+    parser.add_argument("--value-field", default="value")
+    parser.add_argument(
+        "--epoch-unit",
+        choices=["s", "ms", "us", "ns"],
+        default="s",
+        help="Unit of numeric timestamps (default: s)",
+    )
+    parser.add_argument(
+        "--stats",
+        action="store_true",
+        help="Print points/s and peak memory to stderr when done",
+    )
+    args = parser.parse_args(argv)
+    if args.window < 1:
+        parser.error(f"--window must be at least 1, got {args.window}")
+    if args.batch_size < 1:
+        parser.error(f"--batch-size must be at least 1, got {args.batch_size}")
+    return args
+
+
+def _input_format(path: str, requested: Optional[str]) -> str:
+    if requested is not None:
+        return requested
+    return "jsonl" if path.lower().endswith(_JSONL_SUFFIXES) else "csv"
+
+
+def _batches(args: argparse.Namespace) -> Iterator[Any]:
+    """Yield DataPointSeries batches from every input in turn."""
+    from .ingest import read_csv_series, read_jsonl_series
+
+    readers = {"csv": read_csv_series, "jsonl": read_jsonl_series}
+    for path in args.inputs:
+        read = readers[_input_format(path, args.format)]
+        source = sys.stdin if path == "-" else path
+        yield from read(
+            source,
+            args.batch_size,
+            timestamp_field=args.timestamp_field,
+            value_field=args.value_field,
+            label_field=None,
+            epoch_unit=args.epoch_unit,
+        )
+
+
+def _stream_means(kernel: str, window: int) -> Callable[[Sequence[float]], list[float]]:
+    """Return a function averaging each batch as a continuation of the last.
+
+    The means match ``calculate_moving_average`` over all input at once,
+    whatever the batch size. The Python engine keeps its running sum in a
+    :class:`~src.streaming.MovingAverage`. The NumPy engine is re-run from
+    the last anchor boundary, which sits at an absolute index, so fewer
+    than ``anchor_interval(window)`` earlier points are evaluated again.
+    """
+    if kernel == "python":
+        from .streaming import MovingAverage
+
+        return MovingAverage(window).extend
+
+    from ._sliding import anchor_interval
+    from .example import _KERNELS
+
+    compute = _KERNELS[kernel]
+    interval = anchor_interval(window)
+    kept: list[float] = []
+    base = 0  # index of kept[0] in the whole input, a multiple of interval
+
+    def means(values: Sequence[float]) -> list[float]:
+        nonlocal base
+        offset = base + len(kept)
+        kept.extend(values)
+        anchor = offset - offset % interval
+        result = compute(kept, window, anchor - base)[offset - anchor :]
+        # The next batch restarts at or after the last boundary; keep one
+        # interval before it so its first windows are complete.
+        end = base + len(kept)
+        start = max(0, end - end % interval - interval)
+        del kept[: start - base]
+        base = start
+        return result
+
+    return means
+
+
+def run(args: argparse.Namespace, out: IO[str]) -> int:
+    """Stream every input to ``out`` and return the number of points."""
+    from .example import _select_backend
+    from .series import ns_to_datetime
+
+    kernel = _select_backend(args.backend, args.batch_size, columnar=True)
+    means_of = _stream_means(kernel, args.window)
+    points = 0
+
+    out.write("timestamp,moving_average\n")
+    for batch in _batches(args):
+        means = means_of(batch.values.tolist())
+        tz = batch.tz
+        out.write(
+            "".join(
+                f"{ns_to_datetime(ns, tz).isoformat()},{mean!r}\n"
+                for ns, mean in zip(batch.timestamps, means)
+            )
+        )
+        points += len(batch)
+    return points
+
+
+def _peak_rss_bytes() -> Optional[int]:
+    try:
+        import resource
+    except ImportError:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports KiB, macOS bytes.
+    return peak if sys.platform == "darwin" else peak * 1024
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    args = parse_args(argv)
+    began = time.perf_counter()
+    try:
+        points = run(args, sys.stdout)
+        sys.stdout.flush()
+    except BrokenPipeError:
+        # Downstream closed early (e.g. ``| head``): stop quietly, and point
+        # stdout at devnull so the interpreter's final flush cannot fail.
+        os.dup2(os.open(os.devnull, os.O_WRONLY), sys.stdout.fileno())
+        return 0
+    except KeyError as error:
+        print(f"moving-average: error: missing field {error}", file=sys.stderr)
+        return 1
+    except (OSError, ValueError) as error:
+        print(f"moving-average: error: {error}", file=sys.stderr)
+        return 1
+
+    if args.stats:
+        seconds = time.perf_counter() - began
+        rate = points / seconds if seconds else float("inf")
+        peak = _peak_rss_bytes()
+        memory = "n/a" if peak is None else f"{peak / 2**20:.1f} MiB"
+        print(
+            f"{points} points in {seconds:.3f}s "
+            f"({rate:,.0f} points/s), peak RSS {memory}",
+            file=sys.stderr,
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
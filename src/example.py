@@ -1,10 +1,18 @@
-import statistics
+import sys
+from collections.abc import Iterable, Sequence
 from dataclasses import dataclass
-from datetime import datetime
-from typing import Optional
+from datetime import datetime, timedelta
+from functools import partial
+from typing import Any, Callable, Optional, Union
 
+from . import _numpy_backend, _sliding, instrumentation
+from .series import DataPointSeries, timedelta_to_ns
 
-@dataclass
+# Slots cut per-instance memory for callers that keep large lists of points.
+_DATACLASS_OPTIONS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+
+@dataclass(**_DATACLASS_OPTIONS)
 class DataPoint:
     """Example data structure for time series data."""
 
@@ -13,23 +21,269 @@ class DataPoint:
     label: Optional[str] = None
 
 
+SeriesLike = Union[Iterable[DataPoint], DataPointSeries]
+
+BACKENDS = ("auto", "python", "numpy")
+
+# Inputs at least this long use NumPy under ``backend="auto"``.
+NUMPY_THRESHOLD = 10_000
+
+_KERNELS = {
+    "python": _sliding.sliding_mean,
+    "numpy": _numpy_backend.sliding_mean,
+}
+
+# NaN-skipping kernels, used when ``skipna=True``.
+_NAN_KERNELS = {
+    "python": _sliding.sliding_nanmean,
+    "numpy": _numpy_backend.sliding_nanmean,
+}
+
+# How runs of identical timestamps are collapsed by ``dedupe``.
+DEDUPE_KEEP = ("first", "last", "mean")
+
+
+def _extract_values(data: SeriesLike) -> Sequence[float]:
+    """Return the values of ``data`` as an indexable float sequence."""
+    if isinstance(data, DataPointSeries):
+        return data.values
+    return [d.value for d in data]
+
+
+def _dedupe(
+    pairs: Iterable[tuple[Any, float]], keep: str
+) -> tuple[list[Any], list[float]]:
+    """Collapse runs of identical timestamps into one value per timestamp."""
+    if keep not in DEDUPE_KEEP:
+        raise ValueError(f"dedupe must be one of {DEDUPE_KEEP}, got {keep!r}")
+    timestamps: list[Any] = []
+    values: list[float] = []
+    previous: Any = None
+    total = 0.0
+    repeats = 0
+    for t, x in pairs:
+        if not timestamps or t != previous:
+            timestamps.append(t)
+            values.append(x)
+            previous = t
+            total, repeats = x, 1
+        elif keep == "last":
+            values[-1] = x
+        elif keep == "mean":
+            total += x
+            repeats += 1
+            values[-1] = total / repeats
+    return timestamps, values
+
+
+def _extract_timed(
+    data: SeriesLike, window: timedelta, sort: bool
+) -> tuple[Sequence[Any], Sequence[float], Any]:
+    """Return timestamps, values and window in matching units.
+
+    Columnar inputs keep their epoch-nanosecond column; DataPoint inputs are
+    read in a single pass and compared as datetimes.
+    """
+    if isinstance(data, DataPointSeries):
+        timestamps: Sequence[Any] = data.timestamps
+        values: Sequence[float] = data.values
+        span: Any = timedelta_to_ns(window)
+    else:
+        timestamps, values = [], []
+        for d in data:
+            timestamps.append(d.timestamp)
+            values.append(d.value)
+        span = window
+
+    if sort and any(b < a for a, b in zip(timestamps, timestamps[1:])):
+        order = sorted(range(len(values)), key=lambda i: timestamps[i])
+        timestamps = [timestamps[i] for i in order]
+        values = [values[i] for i in order]
+    return timestamps, values, span
+
+
+def _select_backend(backend: str, size: int, columnar: bool = False) -> str:
+    """Resolve ``backend`` to a concrete kernel name."""
+    if backend not in BACKENDS:
+        raise ValueError(f"backend must be one of {BACKENDS}, got {backend!r}")
+    if backend == "auto":
+        if _numpy_backend.available() and (columnar or size >= NUMPY_THRESHOLD):
+            return "numpy"
+        return "python"
+    if backend == "numpy" and not _numpy_backend.available():
+        raise ImportError(
+            "the numpy backend requires numpy; "
+            "install it with `pip install python-collab-template[fast]`"
+        )
+    return backend
+
+
+def _run(
+    backend: str, points: int, window_size: Any, compute: Callable[[], list[float]]
+) -> list[float]:
+    """Call ``compute``, recording it when instrumentation is enabled."""
+    if instrumentation.enabled():
+        return instrumentation.record_call(
+            "calculate_moving_average", points, window_size, backend, compute
+        )
+    return compute()
+
+
 def calculate_moving_average(
-    data: list[DataPoint], window_size: int = 3
+    data: SeriesLike,
+    window_size: Union[int, timedelta] = 3,
+    *,
+    backend: str = "auto",
+    sort: bool = False,
+    workers: Optional[int] = None,
+    skipna: bool = False,
+    min_periods: Optional[int] = None,
+    dedupe: Optional[str] = None,
 ) -> list[float]:
     """Calculate moving average of values.
 
+    The first ``window_size - 1`` results average over the points seen so
+    far. Windows are summed in O(n) with compensated running sums; results
+    match ``statistics.mean`` over each window to within a few units in the
+    last place. The NumPy backend evaluates the same windows from blocked
+    cumulative sums and agrees with the Python engine to within about
+    ``1e-11 * max(abs(value))`` for windows of up to 10,000 points.
+
+    A ``timedelta`` window averages each point with the points whose
+    timestamps fall in ``(timestamp - window, timestamp]``, which suits
+    irregularly sampled data. Input must then be sorted by timestamp; this
+    is verified during the O(n) sweep.
+
     Args:
-        data: List of DataPoint objects
-        window_size: Size of moving window
+        data: DataPoint objects or a columnar DataPointSeries
+        window_size: Number of points per window, or a ``timedelta`` for
+            time-based windows
+        backend: ``"python"``, ``"numpy"`` or ``"auto"``, which picks NumPy
+            when it is installed and the input is columnar or at least
+            ``NUMPY_THRESHOLD`` points long. Time-based windows always use
+            the Python engine.
+        sort: Sort time-windowed input by timestamp instead of raising when
+            it is out of order; results then follow the sorted order
+        workers: Split count-based windows across this many processes,
+            sharing the values through shared memory. The output is
+            identical to the sequential result
+        skipna: Average only the non-NaN values of each count-based window
+            instead of propagating NaN
+        min_periods: With ``skipna``, windows with fewer non-NaN values
+            than this produce NaN; defaults to 1
+        dedupe: Collapse consecutive points with identical timestamps,
+            keeping the ``"first"``, ``"last"`` or ``"mean"`` value, while
+            values are extracted; results then have one entry per distinct
+            timestamp
 
     Returns:
         List of moving averages
+
+    Raises:
+        ValueError: If ``window_size`` is not positive, ``backend`` is unknown,
+            a time-windowed input is unsorted and ``sort`` is False, or the
+            NaN and dedupe options are invalid or combined with an
+            unsupported mode
+        ImportError: If ``backend="numpy"`` and NumPy is not installed
     """
-    values = [d.value for d in data]
-    result = []
+    if isinstance(window_size, timedelta):
+        if window_size <= timedelta(0):
+            raise ValueError(f"time window must be positive, got {window_size}")
+        if backend not in ("auto", "python"):
+            raise ValueError(
+                f"time-based windows require the python backend, got {backend!r}"
+            )
+        if workers is not None:
+            raise ValueError("time-based windows cannot be computed in parallel")
+        if skipna or min_periods is not None:
+            raise ValueError("skipna and min_periods require a count-based window")
+        timestamps, values, span = _extract_timed(data, window_size, sort)
+        if dedupe is not None:
+            timestamps, values = _dedupe(zip(timestamps, values), dedupe)
+        return _run(
+            "python",
+            len(values),
+            window_size,
+            partial(_sliding.sliding_mean_by_time, timestamps, values, span),
+        )
+
+    if window_size < 1:
+        raise ValueError(f"window_size must be at least 1, got {window_size}")
+    if min_periods is not None:
+        if not skipna:
+            raise ValueError("min_periods requires skipna=True")
+        if not 1 <= min_periods <= window_size:
+            raise ValueError(
+                f"min_periods must be between 1 and window_size, got {min_periods}"
+            )
+
+    if dedupe is None:
+        values = _extract_values(data)
+    elif isinstance(data, DataPointSeries):
+        values = _dedupe(zip(data.timestamps, data.values), dedupe)[1]
+    else:
+        values = _dedupe(((d.timestamp, d.value) for d in data), dedupe)[1]
+    columnar = isinstance(data, DataPointSeries)
+    kernel = _select_backend(backend, len(values), columnar)
+    if skipna:
+        if workers is not None and workers > 1:
+            raise ValueError("skipna cannot be computed in parallel")
+        compute = partial(
+            _NAN_KERNELS[kernel], values, window_size, min_periods=min_periods or 1
+        )
+    elif workers is not None and workers > 1:
+        from .parallel import parallel_moving_average
 
-    for i in range(len(values)):
-        window = values[max(0, i - window_size + 1) : i + 1]
-        result.append(statistics.mean(window))
+        compute = partial(
+            parallel_moving_average,
+            values,
+            window_size,
+            max_workers=workers,
+            backend=kernel,
+        )
+    else:
+        compute = partial(_KERNELS[kernel], values, window_size)
+    return _run(kernel, len(values), window_size, compute)
+
+
+def calculate_moving_averages(
+    data: SeriesLike,
+    windows: Iterable[int],
+    *,
+    backend: str = "auto",
+) -> dict[int, list[float]]:
+    """Calculate moving averages for several window sizes at once.
+
+    Values are extracted (and, for the NumPy backend, converted to an
+    array) once and shared by every window. Each result is identical to
+    ``calculate_moving_average(data, window)`` with the same backend.
+
+    Args:
+        data: DataPoint objects or a columnar DataPointSeries
+        windows: Window sizes, in points; duplicates are computed once
+        backend: As for :func:`calculate_moving_average`
+
+    Returns:
+        Mapping of window size to its list of moving averages, in the order
+        the windows were given
+
+    Raises:
+        ValueError: If a window size is not positive or ``backend`` is unknown
+        ImportError: If ``backend="numpy"`` and NumPy is not installed
+    """
+    sizes = list(dict.fromkeys(windows))
+    for window_size in sizes:
+        if window_size < 1:
+            raise ValueError(f"window_size must be at least 1, got {window_size}")
 
-    return result
+    values = _extract_values(data)
+    kernel = _select_backend(backend, len(values), isinstance(data, DataPointSeries))
+    if kernel == "numpy":
+        values = _numpy_backend.as_array(values)
+    compute = _KERNELS[kernel]
+    return {
+        window_size: _run(
+            kernel, len(values), window_size, partial(compute, values, window_size)
+        )
+        for window_size in sizes
+    }
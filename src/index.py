@@ -0,0 +1,192 @@
+"""Timestamp-indexed series answering range aggregates in O(log n).
+
+:class:`IndexedSeries` keeps timestamps sorted as epoch-nanoseconds next to
+prefix sums of the values, so the sum, count and mean over any time range
+take two ``bisect`` lookups and a subtraction. Each prefix sum carries its
+accumulated rounding error (Neumaier compensation), so a range sum is off
+by a few units in the last place of the prefix sums rather than by error
+accumulated along the series. Non-finite values are counted in a separate
+prefix array and ranges containing them fall back to summing the range.
+"""
+
+import math
+from array import array
+from bisect import bisect_left
+from collections.abc import Iterable, Sequence
+from datetime import datetime, tzinfo
+from typing import Optional, Union
+
+from .example import DataPoint, SeriesLike
+from .series import DataPointSeries, datetime_to_ns
+
+STATISTICS = ("sum", "count", "mean")
+
+Range = tuple[Optional[datetime], Optional[datetime]]
+
+
+class IndexedSeries:
+    """Sorted series with prefix sums for O(log n) range queries.
+
+    Ranges are half-open, ``[start, end)``; ``None`` leaves a side
+    unbounded. Unsorted input is sorted once on construction.
+
+    Args:
+        data: DataPoint objects or a columnar DataPointSeries
+    """
+
+    def __init__(self, data: Union[SeriesLike, Sequence[DataPoint]] = ()) -> None:
+        self._timestamps = array("q")
+        self._values = array("d")
+        self._sums = array("d", [0.0])
+        self._errors = array("d", [0.0])
+        self._nonfinite = array("q", [0])
+        self._aware: Optional[bool] = None
+        self.tz: Optional[tzinfo] = None
+
+        if isinstance(data, DataPointSeries):
+            timestamps: Sequence[int] = data.timestamps
+            values: Sequence[float] = data.values
+            if len(data):
+                self._aware = data.tz is not None
+                self.tz = data.tz
+        else:
+            timestamps, values = [], []
+            for point in data:
+                self._check_aware(point.timestamp)
+                timestamps.append(datetime_to_ns(point.timestamp))
+                values.append(point.value)
+
+        if any(b < a for a, b in zip(timestamps, timestamps[1:])):
+            order = sorted(range(len(values)), key=lambda i: timestamps[i])
+            timestamps = [timestamps[i] for i in order]
+            values = [values[i] for i in order]
+        self._timestamps.extend(timestamps)
+        self._values.extend(values)
+        self._extend_prefix(values)
+
+    def __len__(self) -> int:
+        return len(self._values)
+
+    def _check_aware(self, timestamp: datetime) -> None:
+        aware = timestamp.tzinfo is not None
+        if self._aware is None:
+            self._aware = aware
+            self.tz = timestamp.tzinfo
+        elif aware != self._aware:
+            raise ValueError("cannot mix naive and timezone-aware timestamps")
+
+    def _extend_prefix(self, values: Iterable[float]) -> None:
+        """Append prefix sums, errors and non-finite counts for ``values``."""
+        total = self._sums[-1]
+        error = self._errors[-1]
+        nonfinite = self._nonfinite[-1]
+        sums, errors, counts = self._sums, self._errors, self._nonfinite
+        for x in values:
+            if x - x == 0.0:
+                t = total + x
+                if abs(total) >= abs(x):
+                    error += (total - t) + x
+                else:
+                    error += (x - t) + total
+                total = t
+            else:
+                nonfinite += 1
+            sums.append(total)
+            errors.append(error)
+            counts.append(nonfinite)
+
+    def append(self, point: DataPoint) -> None:
+        """Add a point at or after the last timestamp in O(1).
+
+        Raises:
+            ValueError: If the point is earlier than the last one
+        """
+        self._check_aware(point.timestamp)
+        ns = datetime_to_ns(point.timestamp)
+        if self._timestamps and ns < self._timestamps[-1]:
+            raise ValueError("appended points must not precede the last timestamp")
+        self._timestamps.append(ns)
+        self._values.append(point.value)
+        self._extend_prefix((point.value,))
+
+    def extend(self, points: Iterable[DataPoint]) -> None:
+        """Append points in timestamp order."""
+        for point in points:
+            self.append(point)
+
+    def _bounds(self, start: Optional[datetime], end: Optional[datetime]) -> range:
+        """Index range of the points in ``[start, end)``."""
+        timestamps = self._timestamps
+        lo = 0
+        hi = len(timestamps)
+        if start is not None:
+            self._check_query(start)
+            lo = bisect_left(timestamps, datetime_to_ns(start))
+        if end is not None:
+            self._check_query(end)
+            hi = bisect_left(timestamps, datetime_to_ns(end))
+        return range(lo, max(lo, hi))
+
+    def _check_query(self, timestamp: datetime) -> None:
+        if self._aware is not None and (timestamp.tzinfo is not None) != self._aware:
+            raise ValueError("cannot compare naive and timezone-aware timestamps")
+
+    def _sum(self, lo: int, hi: int) -> float:
+        if self._nonfinite[hi] != self._nonfinite[lo]:
+            return sum(self._values[lo:hi])
+        return (self._sums[hi] - self._sums[lo]) + (self._errors[hi] - self._errors[lo])
+
+    def sum(
+        self, start: Optional[datetime] = None, end: Optional[datetime] = None
+    ) -> float:
+        """Sum of the values with timestamps in ``[start, end)``."""
+        bounds = self._bounds(start, end)
+        return self._sum(bounds.start, bounds.stop)
+
+    def count(
+        self, start: Optional[datetime] = None, end: Optional[datetime] = None
+    ) -> int:
+        """Number of points with timestamps in ``[start, end)``."""
+        return len(self._bounds(start, end))
+
+    def mean(
+        self, start: Optional[datetime] = None, end: Optional[datetime] = None
+    ) -> float:
+        """Mean of the values with timestamps in ``[start, end)``.
+
+        Returns NaN for an empty range.
+        """
+        bounds = self._bounds(start, end)
+        if not bounds:
+            return math.nan
+        return self._sum(bounds.start, bounds.stop) / len(bounds)
+
+    def query_many(
+        self, ranges: Iterable[Range], statistic: str = "mean"
+    ) -> list[float]:
+        """Answer one statistic for many ranges in a single call.
+
+        Args:
+            ranges: ``(start, end)`` pairs, as for :meth:`mean`
+            statistic: One of ``STATISTICS``
+
+        Returns:
+            One result per range, in order
+        """
+        if statistic not in STATISTICS:
+            raise ValueError(
+                f"statistic must be one of {STATISTICS}, got {statistic!r}"
+            )
+        bounds = self._bounds
+        total = self._sum
+        results: list[float] = []
+        append = results.append
+        for start, end in ranges:
+            span = bounds(start, end)
+            if statistic == "count":
+                append(len(span))
+            elif statistic == "sum":
+                append(total(span.start, span.stop))
+            else:
+                append(total(span.start, span.stop) / len(span) if span else math.nan)
+        return results
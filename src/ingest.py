@@ -0,0 +1,247 @@
+"""Streaming CSV and JSON Lines loaders.
+
+Files are read row by row, so memory stays bounded by ``batch_size``
+regardless of file size. Timestamps are parsed with a numeric epoch fast
+path and otherwise with ``datetime.fromisoformat``; labels are interned
+through a per-reader cache so repeated labels share one string object.
+
+``read_*_points`` yield DataPoint objects that can be fed straight into
+``iter_moving_average`` or a ``MovingAverage``; ``read_*_series`` fill
+columnar DataPointSeries batches without building DataPoint objects.
+"""
+
+import csv
+import json
+from array import array
+from collections.abc import Iterable, Iterator
+from datetime import datetime, tzinfo
+from os import PathLike
+from pathlib import Path
+from typing import IO, Any, Optional, Union, cast
+
+from .example import DataPoint
+from .series import NO_LABEL, DataPointSeries, datetime_to_ns, ns_to_datetime
+
+DEFAULT_BATCH_SIZE = 65_536
+
+Source = Union[str, PathLike, IO[str], Iterable[str]]
+
+_EPOCH_UNITS = {"s": 1_000_000_000, "ms": 1_000_000, "us": 1_000, "ns": 1}
+
+
+def _parse_ns(raw: Any, epoch_unit: str) -> tuple[int, Optional[tzinfo]]:
+    """Parse a timestamp straight to epoch-nanoseconds and its timezone."""
+    if isinstance(raw, (int, float)):
+        return round(raw * _EPOCH_UNITS[epoch_unit]), None
+    if raw.isdigit():
+        return int(raw) * _EPOCH_UNITS[epoch_unit], None
+    try:
+        dt = datetime.fromisoformat(raw)
+    except ValueError:
+        # ``fromisoformat`` only accepts a trailing "Z" from Python 3.11.
+        if raw.endswith(("Z", "z")):
+            dt = datetime.fromisoformat(raw[:-1] + "+00:00")
+        else:
+            try:
+                return round(float(raw) * _EPOCH_UNITS[epoch_unit]), None
+            except ValueError:
+                raise ValueError(f"unrecognized timestamp {raw!r}") from None
+    return datetime_to_ns(dt), dt.tzinfo
+
+
+def parse_timestamp(raw: Any, epoch_unit: str = "s") -> datetime:
+    """Parse an ISO 8601 string or a numeric epoch timestamp.
+
+    Numeric timestamps produce naive datetimes measured from the epoch.
+
+    Args:
+        raw: ISO 8601 string, or a number (or numeric string) since the epoch
+        epoch_unit: Unit of numeric timestamps: ``s``, ``ms``, ``us`` or ``ns``
+
+    Raises:
+        ValueError: If ``raw`` is neither numeric nor ISO 8601
+    """
+    if isinstance(raw, str) and not raw.isdigit():
+        try:
+            return datetime.fromisoformat(raw)
+        except ValueError:
+            pass
+    ns, tz = _parse_ns(raw, epoch_unit)
+    return ns_to_datetime(ns, tz)
+
+
+def _open_lines(source: Source) -> tuple[Iterable[str], Optional[IO[str]]]:
+    """Return an iterable of lines and the file to close, if we opened one."""
+    if isinstance(source, (str, PathLike)):
+        f = Path(cast("Union[str, PathLike[str]]", source)).open(newline="")
+        return f, f
+    return source, None
+
+
+def _rows_csv(source: Source) -> Iterator[dict[str, Any]]:
+    lines, owned = _open_lines(source)
+    try:
+        yield from csv.DictReader(lines)
+    finally:
+        if owned is not None:
+            owned.close()
+
+
+def _rows_jsonl(source: Source) -> Iterator[dict[str, Any]]:
+    lines, owned = _open_lines(source)
+    loads = json.loads
+    try:
+        for line in lines:
+            if line.strip():
+                yield loads(line)
+    finally:
+        if owned is not None:
+            owned.close()
+
+
+def _points(
+    rows: Iterator[dict[str, Any]],
+    timestamp_field: str,
+    value_field: str,
+    label_field: Optional[str],
+    epoch_unit: str,
+) -> Iterator[DataPoint]:
+    labels: dict[str, str] = {}
+    intern = labels.setdefault
+    for row in rows:
+        label = row.get(label_field) if label_field else None
+        yield DataPoint(
+            parse_timestamp(row[timestamp_field], epoch_unit),
+            float(row[value_field]),
+            intern(label, label) if label else None,
+        )
+
+
+def _batches(
+    rows: Iterator[dict[str, Any]],
+    batch_size: int,
+    timestamp_field: str,
+    value_field: str,
+    label_field: Optional[str],
+    epoch_unit: str,
+) -> Iterator[DataPointSeries]:
+    """Fill columnar buffers directly from rows, ``batch_size`` at a time."""
+    if batch_size < 1:
+        raise ValueError(f"batch_size must be at least 1, got {batch_size}")
+    codes_by_label: dict[str, int] = {}
+    categories: list[str] = []
+    tz: Optional[tzinfo] = None
+    exhausted = False
+
+    while not exhausted:
+        timestamps, values, codes = array("q"), array("d"), array("i")
+        exhausted = True
+        for row in rows:
+            ns, row_tz = _parse_ns(row[timestamp_field], epoch_unit)
+            if row_tz is not None:
+                tz = row_tz
+            timestamps.append(ns)
+            values.append(float(row[value_field]))
+            label = row.get(label_field) if label_field else None
+            if label:
+                code = codes_by_label.get(label)
+                if code is None:
+                    code = codes_by_label[label] = len(categories)
+                    categories.append(label)
+                codes.append(code)
+            else:
+                codes.append(NO_LABEL)
+            if len(values) >= batch_size:
+                exhausted = False
+                break
+        if values:
+            yield DataPointSeries(timestamps, values, codes, categories, tz)
+
+
+def read_csv_points(
+    source: Source,
+    *,
+    timestamp_field: str = "timestamp",
+    value_field: str = "value",
+    label_field: Optional[str] = "label",
+    epoch_unit: str = "s",
+) -> Iterator[DataPoint]:
+    """Lazily read DataPoints from a CSV file with a header row.
+
+    Args:
+        source: Path, open text file, or iterable of lines
+        timestamp_field: Column holding ISO 8601 or epoch timestamps
+        value_field: Column holding the value
+        label_field: Column holding the label, ``None`` to skip labels
+        epoch_unit: Unit of numeric timestamps: ``s``, ``ms``, ``us`` or ``ns``
+
+    Yields:
+        One DataPoint per row
+    """
+    return _points(
+        _rows_csv(source), timestamp_field, value_field, label_field, epoch_unit
+    )
+
+
+def read_jsonl_points(
+    source: Source,
+    *,
+    timestamp_field: str = "timestamp",
+    value_field: str = "value",
+    label_field: Optional[str] = "label",
+    epoch_unit: str = "s",
+) -> Iterator[DataPoint]:
+    """Lazily read DataPoints from a JSON Lines file, one object per line.
+
+    Arguments are as for :func:`read_csv_points`.
+    """
+    return _points(
+        _rows_jsonl(source), timestamp_field, value_field, label_field, epoch_unit
+    )
+
+
+def read_csv_series(
+    source: Source,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    *,
+    timestamp_field: str = "timestamp",
+    value_field: str = "value",
+    label_field: Optional[str] = "label",
+    epoch_unit: str = "s",
+) -> Iterator[DataPointSeries]:
+    """Read a CSV file into columnar batches of at most ``batch_size`` points.
+
+    No DataPoint objects are built, and label codes are consistent across
+    batches. Other arguments are as for :func:`read_csv_points`.
+    """
+    return _batches(
+        _rows_csv(source),
+        batch_size,
+        timestamp_field,
+        value_field,
+        label_field,
+        epoch_unit,
+    )
+
+
+def read_jsonl_series(
+    source: Source,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    *,
+    timestamp_field: str = "timestamp",
+    value_field: str = "value",
+    label_field: Optional[str] = "label",
+    epoch_unit: str = "s",
+) -> Iterator[DataPointSeries]:
+    """Read a JSON Lines file into columnar batches of at most ``batch_size``.
+
+    Arguments are as for :func:`read_csv_series`.
+    """
+    return _batches(
+        _rows_jsonl(source),
+        batch_size,
+        timestamp_field,
+        value_field,
+        label_field,
+        epoch_unit,
+    )
@@ -0,0 +1,346 @@
+"""Opt-in instrumentation for rolling computations.
+
+Instrumentation is off by default and costs a single truthiness check per
+call while off. Enable it for a block of code with :func:`instrument`, or
+for the whole process with the ``ROLLING_INSTRUMENT`` environment variable,
+a comma-separated list of sinks::
+
+    ROLLING_INSTRUMENT=log                         # log every call
+    ROLLING_INSTRUMENT=memory,prometheus:/tmp/rolling.prom
+
+Each instrumented call produces a :class:`CallRecord` (points processed,
+window size, backend, wall time and, when requested, peak allocated bytes)
+that is passed to every active sink.
+"""
+
+import atexit
+import cProfile
+import io
+import logging
+import os
+import pstats
+import sys
+import time
+import tracemalloc
+from collections import deque
+from collections.abc import Generator
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import IO, Any, Callable, Optional, Protocol, TypeVar, Union
+
+T = TypeVar("T")
+
+ENV_VAR = "ROLLING_INSTRUMENT"
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class CallRecord:
+    """Measurements for one instrumented call."""
+
+    function: str
+    points: int
+    window_size: Any
+    backend: str
+    seconds: float
+    allocated_bytes: Optional[int] = None
+
+
+class Sink(Protocol):
+    """Receives a record for every instrumented call."""
+
+    def emit(self, record: CallRecord) -> None: ...
+
+
+@dataclass
+class _Totals:
+    calls: int = 0
+    points: int = 0
+    seconds: float = 0.0
+    allocated_bytes: int = 0
+
+
+@dataclass
+class MetricsRegistry:
+    """In-memory sink aggregating counters per function and backend.
+
+    Args:
+        history: Number of most recent records kept in ``records``
+    """
+
+    history: int = 1000
+    totals: dict[tuple[str, str], _Totals] = field(default_factory=dict)
+    records: deque = field(init=False)
+
+    def __post_init__(self) -> None:
+        self.records = deque(maxlen=self.history)
+
+    def emit(self, record: CallRecord) -> None:
+        totals = self.totals.get((record.function, record.backend))
+        if totals is None:
+            totals = self.totals[(record.function, record.backend)] = _Totals()
+        totals.calls += 1
+        totals.points += record.points
+        totals.seconds += record.seconds
+        totals.allocated_bytes += record.allocated_bytes or 0
+        self.records.append(record)
+
+    def clear(self) -> None:
+        self.totals.clear()
+        self.records.clear()
+
+    def to_prometheus(self) -> str:
+        """Render the counters in the Prometheus text exposition format."""
+        metrics = [
+            ("rolling_calls_total", "Instrumented calls.", "calls"),
+            ("rolling_points_total", "Data points processed.", "points"),
+            ("rolling_seconds_total", "Wall time spent in calls.", "seconds"),
+            (
+                "rolling_allocated_bytes_total",
+                "Peak bytes allocated per call, summed over tracked calls.",
+                "allocated_bytes",
+            ),
+        ]
+        lines = []
+        for name, help_text, attribute in metrics:
+            lines.append(f"# HELP {name} {help_text}")
+            lines.append(f"# TYPE {name} counter")
+            for (function, backend), totals in sorted(self.totals.items()):
+                value = getattr(totals, attribute)
+                lines.append(
+                    f'{name}{{function="{function}",backend="{backend}"}} {value}'
+                )
+        return "\n".join(lines) + "\n"
+
+
+class LoggingSink:
+    """Logs one line per instrumented call."""
+
+    def __init__(
+        self, log: Optional[logging.Logger] = None, level: int = logging.INFO
+    ) -> None:
+        self.log = log or logger
+        self.level = level
+
+    def emit(self, record: CallRecord) -> None:
+        self.log.log(
+            self.level,
+            "%s backend=%s points=%d window=%s seconds=%.6f allocated_bytes=%s",
+            record.function,
+            record.backend,
+            record.points,
+            record.window_size,
+            record.seconds,
+            record.allocated_bytes,
+        )
+
+
+class PrometheusFileSink:
+    """Aggregates records and dumps them as Prometheus text on :meth:`flush`.
+
+    The file is replaced atomically so a node-exporter textfile collector
+    never reads a partial dump.
+    """
+
+    def __init__(self, path: Union[str, os.PathLike]) -> None:
+        self.path = Path(path)
+        self.registry = MetricsRegistry(history=0)
+
+    def emit(self, record: CallRecord) -> None:
+        self.registry.emit(record)
+
+    def flush(self) -> None:
+        tmp = self.path.with_name(self.path.name + ".tmp")
+        tmp.write_text(self.registry.to_prometheus())
+        tmp.replace(self.path)
+
+
+# Active sinks; instrumentation is disabled while this is empty.
+_sinks: list[Sink] = []
+_track_allocations = False
+
+# Registry used by ``ROLLING_INSTRUMENT=memory``.
+default_registry = MetricsRegistry()
+
+
+def enabled() -> bool:
+    """Return whether any sink is active."""
+    return bool(_sinks)
+
+
+def record_call(
+    function: str,
+    points: int,
+    window_size: Any,
+    backend: str,
+    call: Callable[[], T],
+) -> T:
+    """Run ``call`` and emit a record for it to every active sink."""
+    tracking = _track_allocations
+    started_tracing = False
+    baseline = 0
+    if tracking:
+        started_tracing = not tracemalloc.is_tracing()
+        if started_tracing:
+            tracemalloc.start()
+        tracemalloc.reset_peak()
+        baseline = tracemalloc.get_traced_memory()[0]
+
+    allocated = None
+    began = time.perf_counter()
+    try:
+        result = call()
+        seconds = time.perf_counter() - began
+        if tracking:
+            allocated = tracemalloc.get_traced_memory()[1] - baseline
+    finally:
+        # Stop tracing even if the call raised, or every later allocation in
+        # the process would still be traced.
+        if started_tracing:
+            tracemalloc.stop()
+
+    record = CallRecord(function, points, window_size, backend, seconds, allocated)
+    for sink in list(_sinks):
+        sink.emit(record)
+    return result
+
+
+@contextmanager
+def instrument(
+    *sinks: Sink, track_allocations: bool = False
+) -> Generator[MetricsRegistry, None, None]:
+    """Enable instrumentation for the duration of a ``with`` block.
+
+    Args:
+        sinks: Sinks to receive records; a fresh MetricsRegistry is always
+            added and yielded
+        track_allocations: Also measure peak allocated bytes per call with
+            tracemalloc, which slows calls down noticeably
+
+    Yields:
+        The MetricsRegistry collecting records for this block
+    """
+    global _track_allocations
+
+    registry = MetricsRegistry()
+    added: list[Sink] = [registry, *sinks]
+    previous_tracking = _track_allocations
+    _sinks.extend(added)
+    _track_allocations = track_allocations or previous_tracking
+    try:
+        yield registry
+    finally:
+        for sink in added:
+            _sinks.remove(sink)
+        _track_allocations = previous_tracking
+        for sink in sinks:
+            flush = getattr(sink, "flush", None)
+            if flush is not None:
+                flush()
+
+
+def configure_from_env(
+    value: Optional[str] = None, *, strict: bool = True
+) -> list[Sink]:
+    """Install the sinks named by ``ROLLING_INSTRUMENT``.
+
+    Recognized entries are ``memory`` (:data:`default_registry`), ``log``
+    and ``prometheus:<path>``, which is flushed at interpreter exit.
+
+    Args:
+        value: Entries to parse, defaults to the environment variable
+        strict: Raise on unrecognized entries instead of logging and
+            skipping them
+
+    Raises:
+        ValueError: If ``strict`` and an entry is not recognized
+    """
+    value = os.environ.get(ENV_VAR, "") if value is None else value
+    installed: list[Sink] = []
+    for entry in filter(None, (part.strip() for part in value.split(","))):
+        if entry == "memory":
+            installed.append(default_registry)
+        elif entry == "log":
+            installed.append(LoggingSink())
+        elif entry.startswith("prometheus:"):
+            sink = PrometheusFileSink(entry.split(":", 1)[1])
+            atexit.register(sink.flush)
+            installed.append(sink)
+        elif strict:
+            raise ValueError(f"unknown {ENV_VAR} entry {entry!r}")
+        else:
+            logger.warning("ignoring unknown %s entry %r", ENV_VAR, entry)
+    _sinks.extend(installed)
+    return installed
+
+
+@dataclass
+class ProfileReport:
+    """Summary produced by :func:`profile` once its block exits."""
+
+    mode: str
+    seconds: float = 0.0
+    peak_bytes: Optional[int] = None
+    summary: str = ""
+
+
+@contextmanager
+def profile(
+    mode: str = "cprofile", limit: int = 20, stream: Optional[IO[str]] = None
+) -> Generator[ProfileReport, None, None]:
+    """Profile the enclosed block with cProfile or tracemalloc.
+
+    Args:
+        mode: ``"cprofile"`` for the top functions by cumulative time, or
+            ``"tracemalloc"`` for the top allocation sites and peak memory
+        limit: Number of entries in the summary
+        stream: Where to write the summary, defaults to ``sys.stderr``
+
+    Yields:
+        A ProfileReport that is filled in when the block exits
+
+    Raises:
+        ValueError: If ``mode`` is not recognized
+    """
+    if mode not in ("cprofile", "tracemalloc"):
+        raise ValueError(f"mode must be 'cprofile' or 'tracemalloc', got {mode!r}")
+    report = ProfileReport(mode)
+    out = io.StringIO()
+
+    if mode == "cprofile":
+        profiler = cProfile.Profile()
+        began = time.perf_counter()
+        profiler.enable()
+        try:
+            yield report
+        finally:
+            profiler.disable()
+            report.seconds = time.perf_counter() - began
+            stats = pstats.Stats(profiler, stream=out)
+            stats.sort_stats(pstats.SortKey.CUMULATIVE).print_stats(limit)
+    else:
+        started_tracing = not tracemalloc.is_tracing()
+        if started_tracing:
+            tracemalloc.start()
+        tracemalloc.reset_peak()
+        began = time.perf_counter()
+        try:
+            yield report
+        finally:
+            report.seconds = time.perf_counter() - began
+            snapshot = tracemalloc.take_snapshot()
+            report.peak_bytes = tracemalloc.get_traced_memory()[1]
+            if started_tracing:
+                tracemalloc.stop()
+            out.write(f"peak traced memory: {report.peak_bytes} bytes\n")
+            for stat in snapshot.statistics("lineno")[:limit]:
+                out.write(f"{stat}\n")
+
+    report.summary = f"{mode} profile, {report.seconds:.6f}s wall\n{out.getvalue()}"
+    (stream or sys.stderr).write(report.summary)
+
+
+# A typo in the environment must not make importing the library fail.
+configure_from_env(strict=False)
@@ -0,0 +1,231 @@
+"""Process-parallel moving averages.
+
+Work is shipped to ``concurrent.futures.ProcessPoolExecutor`` workers as
+plain float lists or shared-memory buffers rather than DataPoint objects,
+and small groups are batched into chunks so that each task carries enough
+work to amortize the inter-process overhead.
+"""
+
+import os
+from array import array
+from collections.abc import Hashable, Iterable, Sequence
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+from operator import attrgetter
+from typing import Any, Callable, Optional, Union, cast
+
+from ._sliding import anchor_interval
+from .example import _KERNELS, DataPoint, SeriesLike, _select_backend
+from .series import DataPointSeries
+
+# Minimum number of points per task; smaller groups are batched together.
+DEFAULT_CHUNK_SIZE = 100_000
+
+Group = tuple[Hashable, list[float]]
+Chunk = tuple[int, int]
+
+
+def _moving_average_groups(
+    groups: list[Group], window_size: int, backend: str
+) -> list[tuple[Hashable, list[float]]]:
+    """Worker entry point: compute the moving average of each group."""
+    return [
+        (key, _KERNELS[_select_backend(backend, len(values))](values, window_size))
+        for key, values in groups
+    ]
+
+
+def _partition(
+    data: SeriesLike, by: Union[str, Callable[[DataPoint], Hashable]]
+) -> dict[Hashable, list[float]]:
+    """Split values by key in a single pass, preserving first-seen order."""
+    groups: dict[Hashable, list[float]] = {}
+    if isinstance(data, DataPointSeries) and by == "label":
+        by_code: dict[int, list[float]] = {}
+        for code, value in zip(data.codes, data.values):
+            values = by_code.get(code)
+            if values is None:
+                values = by_code[code] = []
+            values.append(value)
+        for code, values in by_code.items():
+            groups[data.decode(code)] = values
+        return groups
+
+    key_of: Callable[[Any], Hashable] = attrgetter(by) if isinstance(by, str) else by
+    for point in data:
+        key = key_of(point)
+        values = groups.get(key)
+        if values is None:
+            values = groups[key] = []
+        values.append(point.value)
+    return groups
+
+
+def _batch(groups: Iterable[Group], chunk_size: int) -> list[list[Group]]:
+    """Pack groups into tasks of at least ``chunk_size`` points where possible."""
+    tasks: list[list[Group]] = []
+    pending: list[Group] = []
+    pending_size = 0
+    for group in groups:
+        if len(group[1]) >= chunk_size:
+            tasks.append([group])
+            continue
+        pending.append(group)
+        pending_size += len(group[1])
+        if pending_size >= chunk_size:
+            tasks.append(pending)
+            pending, pending_size = [], 0
+    if pending:
+        tasks.append(pending)
+    return tasks
+
+
+def grouped_moving_average(
+    data: SeriesLike,
+    window_size: int = 3,
+    by: Union[str, Callable[[DataPoint], Hashable]] = "label",
+    *,
+    max_workers: Optional[int] = None,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    backend: str = "auto",
+) -> dict[Hashable, list[float]]:
+    """Calculate a moving average per group, in parallel for large inputs.
+
+    Points are partitioned by key in a single pass and keep their relative
+    order within each group.
+
+    Args:
+        data: DataPoint objects or a columnar DataPointSeries
+        window_size: Size of moving window
+        by: DataPoint attribute name or a function returning the group key
+        max_workers: Worker processes; ``1`` computes everything in-process
+        chunk_size: Minimum points per task. Smaller groups are batched
+            together, and inputs that fit in one task skip the process pool
+        backend: Kernel backend, as for ``calculate_moving_average``
+
+    Returns:
+        Mapping of group key to that group's moving averages, in order of
+        first appearance
+
+    Raises:
+        ValueError: If ``window_size`` or ``chunk_size`` is less than 1
+    """
+    if window_size < 1:
+        raise ValueError(f"window_size must be at least 1, got {window_size}")
+    if chunk_size < 1:
+        raise ValueError(f"chunk_size must be at least 1, got {chunk_size}")
+    _select_backend(backend, 0)  # validate before spawning workers
+
+    groups = _partition(data, by)
+    tasks = _batch(groups.items(), chunk_size)
+    results: dict[Hashable, list[float]] = {key: [] for key in groups}
+
+    if len(tasks) <= 1 or max_workers == 1:
+        for task in tasks:
+            results.update(_moving_average_groups(task, window_size, backend))
+        return results
+
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        futures = [
+            executor.submit(_moving_average_groups, task, window_size, backend)
+            for task in tasks
+        ]
+        for future in futures:
+            results.update(future.result())
+    return results
+
+
+def _doubles(block: shared_memory.SharedMemory, size: int) -> "memoryview[float]":
+    """Float64 view of the first ``size`` items of a shared memory block."""
+    buf = block.buf
+    if buf is None:
+        raise ValueError(f"shared memory block {block.name} is closed")
+    return buf[: size * 8].cast("d")
+
+
+def _mean_chunk(
+    source: str, target: str, size: int, window_size: int, kernel: str, bounds: Chunk
+) -> None:
+    """Worker entry point: fill ``target[start:stop]`` from shared memory."""
+    start, stop = bounds
+    src = shared_memory.SharedMemory(name=source)
+    dst = shared_memory.SharedMemory(name=target)
+    values = _doubles(src, size)
+    out = _doubles(dst, size)
+    try:
+        out[start:stop] = array("d", _KERNELS[kernel](values, window_size, start, stop))
+    finally:
+        values.release()
+        out.release()
+        src.close()
+        dst.close()
+
+
+def parallel_moving_average(
+    values: Sequence[float],
+    window_size: int,
+    *,
+    max_workers: Optional[int] = None,
+    chunk_size: Optional[int] = None,
+    backend: str = "auto",
+) -> list[float]:
+    """Moving average of one long series, split across worker processes.
+
+    Values are copied once into ``multiprocessing.shared_memory`` and each
+    worker reads its chunk plus the preceding ``window_size - 1`` points
+    from there, writing results into a shared output buffer. Chunk starts
+    are aligned to the engines' anchor interval, so the output matches the
+    sequential result exactly, warm-up included.
+
+    Args:
+        values: Float values, e.g. ``DataPointSeries.values``
+        window_size: Size of moving window
+        max_workers: Worker processes, defaults to the CPU count
+        chunk_size: Target points per task, rounded up to the anchor
+            interval. Defaults to about four tasks per worker
+        backend: Kernel backend, as for ``calculate_moving_average``
+
+    Returns:
+        List of moving averages
+    """
+    size = len(values)
+    kernel = _select_backend(backend, size)
+    interval = anchor_interval(window_size)
+    if chunk_size is None:
+        workers = max_workers or os.cpu_count() or 1
+        chunk_size = -(-size // (4 * workers))
+    step = -(-max(chunk_size, 1) // interval) * interval
+    chunks = [(start, min(start + step, size)) for start in range(0, size, step)]
+    if len(chunks) <= 1 or max_workers == 1:
+        return _KERNELS[kernel](values, window_size)
+
+    source = shared_memory.SharedMemory(create=True, size=size * 8)
+    target = shared_memory.SharedMemory(create=True, size=size * 8)
+    shared_values = _doubles(source, size)
+    shared_out = _doubles(target, size)
+    try:
+        shared_values[:] = (
+            values if isinstance(values, memoryview) else array("d", values)
+        )
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            futures = [
+                executor.submit(
+                    _mean_chunk,
+                    source.name,
+                    target.name,
+                    size,
+                    window_size,
+                    kernel,
+                    bounds,
+                )
+                for bounds in chunks
+            ]
+            for future in futures:
+                future.result()
+        return cast("list[float]", shared_out.tolist())
+    finally:
+        shared_values.release()
+        shared_out.release()
+        for block in (source, target):
+            block.close()
+            block.unlink()
@@ -0,0 +1,237 @@
+"""Native downsampling of DataPoint series into fixed time buckets.
+
+Buckets are half-open ``[start, start + every)`` intervals aligned to
+``origin`` (the Unix epoch by default), so ``every=timedelta(minutes=1)``
+buckets start on whole minutes. Input is consumed in one streaming pass
+and must be sorted by timestamp; only the current bucket's aggregates are
+held in memory. Results are generators, so they chain lazily into
+``calculate_moving_average`` or ``iter_moving_average``::
+
+    minutes = resample(points, timedelta(minutes=1), "mean")
+    smoothed = calculate_moving_average(minutes, window_size=15)
+"""
+
+import math
+from collections.abc import Iterable, Iterator
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from functools import partial
+from itertools import chain
+from typing import Any, Callable, Optional
+
+from .example import _DATACLASS_OPTIONS, DataPoint, SeriesLike
+from .series import DataPointSeries, datetime_to_ns, ns_to_datetime, timedelta_to_ns
+
+AGGREGATIONS = ("mean", "sum", "count", "first", "last", "min", "max")
+FILLS = ("nan", "zero", "ffill")
+
+_EPOCH = datetime(1970, 1, 1)
+
+# (start, count, sum, first, last, min, max) for one non-empty bucket
+_Bucket = tuple[Any, int, float, float, float, float, float]
+
+_AGGREGATE: dict[str, Callable[[_Bucket], float]] = {
+    "mean": lambda b: b[2] / b[1],
+    "sum": lambda b: b[2],
+    "count": lambda b: float(b[1]),
+    "first": lambda b: b[3],
+    "last": lambda b: b[4],
+    "min": lambda b: b[5],
+    "max": lambda b: b[6],
+}
+
+
+@dataclass(**_DATACLASS_OPTIONS)
+class Bar:
+    """Open/high/low/close summary of one time bucket."""
+
+    timestamp: datetime
+    open: float
+    high: float
+    low: float
+    close: float
+    count: int
+
+
+def _bucketize(
+    pairs: Iterable[tuple[Any, float]], every: Any, origin: Any
+) -> Iterator[_Bucket]:
+    """Aggregate sorted ``(timestamp, value)`` pairs bucket by bucket.
+
+    Works on datetimes with a timedelta ``every`` and on epoch-nanosecond
+    ints with an int ``every`` alike.
+    """
+    start: Any = None
+    end: Any = None
+    previous: Any = None
+    count = 0
+    total = comp = first = last = lo = hi = 0.0
+
+    for t, x in pairs:
+        if previous is not None and t < previous:
+            raise ValueError("timestamps must be sorted to resample")
+        previous = t
+        if start is None or t >= end:
+            if start is not None:
+                yield start, count, _finish(total, comp), first, last, lo, hi
+            start = t - (t - origin) % every
+            end = start + every
+            count, total, comp = 1, x, 0.0
+            first = last = lo = hi = x
+            continue
+
+        count += 1
+        last = x
+        if x < lo:
+            lo = x
+        if x > hi:
+            hi = x
+        # Neumaier compensated sum, as in the moving-average engine.
+        t_sum = total + x
+        if abs(total) >= abs(x):
+            comp += (total - t_sum) + x
+        else:
+            comp += (x - t_sum) + total
+        total = t_sum
+
+    if start is not None:
+        yield start, count, _finish(total, comp), first, last, lo, hi
+
+
+def _finish(total: float, comp: float) -> float:
+    # An inf in the bucket turns the compensation into nan; keep the inf.
+    return total + comp if math.isfinite(total) else total
+
+
+def _buckets(
+    data: SeriesLike, every: timedelta, origin: Optional[datetime]
+) -> tuple[Iterator[_Bucket], Any, Callable[[Any], datetime]]:
+    """Return buckets, the step in their units and a converter to datetimes."""
+    if every <= timedelta(0):
+        raise ValueError(f"bucket width must be positive, got {every}")
+
+    if isinstance(data, DataPointSeries):
+        tz = data.tz
+        step = timedelta_to_ns(every)
+        anchor = 0 if origin is None else datetime_to_ns(origin)
+        pairs = zip(data.timestamps, data.values)
+        return _bucketize(pairs, step, anchor), step, partial(ns_to_datetime, tz=tz)
+
+    pairs = ((point.timestamp, point.value) for point in data)
+    if origin is None:
+        buckets = _bucketize_from_epoch(pairs, every)
+    else:
+        buckets = _bucketize(pairs, every, origin)
+    return buckets, every, _identity
+
+
+def _identity(t: datetime) -> datetime:
+    return t
+
+
+def _bucketize_from_epoch(
+    pairs: Iterator[tuple[datetime, float]], every: timedelta
+) -> Iterator[_Bucket]:
+    """Bucket datetimes against the naive or UTC epoch matching the input."""
+    head = next(pairs, None)
+    if head is None:
+        return
+    origin = _EPOCH if head[0].tzinfo is None else _EPOCH.replace(tzinfo=timezone.utc)
+    yield from _bucketize(chain([head], pairs), every, origin)
+
+
+def _check_fill(fill: Optional[str]) -> Optional[float]:
+    """Validate ``fill`` and return the constant it emits, if any."""
+    if fill is not None and fill not in FILLS:
+        raise ValueError(f"fill must be one of {FILLS} or None, got {fill!r}")
+    return {"nan": math.nan, "zero": 0.0}.get(fill or "")
+
+
+def _fill_gaps(
+    buckets: Iterator[_Bucket], every: Any, fill: Optional[str]
+) -> Iterator[tuple[Any, Optional[_Bucket]]]:
+    """Yield ``(start, bucket)``, with ``None`` buckets for filled gaps."""
+    previous: Any = None
+    for bucket in buckets:
+        start = bucket[0]
+        if fill is not None and previous is not None:
+            gap = previous + every
+            while gap < start:
+                yield gap, None
+                gap += every
+        yield start, bucket
+        previous = start
+
+
+def resample(
+    data: SeriesLike,
+    every: timedelta,
+    how: str = "mean",
+    *,
+    fill: Optional[str] = None,
+    origin: Optional[datetime] = None,
+) -> Iterator[DataPoint]:
+    """Lazily downsample data points into fixed-width time buckets.
+
+    Args:
+        data: DataPoint objects sorted by timestamp, or a DataPointSeries
+        every: Bucket width
+        how: Aggregate per bucket, one of ``AGGREGATIONS``
+        fill: What to emit for empty buckets between non-empty ones:
+            ``None`` skips them, ``"nan"`` and ``"zero"`` emit that value and
+            ``"ffill"`` repeats the previous bucket's aggregate
+        origin: Any bucket boundary, defaults to the Unix epoch
+
+    Yields:
+        One unlabeled DataPoint per bucket, stamped with the bucket start
+
+    Raises:
+        ValueError: If an argument is invalid or the input is unsorted
+    """
+    if how not in _AGGREGATE:
+        raise ValueError(f"how must be one of {AGGREGATIONS}, got {how!r}")
+    aggregate = _AGGREGATE[how]
+    empty = _check_fill(fill)
+    buckets, step, to_time = _buckets(data, every, origin)
+
+    def generate() -> Iterator[DataPoint]:
+        value = math.nan
+        for start, bucket in _fill_gaps(buckets, step, fill):
+            if bucket is not None:
+                value = aggregate(bucket)
+                yield DataPoint(to_time(start), value)
+            else:
+                yield DataPoint(to_time(start), value if empty is None else empty)
+
+    return generate()
+
+
+def resample_ohlc(
+    data: SeriesLike,
+    every: timedelta,
+    *,
+    fill: Optional[str] = None,
+    origin: Optional[datetime] = None,
+) -> Iterator[Bar]:
+    """Lazily summarize data points as one OHLC bar per time bucket.
+
+    Arguments are as for :func:`resample`. Filled bars have a ``count`` of
+    0; ``"ffill"`` repeats the previous close in every field.
+
+    Yields:
+        One Bar per bucket, stamped with the bucket start
+    """
+    empty = _check_fill(fill)
+    buckets, step, to_time = _buckets(data, every, origin)
+
+    def generate() -> Iterator[Bar]:
+        close = math.nan
+        for start, bucket in _fill_gaps(buckets, step, fill):
+            if bucket is not None:
+                _, count, _, first, close, lo, hi = bucket
+                yield Bar(to_time(start), first, hi, lo, close, count)
+            else:
+                value = close if empty is None else empty
+                yield Bar(to_time(start), value, value, value, value, 0)
+
+    return generate()
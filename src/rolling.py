@@ -0,0 +1,302 @@
+"""Rolling statistics over count-based trailing windows.
+
+Every statistic shares one pass over the values and one window, with the
+same warm-up semantics as ``calculate_moving_average``: the first
+``window_size - 1`` results cover the points seen so far.
+
+* sum, mean: compensated running sum, re-anchored like the mean engine
+* min, max: monotonic deques of indices, amortized O(1)
+* var, std: Welford add/remove updates, re-anchored with an exact two-pass
+  computation so rounding error stays bounded
+* median: two heaps with lazy deletion, O(log w) amortized
+* count: number of points in the window
+
+Inf and NaN are tracked by count, so they affect only the windows that
+contain them; a NaN makes every statistic but count NaN.
+"""
+
+import heapq
+import math
+from collections import deque
+from collections.abc import Iterable, Sequence
+from functools import partial
+
+from . import instrumentation
+from ._sliding import _window_sum, anchor_interval
+from .example import SeriesLike, _extract_values
+
+STATISTICS = ("sum", "count", "mean", "min", "max", "var", "std", "median")
+
+
+class _SlidingMedian:
+    """Median of a sliding multiset using two heaps with lazy deletion."""
+
+    def __init__(self, capacity: int) -> None:
+        self._capacity = capacity
+        self._low: list[float] = []  # max-heap of the lower half, negated
+        self._high: list[float] = []  # min-heap of the upper half
+        self._low_size = 0
+        self._high_size = 0
+        self._delayed: dict[float, int] = {}
+
+    def add(self, x: float) -> None:
+        if not self._low or x <= -self._low[0]:
+            heapq.heappush(self._low, -x)
+            self._low_size += 1
+        else:
+            heapq.heappush(self._high, x)
+            self._high_size += 1
+        self._rebalance()
+
+    def remove(self, x: float) -> None:
+        self._delayed[x] = self._delayed.get(x, 0) + 1
+        if x <= -self._low[0]:
+            self._low_size -= 1
+            if x == -self._low[0]:
+                self._prune(self._low, -1)
+        else:
+            self._high_size -= 1
+            if self._high and x == self._high[0]:
+                self._prune(self._high, 1)
+        self._rebalance()
+
+    def median(self) -> float:
+        if self._low_size > self._high_size:
+            return -self._low[0]
+        return (-self._low[0] + self._high[0]) / 2
+
+    def compact(self, window: Iterable[float]) -> None:
+        """Drop stale heap entries once they outnumber the live ones."""
+        if len(self._low) + len(self._high) <= 2 * self._capacity:
+            return
+        ordered = sorted(window)
+        half = (len(ordered) + 1) // 2
+        self._low = [-x for x in reversed(ordered[:half])]
+        self._high = ordered[half:]
+        self._low_size, self._high_size = half, len(ordered) - half
+        self._delayed.clear()
+
+    def _prune(self, heap: list[float], sign: int) -> None:
+        delayed = self._delayed
+        while heap:
+            x = sign * heap[0]
+            pending = delayed.get(x)
+            if not pending:
+                return
+            if pending == 1:
+                del delayed[x]
+            else:
+                delayed[x] = pending - 1
+            heapq.heappop(heap)
+
+    def _rebalance(self) -> None:
+        if self._low_size > self._high_size + 1:
+            heapq.heappush(self._high, -heapq.heappop(self._low))
+            self._low_size -= 1
+            self._high_size += 1
+            self._prune(self._low, -1)
+        elif self._low_size < self._high_size:
+            heapq.heappush(self._low, -heapq.heappop(self._high))
+            self._high_size -= 1
+            self._low_size += 1
+            self._prune(self._high, 1)
+
+
+def rolling(
+    data: SeriesLike,
+    window_size: int = 3,
+    stats: Sequence[str] = ("mean",),
+    ddof: int = 1,
+) -> dict[str, list[float]]:
+    """Compute several rolling statistics in a single pass.
+
+    Args:
+        data: DataPoint objects or a columnar DataPointSeries
+        window_size: Size of moving window
+        stats: Names from ``STATISTICS`` to compute
+        ddof: Delta degrees of freedom for ``var`` and ``std``; windows with
+            ``ddof`` or fewer points yield nan
+
+    Returns:
+        Mapping of statistic name to one result per point
+
+    Raises:
+        ValueError: If ``window_size`` is less than 1 or a statistic is unknown
+    """
+    if window_size < 1:
+        raise ValueError(f"window_size must be at least 1, got {window_size}")
+    unknown = set(stats) - set(STATISTICS)
+    if unknown:
+        raise ValueError(f"unknown statistics {sorted(unknown)}, expected {STATISTICS}")
+
+    values = _extract_values(data)
+    if instrumentation.enabled():
+        return instrumentation.record_call(
+            "rolling",
+            len(values),
+            window_size,
+            "python",
+            partial(_rolling, values, window_size, stats, ddof),
+        )
+    return _rolling(values, window_size, stats, ddof)
+
+
+def _rolling(
+    values: Sequence[float], window_size: int, stats: Sequence[str], ddof: int
+) -> dict[str, list[float]]:
+    """Single-pass kernel behind :func:`rolling`."""
+    w = window_size
+    interval = anchor_interval(w)
+    results: dict[str, list[float]] = {name: [] for name in stats}
+    want_sum = "sum" in results or "mean" in results
+    want_var = "var" in results or "std" in results
+    want_min = "min" in results
+    want_max = "max" in results
+    want_median = "median" in results
+
+    total = comp = 0.0
+    mean = m2 = 0.0
+    finite = 0  # finite points in the Welford state
+    nonfinite = nans = 0
+    nan = math.nan
+    min_idx: deque[int] = deque()
+    max_idx: deque[int] = deque()
+    median = _SlidingMedian(w)
+
+    for i in range(len(values)):
+        x = values[i]
+        lo = i - w + 1 if i >= w else 0
+        count = i + 1 - lo
+        old = values[i - w] if i >= w else None
+        anchor = i % interval == 0
+
+        # Inf and NaN are counted rather than folded into the running state,
+        # as in the sliding mean, so they leave with their point.
+        if anchor:
+            window = values[lo : i + 1]
+            nonfinite = sum(1 for y in window if y - y != 0.0)
+            nans = sum(1 for y in window if y != y)
+        else:
+            if x - x != 0.0:
+                nonfinite += 1
+                nans += x != x
+            if old is not None and old - old != 0.0:
+                nonfinite -= 1
+                nans -= old != old
+
+        if want_sum:
+            if anchor:
+                total, _ = _window_sum(window)
+                comp = 0.0
+            else:
+                for y in (x,) if old is None else (x, -old):
+                    if y - y == 0.0:
+                        t = total + y
+                        if abs(total) >= abs(y):
+                            comp += (total - t) + y
+                        else:
+                            comp += (y - t) + total
+                        total = t
+            window_sum = sum(values[lo : i + 1]) if nonfinite else total + comp
+            if "sum" in results:
+                results["sum"].append(window_sum)
+            if "mean" in results:
+                results["mean"].append(window_sum / count)
+
+        if "count" in results:
+            results["count"].append(float(count))
+
+        if want_var:
+            if anchor:
+                present = [y for y in window if y - y == 0.0]
+                finite = len(present)
+                mean = _window_sum(present)[0] / finite if finite else 0.0
+                m2 = math.fsum((y - mean) ** 2 for y in present)
+            else:
+                if x - x == 0.0:
+                    finite += 1
+                    delta = x - mean
+                    mean += delta / finite
+                    m2 += delta * (x - mean)
+                if old is not None and old - old == 0.0:
+                    finite -= 1
+                    if finite:
+                        delta = old - mean
+                        mean -= delta / finite
+                        m2 -= delta * (old - mean)
+                    else:
+                        mean = m2 = 0.0
+            if nonfinite or count <= ddof:
+                var = nan
+            else:
+                var = max(m2, 0.0) / (count - ddof)
+            if "var" in results:
+                results["var"].append(var)
+            if "std" in results:
+                results["std"].append(math.sqrt(var))
+
+        # NaN never enters the deques or heaps, where it would break the
+        # ordering; windows holding one yield NaN.
+        if want_min:
+            if x == x:
+                while min_idx and values[min_idx[-1]] >= x:
+                    min_idx.pop()
+                min_idx.append(i)
+            if min_idx and min_idx[0] < lo:
+                min_idx.popleft()
+            results["min"].append(nan if nans else values[min_idx[0]])
+
+        if want_max:
+            if x == x:
+                while max_idx and values[max_idx[-1]] <= x:
+                    max_idx.pop()
+                max_idx.append(i)
+            if max_idx and max_idx[0] < lo:
+                max_idx.popleft()
+            results["max"].append(nan if nans else values[max_idx[0]])
+
+        if want_median:
+            if x == x:
+                median.add(x)
+            if old is not None and old == old:
+                median.remove(old)
+            if anchor:
+                median.compact(y for y in window if y == y)
+            results["median"].append(nan if nans else median.median())
+
+    return results
+
+
+def rolling_sum(data: SeriesLike, window_size: int = 3) -> list[float]:
+    """Rolling sum of values."""
+    return rolling(data, window_size, ("sum",))["sum"]
+
+
+def rolling_count(data: SeriesLike, window_size: int = 3) -> list[float]:
+    """Number of points in each rolling window."""
+    return rolling(data, window_size, ("count",))["count"]
+
+
+def rolling_min(data: SeriesLike, window_size: int = 3) -> list[float]:
+    """Rolling minimum of values."""
+    return rolling(data, window_size, ("min",))["min"]
+
+
+def rolling_max(data: SeriesLike, window_size: int = 3) -> list[float]:
+    """Rolling maximum of values."""
+    return rolling(data, window_size, ("max",))["max"]
+
+
+def rolling_var(data: SeriesLike, window_size: int = 3, ddof: int = 1) -> list[float]:
+    """Rolling variance of values."""
+    return rolling(data, window_size, ("var",), ddof)["var"]
+
+
+def rolling_std(data: SeriesLike, window_size: int = 3, ddof: int = 1) -> list[float]:
+    """Rolling standard deviation of values."""
+    return rolling(data, window_size, ("std",), ddof)["std"]
+
+
+def rolling_median(data: SeriesLike, window_size: int = 3) -> list[float]:
+    """Rolling median of values."""
+    return rolling(data, window_size, ("median",))["median"]
@@ -0,0 +1,198 @@
+"""Columnar storage for DataPoint series.
+
+A :class:`DataPointSeries` keeps timestamps as int64 epoch-nanoseconds,
+values as a contiguous float64 buffer and labels as int32 codes into a
+category table. Columns are held as ``memoryview`` objects, so slicing is
+zero-copy and NumPy can wrap them with ``numpy.frombuffer`` when installed.
+"""
+
+from array import array
+from collections.abc import Iterable, Iterator, Sequence
+from datetime import datetime, timedelta, timezone, tzinfo
+from typing import TYPE_CHECKING, Any, Literal, Optional, Union, overload
+
+if TYPE_CHECKING:
+    from .example import DataPoint
+
+NO_LABEL = -1
+
+_EPOCH = datetime(1970, 1, 1)
+_EPOCH_UTC = datetime(1970, 1, 1, tzinfo=timezone.utc)
+
+
+def datetime_to_ns(dt: datetime) -> int:
+    """Convert a datetime to integer nanoseconds since the Unix epoch.
+
+    Naive datetimes are measured from a naive epoch, so they round-trip
+    without any local-time conversion.
+    """
+    return timedelta_to_ns(dt - (_EPOCH if dt.tzinfo is None else _EPOCH_UTC))
+
+
+def timedelta_to_ns(delta: timedelta) -> int:
+    """Convert a timedelta to integer nanoseconds."""
+    return (delta.days * 86400 + delta.seconds) * 1_000_000_000 + (
+        delta.microseconds * 1000
+    )
+
+
+def ns_to_datetime(ns: int, tz: Optional[tzinfo] = None) -> datetime:
+    """Convert epoch-nanoseconds back to a datetime (microsecond precision)."""
+    delta = timedelta(microseconds=ns // 1000)
+    if tz is None:
+        return _EPOCH + delta
+    return (_EPOCH_UTC + delta).astimezone(tz)
+
+
+def _as_view(buffer: Any, fmt: Literal["q", "d", "i"]) -> "memoryview[Any]":
+    """Return a 1-D memoryview of ``buffer`` with the given item format."""
+    view = memoryview(buffer)
+    if view.format != fmt:
+        view = view.cast("B").cast(fmt)
+    return view
+
+
+class DataPointSeries:
+    """Columnar, array-backed sequence of data points.
+
+    Args:
+        timestamps: Buffer of int64 epoch-nanoseconds
+        values: Buffer of float64 values
+        codes: Buffer of int32 label codes (``NO_LABEL`` for no label),
+            defaults to no labels
+        categories: Label for each code
+        tz: Timezone of the original datetimes, ``None`` for naive
+    """
+
+    __slots__ = ("_categories", "_codes", "_timestamps", "_values", "tz")
+
+    def __init__(
+        self,
+        timestamps: Any,
+        values: Any,
+        codes: Any = None,
+        categories: Sequence[str] = (),
+        tz: Optional[tzinfo] = None,
+    ) -> None:
+        self._timestamps = _as_view(timestamps, "q")
+        self._values = _as_view(values, "d")
+        if codes is None:
+            codes = array("i", [NO_LABEL]) * len(self._values)
+        self._codes = _as_view(codes, "i")
+        self._categories = tuple(categories)
+        self.tz = tz
+
+        if not (len(self._timestamps) == len(self._values) == len(self._codes)):
+            raise ValueError(
+                "timestamps, values and codes must have the same length, got "
+                f"{len(self._timestamps)}, {len(self._values)} and {len(self._codes)}"
+            )
+
+    @classmethod
+    def from_points(cls, points: Iterable["DataPoint"]) -> "DataPointSeries":
+        """Build a series from DataPoint objects in a single pass.
+
+        Raises:
+            ValueError: If naive and timezone-aware timestamps are mixed
+        """
+        timestamps = array("q")
+        values = array("d")
+        codes = array("i")
+        interned: dict[str, int] = {}
+        tz: Optional[tzinfo] = None
+        aware: Optional[bool] = None
+
+        for point in points:
+            ts = point.timestamp
+            if aware is None:
+                aware = ts.tzinfo is not None
+                tz = ts.tzinfo
+            elif aware != (ts.tzinfo is not None):
+                raise ValueError("cannot mix naive and timezone-aware timestamps")
+            timestamps.append(datetime_to_ns(ts))
+            values.append(point.value)
+            label = point.label
+            if label is None:
+                codes.append(NO_LABEL)
+            else:
+                code = interned.get(label)
+                if code is None:
+                    code = interned[label] = len(interned)
+                codes.append(code)
+
+        return cls(timestamps, values, codes, list(interned), tz)
+
+    def to_points(self) -> list["DataPoint"]:
+        """Materialize the series as a list of DataPoint objects."""
+        return list(self)
+
+    @property
+    def timestamps(self) -> memoryview:
+        """Epoch-nanosecond timestamps (read-only view when backed by mmap)."""
+        return self._timestamps
+
+    @property
+    def values(self) -> memoryview:
+        """Float64 values."""
+        return self._values
+
+    @property
+    def codes(self) -> memoryview:
+        """Int32 label codes, ``NO_LABEL`` where a point has no label."""
+        return self._codes
+
+    @property
+    def categories(self) -> tuple[str, ...]:
+        """Label for each code."""
+        return self._categories
+
+    def decode(self, code: int) -> Optional[str]:
+        """Return the label for a code, ``None`` for ``NO_LABEL``."""
+        return None if code == NO_LABEL else self._categories[code]
+
+    def label_at(self, index: int) -> Optional[str]:
+        """Return the decoded label of the point at ``index``."""
+        return self.decode(self._codes[index])
+
+    def __len__(self) -> int:
+        return len(self._values)
+
+    @overload
+    def __getitem__(self, index: int) -> "DataPoint": ...
+
+    @overload
+    def __getitem__(self, index: slice) -> "DataPointSeries": ...
+
+    def __getitem__(
+        self, index: Union[int, slice]
+    ) -> Union["DataPoint", "DataPointSeries"]:
+        if isinstance(index, slice):
+            return DataPointSeries(
+                self._timestamps[index],
+                self._values[index],
+                self._codes[index],
+                self._categories,
+                self.tz,
+            )
+        from .example import DataPoint
+
+        return DataPoint(
+            ns_to_datetime(self._timestamps[index], self.tz),
+            self._values[index],
+            self.label_at(index),
+        )
+
+    def __iter__(self) -> Iterator["DataPoint"]:
+        from .example import DataPoint
+
+        tz = self.tz
+        categories = self._categories
+        for ts, value, code in zip(self._timestamps, self._values, self._codes):
+            yield DataPoint(
+                ns_to_datetime(ts, tz),
+                value,
+                None if code == NO_LABEL else categories[code],
+            )
+
+    def __repr__(self) -> str:
+        return f"DataPointSeries(len={len(self)}, categories={len(self._categories)})"
@@ -0,0 +1,283 @@
+"""Exponentially weighted and weighted moving averages.
+
+All functions accept the same inputs as ``calculate_moving_average`` and
+return one result per point.
+
+* :func:`ewma` / :class:`EWMA`: one O(n) pass (O(1) per ``push``), with the
+  decay given as ``alpha``, ``span`` or ``halflife``. A ``timedelta``
+  halflife decays by the actual gap between timestamps, for irregular data.
+* :func:`linear_weighted_moving_average`: weights ``1..w`` (newest
+  heaviest) in O(n) from two running sums, re-anchored exactly at the same
+  interval as the mean engine so rounding error stays bounded.
+* :func:`weighted_moving_average`: arbitrary weights, vectorized with
+  ``numpy.convolve`` for large inputs when NumPy is installed.
+"""
+
+import math
+from collections.abc import Sequence
+from datetime import timedelta
+from typing import Any, Optional, Union
+
+from . import _numpy_backend
+from ._sliding import _window_sum, anchor_interval
+from .example import (
+    NUMPY_THRESHOLD,
+    DataPoint,
+    SeriesLike,
+    _extract_timed,
+    _extract_values,
+)
+
+
+def _resolve_alpha(
+    alpha: Optional[float],
+    span: Optional[float],
+    halflife: Optional[float],
+) -> float:
+    """Return the smoothing factor from exactly one decay parameter."""
+    if sum(p is not None for p in (alpha, span, halflife)) != 1:
+        raise ValueError("pass exactly one of alpha, span or halflife")
+    if alpha is not None:
+        if not 0 < alpha <= 1:
+            raise ValueError(f"alpha must be in (0, 1], got {alpha}")
+        return alpha
+    if span is not None:
+        if span < 1:
+            raise ValueError(f"span must be at least 1, got {span}")
+        return 2 / (span + 1)
+    assert halflife is not None
+    if halflife <= 0:
+        raise ValueError(f"halflife must be positive, got {halflife}")
+    return 1 - math.exp(math.log(0.5) / halflife)
+
+
+class EWMA:
+    """Incremental exponentially weighted moving average.
+
+    Args:
+        alpha: Smoothing factor in ``(0, 1]``
+        span: Decay in terms of span, ``alpha = 2 / (span + 1)``
+        halflife: Number of points, or a ``timedelta`` to decay by the time
+            elapsed between consecutive points
+        adjust: Normalize by the sum of weights instead of using the
+            recursive form, which reduces bias in the first few results
+    """
+
+    def __init__(
+        self,
+        *,
+        alpha: Optional[float] = None,
+        span: Optional[float] = None,
+        halflife: Union[float, timedelta, None] = None,
+        adjust: bool = False,
+    ) -> None:
+        self.adjust = adjust
+        self._halflife: Optional[Any] = None
+        if isinstance(halflife, timedelta):
+            if alpha is not None or span is not None:
+                raise ValueError("pass exactly one of alpha, span or halflife")
+            self._set_time_halflife(halflife)
+        else:
+            self._alpha = _resolve_alpha(alpha, span, halflife)
+        self._numerator = 0.0
+        self._denominator = 0.0
+        self._last_time: Optional[Any] = None
+
+    @classmethod
+    def with_time_halflife(cls, halflife: Any, *, adjust: bool = False) -> "EWMA":
+        """Time-aware EWMA with ``halflife`` in the timestamps' own units.
+
+        Like ``EWMA(halflife=timedelta(...))``, but for timestamps that are
+        not datetimes, such as epoch-nanoseconds with an int halflife.
+        """
+        ewma = cls(alpha=1.0, adjust=adjust)
+        ewma._set_time_halflife(halflife)
+        return ewma
+
+    def _set_time_halflife(self, halflife: Any) -> None:
+        if halflife <= halflife * 0:
+            raise ValueError(f"halflife must be positive, got {halflife}")
+        self._halflife = halflife
+        self._alpha = 0.0
+
+    def push(self, point: DataPoint) -> float:
+        """Add a data point and return the updated average."""
+        return self.push_value(point.value, point.timestamp)
+
+    def push_value(self, value: float, timestamp: Optional[Any] = None) -> float:
+        """Add a raw value and return the updated average.
+
+        Raises:
+            ValueError: If time-aware and ``timestamp`` is missing or earlier
+                than the previous one
+        """
+        if self._halflife is None:
+            decay = 1.0 - self._alpha
+        else:
+            decay = self._time_decay(timestamp, self._halflife)
+
+        if not self._denominator:
+            self._numerator, self._denominator = value, 1.0
+        elif self.adjust:
+            self._numerator = value + decay * self._numerator
+            self._denominator = 1.0 + decay * self._denominator
+        else:
+            self._numerator = decay * self._numerator + (1.0 - decay) * value
+        return self._numerator / self._denominator
+
+    def _time_decay(self, timestamp: Any, halflife: Any) -> float:
+        if timestamp is None:
+            raise ValueError("a timedelta halflife needs timestamps")
+        last, self._last_time = self._last_time, timestamp
+        if last is None:
+            return 1.0
+        gap = timestamp - last
+        if gap < gap * 0:
+            raise ValueError("timestamps must be sorted for a time-aware EWMA")
+        return 0.5 ** (gap / halflife)
+
+
+def ewma(
+    data: SeriesLike,
+    *,
+    alpha: Optional[float] = None,
+    span: Optional[float] = None,
+    halflife: Union[float, timedelta, None] = None,
+    adjust: bool = False,
+) -> list[float]:
+    """Exponentially weighted moving average in a single pass.
+
+    Arguments are as for :class:`EWMA`. With a ``timedelta`` halflife the
+    input must be sorted by timestamp.
+
+    Returns:
+        List of averages, one per point
+    """
+    if isinstance(halflife, timedelta):
+        timestamps, values, span_units = _extract_timed(data, halflife, sort=False)
+        push = EWMA.with_time_halflife(span_units, adjust=adjust).push_value
+        return [push(v, t) for t, v in zip(timestamps, values)]
+
+    push = EWMA(alpha=alpha, span=span, halflife=halflife, adjust=adjust).push_value
+    return [push(v) for v in _extract_values(data)]
+
+
+def linear_weighted_moving_average(
+    data: SeriesLike, window_size: int = 3
+) -> list[float]:
+    """Linearly weighted moving average in O(n).
+
+    The newest point has weight ``window_size`` and the oldest weight 1.
+    Warm-up windows with ``k`` points use the ``k`` largest weights, as
+    :func:`weighted_moving_average` does.
+
+    Args:
+        data: DataPoint objects or a columnar DataPointSeries
+        window_size: Size of moving window
+
+    Returns:
+        List of weighted averages
+    """
+    if window_size < 1:
+        raise ValueError(f"window_size must be at least 1, got {window_size}")
+    values = _extract_values(data)
+    w = window_size
+    interval = anchor_interval(w)
+    result: list[float] = []
+    append = result.append
+    plain = weighted = 0.0
+    nonfinite = 0
+
+    for i in range(len(values)):
+        lo = i - w + 1 if i >= w else 0
+        count = i + 1 - lo
+        offset = w - count
+        if i % interval == 0:
+            window = values[lo : i + 1]
+            plain, nonfinite = _window_sum(window)
+            finite = [(offset + j, v) for j, v in enumerate(window, 1) if v - v == 0.0]
+            weighted = _dot([j for j, _ in finite], [v for _, v in finite])
+        else:
+            # Every weight drops by one and the new point gets ``w``; once the
+            # window is full the oldest point's weight falls to zero. Inf and
+            # NaN are counted instead of summed, as in the sliding mean.
+            x = values[i]
+            if x - x == 0.0:
+                weighted += w * x - plain
+            else:
+                weighted -= plain
+                nonfinite += 1
+                x = 0.0
+            if i >= w:
+                dropped = values[i - w]
+                if dropped - dropped != 0.0:
+                    nonfinite -= 1
+                    dropped = 0.0
+                plain += x - dropped
+            else:
+                plain += x
+
+        denominator = count * (2 * w - count + 1) / 2
+        if nonfinite:
+            weights = range(offset + 1, w + 1)
+            append(_dot(weights, values[lo : i + 1]) / denominator)
+        else:
+            append(weighted / denominator)
+
+    return result
+
+
+def weighted_moving_average(data: SeriesLike, weights: Sequence[float]) -> list[float]:
+    """Moving average with arbitrary window weights.
+
+    Args:
+        data: DataPoint objects or a columnar DataPointSeries
+        weights: One weight per window position, oldest first. Warm-up
+            windows with ``k`` points use the last ``k`` weights
+
+    Returns:
+        List of weighted averages
+
+    Raises:
+        ValueError: If ``weights`` is empty or a used weight prefix sums to 0
+    """
+    if not weights:
+        raise ValueError("weights must not be empty")
+    weights = [float(wt) for wt in weights]
+    values = _extract_values(data)
+    n, w = len(values), len(weights)
+
+    result: list[float] = []
+    for i in range(min(w - 1, n)):
+        tail = weights[w - 1 - i :]
+        result.append(_dot(tail, values[: i + 1]) / _nonzero_sum(tail))
+    if n < w:
+        return result
+
+    total = _nonzero_sum(weights)
+    if _numpy_backend.available() and n >= NUMPY_THRESHOLD:
+        import numpy as np
+
+        x = _numpy_backend.as_array(values)
+        full = np.convolve(x, np.asarray(weights[::-1]), mode="valid") / total
+        result.extend(full.tolist())
+    else:
+        for i in range(w - 1, n):
+            result.append(_dot(weights, values[i - w + 1 : i + 1]) / total)
+    return result
+
+
+def _dot(weights: Sequence[float], window: Sequence[float]) -> float:
+    products = [w * v for w, v in zip(weights, window)]
+    try:
+        return math.fsum(products)
+    except (ValueError, OverflowError):
+        # inf - inf in the window, or an intermediate overflow.
+        return sum(products)
+
+
+def _nonzero_sum(weights: Sequence[float]) -> float:
+    total = math.fsum(weights)
+    if total == 0:
+        raise ValueError("window weights must not sum to zero")
+    return total
@@ -0,0 +1,265 @@
+"""Memory-mapped on-disk format for DataPoint series.
+
+A stored series is a directory holding one raw native-endian file per
+column plus a JSON header::
+
+    series.dps/
+        header.json      format version, byte order, point count, timezone
+                         and the label dictionary
+        timestamps.i64   int64 epoch-nanoseconds
+        values.f64       float64 values
+        codes.i32        int32 label codes (-1 for no label)
+
+Keeping each column in its own file lets :class:`SeriesWriter` append
+without rewriting anything and lets :func:`open_series` map every column
+as one contiguous, zero-copy buffer. The header is replaced atomically
+after the column data is written, and its ``count`` is authoritative, so a
+crash mid-append never exposes partially written points.
+"""
+
+import json
+import mmap
+import os
+import sys
+from array import array
+from collections.abc import Iterable
+from datetime import timedelta, timezone, tzinfo
+from pathlib import Path
+from types import TracebackType
+from typing import Any, Optional, Union
+
+from .example import DataPoint
+from .series import NO_LABEL, DataPointSeries, datetime_to_ns
+
+FORMAT_VERSION = 1
+HEADER_FILE = "header.json"
+
+# Column name -> (file name, array typecode)
+COLUMNS = {
+    "timestamps": ("timestamps.i64", "q"),
+    "values": ("values.f64", "d"),
+    "codes": ("codes.i32", "i"),
+}
+
+PathLike = Union[str, os.PathLike]
+
+
+def _read_header(path: Path) -> dict[str, Any]:
+    with (path / HEADER_FILE).open() as f:
+        header = json.load(f)
+    if header.get("version") != FORMAT_VERSION:
+        raise ValueError(f"unsupported series format version {header.get('version')}")
+    if header.get("byteorder") != sys.byteorder:
+        raise ValueError(
+            f"series was written on a {header.get('byteorder')}-endian machine"
+        )
+    return header
+
+
+def _encode_tz(tz: Optional[tzinfo]) -> Optional[dict[str, Any]]:
+    """Header form of a timezone: an IANA name or a fixed UTC offset."""
+    if tz is None:
+        return None
+    name = getattr(tz, "key", None)  # zoneinfo.ZoneInfo
+    if isinstance(name, str):
+        return {"name": name}
+    offset = tz.utcoffset(None) if isinstance(tz, timezone) else None
+    return {"offset": offset.total_seconds() if offset is not None else 0.0}
+
+
+def _decode_tz(header: dict[str, Any]) -> Optional[tzinfo]:
+    if not header["aware"]:
+        return None
+    tz = header.get("tz") or {}
+    if "name" in tz:
+        from zoneinfo import ZoneInfo
+
+        return ZoneInfo(tz["name"])
+    return timezone(timedelta(seconds=tz.get("offset", 0.0)))
+
+
+def _map_column(path: Path, typecode: str, count: int) -> Any:
+    """Return a read-only buffer over the first ``count`` items of a column."""
+    if count == 0:
+        return array(typecode)
+    with path.open("rb") as f:
+        mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    return memoryview(mapped)[: count * array(typecode).itemsize]
+
+
+def open_series(path: PathLike) -> DataPointSeries:
+    """Open a stored series as memory-mapped, zero-copy columns.
+
+    Opening is O(1) regardless of size; pages are read from disk only as
+    the returned series (or slices of it) are accessed.
+
+    Args:
+        path: Series directory written by :class:`SeriesWriter`
+
+    Returns:
+        A DataPointSeries backed by read-only memory maps, in the timezone
+        of the first point written. Zone names and fixed offsets are kept;
+        other tzinfo implementations come back as UTC
+
+    Raises:
+        ValueError: If the format version or byte order is not supported
+    """
+    root = Path(path)
+    header = _read_header(root)
+    count = header["count"]
+    columns = {
+        name: _map_column(root / filename, typecode, count)
+        for name, (filename, typecode) in COLUMNS.items()
+    }
+    return DataPointSeries(
+        columns["timestamps"],
+        columns["values"],
+        columns["codes"],
+        header["labels"],
+        _decode_tz(header),
+    )
+
+
+class SeriesWriter:
+    """Append-only writer for the on-disk series format.
+
+    Points are buffered in memory and written on :meth:`flush`, which also
+    happens every ``buffer_size`` points and on close. Opening an existing
+    series resumes appending after its last committed point.
+
+    Args:
+        path: Series directory, created if missing
+        buffer_size: Points buffered before an automatic flush
+    """
+
+    def __init__(self, path: PathLike, buffer_size: int = 65_536) -> None:
+        self.path = Path(path)
+        self.buffer_size = buffer_size
+        self._buffers = {name: array(code) for name, (_, code) in COLUMNS.items()}
+
+        if (self.path / HEADER_FILE).exists():
+            header = _read_header(self.path)
+            self._count = header["count"]
+            self._aware: Optional[bool] = header["aware"]
+            self._tz = _decode_tz(header)
+            self._labels: list[str] = header["labels"]
+        else:
+            self.path.mkdir(parents=True, exist_ok=True)
+            self._count = 0
+            self._aware = None
+            self._tz = None
+            self._labels = []
+        self._codes = {label: code for code, label in enumerate(self._labels)}
+
+        # Drop bytes from any append that never reached the header.
+        for filename, typecode in COLUMNS.values():
+            with (self.path / filename).open("ab") as f:
+                f.truncate(self._count * array(typecode).itemsize)
+        self._write_header()
+
+    @property
+    def count(self) -> int:
+        """Points written or buffered so far."""
+        return self._count + len(self._buffers["values"])
+
+    def append(self, point: DataPoint) -> None:
+        """Buffer one data point.
+
+        Raises:
+            ValueError: If its timezone awareness differs from earlier points
+        """
+        self._check_aware(point.timestamp.tzinfo)
+        self._buffers["timestamps"].append(datetime_to_ns(point.timestamp))
+        self._buffers["values"].append(point.value)
+        self._buffers["codes"].append(self._intern(point.label))
+        if len(self._buffers["values"]) >= self.buffer_size:
+            self.flush()
+
+    def extend(self, points: Union[Iterable[DataPoint], DataPointSeries]) -> None:
+        """Buffer many data points.
+
+        Columnar input is copied column by column without building
+        DataPoint objects.
+        """
+        if not isinstance(points, DataPointSeries):
+            for point in points:
+                self.append(point)
+            return
+        if not len(points):
+            return
+
+        self._check_aware(points.tz)
+        remap = [self._intern(label) for label in points.categories]
+        self._buffers["timestamps"].frombytes(points.timestamps.tobytes())
+        self._buffers["values"].frombytes(points.values.tobytes())
+        self._buffers["codes"].extend(
+            NO_LABEL if code == NO_LABEL else remap[code] for code in points.codes
+        )
+        if len(self._buffers["values"]) >= self.buffer_size:
+            self.flush()
+
+    def _check_aware(self, tz: Optional[tzinfo]) -> None:
+        aware = tz is not None
+        if self._aware is None:
+            self._aware = aware
+            self._tz = tz
+        elif aware != self._aware:
+            raise ValueError("cannot mix naive and timezone-aware timestamps")
+
+    def _intern(self, label: Optional[str]) -> int:
+        if label is None:
+            return NO_LABEL
+        code = self._codes.get(label)
+        if code is None:
+            code = self._codes[label] = len(self._labels)
+            self._labels.append(label)
+        return code
+
+    def flush(self) -> None:
+        """Write buffered points to the column files and commit the header."""
+        pending = len(self._buffers["values"])
+        if not pending:
+            return
+        for name, (filename, _) in COLUMNS.items():
+            with (self.path / filename).open("ab") as f:
+                self._buffers[name].tofile(f)
+            del self._buffers[name][:]
+        self._count += pending
+        self._write_header()
+
+    def close(self) -> None:
+        """Flush any buffered points."""
+        self.flush()
+
+    def _write_header(self) -> None:
+        header = {
+            "version": FORMAT_VERSION,
+            "byteorder": sys.byteorder,
+            "count": self._count,
+            "aware": self._aware,
+            "tz": _encode_tz(self._tz),
+            "labels": self._labels,
+        }
+        tmp = self.path / (HEADER_FILE + ".tmp")
+        with tmp.open("w") as f:
+            json.dump(header, f)
+        tmp.replace(self.path / HEADER_FILE)
+
+    def __enter__(self) -> "SeriesWriter":
+        return self
+
+    def __exit__(
+        self,
+        exc_type: Optional[type[BaseException]],
+        exc: Optional[BaseException],
+        tb: Optional[TracebackType],
+    ) -> None:
+        self.close()
+
+
+def write_series(
+    path: PathLike, data: Union[Iterable[DataPoint], DataPointSeries]
+) -> None:
+    """Write (or append) data points to a stored series."""
+    with SeriesWriter(path) as writer:
+        writer.extend(data)
@@ -0,0 +1,206 @@
+"""Incremental moving averages for live ingestion.
+
+:class:`MovingAverage` keeps a ring buffer of the last ``window_size``
+values and the same compensated running sum as the batch engine, anchored
+at the same positions, so pushing a series point by point reproduces
+``calculate_moving_average`` exactly.
+"""
+
+import heapq
+import math
+from collections.abc import Iterable, Iterator
+from datetime import datetime
+
+from ._sliding import _window_sum, anchor_interval
+from .example import DEDUPE_KEEP, DataPoint
+
+
+class MovingAverage:
+    """Stateful trailing-window mean with O(1) updates and bounded memory.
+
+    Args:
+        window_size: Number of trailing points per window
+    """
+
+    def __init__(self, window_size: int) -> None:
+        if window_size < 1:
+            raise ValueError(f"window_size must be at least 1, got {window_size}")
+        self.window_size = window_size
+        self._interval = anchor_interval(window_size)
+        self._buffer = [0.0] * window_size
+        self._count = 0
+        self._total = 0.0
+        self._comp = 0.0
+        self._nonfinite = 0
+
+    @property
+    def count(self) -> int:
+        """Number of values pushed so far."""
+        return self._count
+
+    @property
+    def window(self) -> list[float]:
+        """Values currently in the window, oldest first."""
+        if self._count < self.window_size:
+            return self._buffer[: self._count]
+        pos = self._count % self.window_size
+        return self._buffer[pos:] + self._buffer[:pos]
+
+    def push(self, point: DataPoint) -> float:
+        """Add a data point and return the mean of the current window."""
+        return self.push_value(point.value)
+
+    def push_value(self, value: float) -> float:
+        """Add a raw value and return the mean of the current window."""
+        w = self.window_size
+        i = self._count
+        pos = i % w
+        old = self._buffer[pos]
+        self._buffer[pos] = value
+        self._count = i + 1
+        filled = i + 1 if i < w else w
+
+        if i % self._interval == 0:
+            self._total, self._nonfinite = _window_sum(
+                self._buffer if i >= w - 1 else self._buffer[:filled]
+            )
+            self._comp = 0.0
+        else:
+            self._add(value, 1)
+            if i >= w:
+                self._add(-old, -1)
+
+        if self._nonfinite:
+            return sum(self._buffer[:filled]) / filled
+        return (self._total + self._comp) / filled
+
+    def extend(self, values: Iterable[float]) -> list[float]:
+        """Push many raw values and return the mean after each one.
+
+        Accumulators pickle with their full state, so a batch can be
+        extended in another process and the returned accumulator used in
+        place of this one.
+        """
+        push = self.push_value
+        return [push(value) for value in values]
+
+    def _add(self, x: float, direction: int) -> None:
+        """Neumaier-add ``x`` to the running sum, tracking inf/nan separately."""
+        if not math.isfinite(x):
+            self._nonfinite += direction
+            return
+        total = self._total
+        t = total + x
+        if abs(total) >= abs(x):
+            self._comp += (total - t) + x
+        else:
+            self._comp += (x - t) + total
+        self._total = t
+
+    def reset(self) -> None:
+        """Forget all pushed values."""
+        self._buffer = [0.0] * self.window_size
+        self._count = 0
+        self._total = self._comp = 0.0
+        self._nonfinite = 0
+
+
+def iter_moving_average(
+    data: Iterable[DataPoint], window_size: int = 3
+) -> Iterator[float]:
+    """Lazily yield the moving average after each data point.
+
+    Consumes ``data`` one point at a time, so only the current window is
+    held in memory.
+
+    Args:
+        data: Any iterable of DataPoint objects, including generators
+        window_size: Size of moving window
+
+    Yields:
+        The moving average ending at each point
+    """
+    push = MovingAverage(window_size).push_value
+    for point in data:
+        yield push(point.value)
+
+
+TIEBREAKS = ("label", "source")
+
+
+def _by_time(point: DataPoint) -> datetime:
+    return point.timestamp
+
+
+def _by_time_and_label(point: DataPoint) -> tuple[datetime, bool, str]:
+    # Unlabeled points first; never compares None with a string.
+    return point.timestamp, point.label is not None, point.label or ""
+
+
+def merge_series(
+    *iterables: Iterable[DataPoint], tiebreak: str = "label"
+) -> Iterator[DataPoint]:
+    """Lazily merge time-ordered sources into one time-ordered stream.
+
+    A heap holds one pending point per source, so memory is O(k) for k
+    sources and each point costs O(log k). The result can be passed
+    straight to ``calculate_moving_average`` or ``iter_moving_average``.
+
+    Args:
+        iterables: Sources each sorted by timestamp, such as lists,
+            generators or DataPointSeries
+        tiebreak: Order of points with equal timestamps: ``"label"`` sorts
+            them by label, unlabeled first; ``"source"`` keeps the order of
+            the sources as passed
+
+    Yields:
+        Every point from every source, ordered by timestamp
+    """
+    if tiebreak not in TIEBREAKS:
+        raise ValueError(f"tiebreak must be one of {TIEBREAKS}, got {tiebreak!r}")
+    key = _by_time_and_label if tiebreak == "label" else _by_time
+    return heapq.merge(*iterables, key=key)
+
+
+def dedupe_points(data: Iterable[DataPoint], keep: str = "last") -> Iterator[DataPoint]:
+    """Lazily collapse consecutive points that share a timestamp.
+
+    Only adjacent duplicates are merged, so input should be sorted by
+    timestamp. A point is emitted once the next timestamp is seen, so the
+    stream is delayed by at most one point.
+
+    Args:
+        data: Any iterable of DataPoint objects
+        keep: ``"first"``, ``"last"`` or ``"mean"``; a mean point carries the
+            label of the last duplicate
+
+    Yields:
+        One DataPoint per distinct timestamp
+    """
+    if keep not in DEDUPE_KEEP:
+        raise ValueError(f"dedupe must be one of {DEDUPE_KEEP}, got {keep!r}")
+    return _dedupe_points(data, keep)
+
+
+def _dedupe_points(data: Iterable[DataPoint], keep: str) -> Iterator[DataPoint]:
+    pending = None
+    total = 0.0
+    repeats = 0
+    for point in data:
+        if pending is None or point.timestamp != pending.timestamp:
+            if pending is not None:
+                yield _collapsed(pending, total, repeats, keep)
+            pending, total, repeats = point, point.value, 1
+        else:
+            if keep != "first":
+                pending = point
+            total += point.value
+            repeats += 1
+    if pending is not None:
+        yield _collapsed(pending, total, repeats, keep)
+
+
+def _collapsed(point: DataPoint, total: float, repeats: int, keep: str) -> DataPoint:
+    if keep != "mean" or repeats == 1:
+        return point
+    return DataPoint(point.timestamp, total / repeats, point.label)
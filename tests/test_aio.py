@@ -0,0 +1,115 @@
+import asyncio
+import math
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from datetime import datetime, timedelta
+
+import pytest
+
+from src.aio import amoving_average, amoving_average_batches
+from src.example import DataPoint, calculate_moving_average
+from src.streaming import MovingAverage
+
+
+def _points(n):
+    start = datetime(2024, 1, 1)
+    return [DataPoint(start + timedelta(seconds=i), math.cos(i / 5)) for i in range(n)]
+
+
+async def _source(points, delay=None):
+    for point in points:
+        if delay is not None:
+            await asyncio.sleep(delay)
+        yield point
+
+
+async def _collect(agen):
+    return [item async for item in agen]
+
+
+def test_matches_batch_engine():
+    points = _points(1_000)
+    result = asyncio.run(_collect(amoving_average(_source(points), 7, batch_size=64)))
+    assert result == calculate_moving_average(points, 7, backend="python")
+
+
+def test_micro_batches_are_bounded():
+    points = _points(500)
+    batches = asyncio.run(
+        _collect(amoving_average_batches(_source(points), 3, batch_size=50))
+    )
+    assert sum(len(b) for b in batches) == 500
+    assert max(len(b) for b in batches) <= 50
+
+
+def test_slow_source_is_not_delayed_by_batching():
+    batches = asyncio.run(
+        _collect(amoving_average_batches(_source(_points(3), delay=0.01), 2))
+    )
+    assert [len(b) for b in batches] == [1, 1, 1]
+
+
+@pytest.mark.parametrize("pool", [ThreadPoolExecutor, ProcessPoolExecutor])
+def test_executor_offload_matches(pool):
+    points = _points(2_000)
+
+    async def run():
+        with pool(max_workers=1) as executor:
+            return await _collect(
+                amoving_average(
+                    _source(points),
+                    10,
+                    batch_size=256,
+                    executor=executor,
+                    offload_size=16,
+                )
+            )
+
+    assert asyncio.run(run()) == calculate_moving_average(points, 10, backend="python")
+
+
+def test_source_errors_propagate_after_pending_results():
+    async def failing():
+        for point in _points(3):
+            yield point
+        raise RuntimeError("feed dropped")
+
+    seen = []
+
+    async def run():
+        async for mean in amoving_average(failing(), 2):
+            seen.append(mean)
+
+    with pytest.raises(RuntimeError, match="feed dropped"):
+        asyncio.run(run())
+    assert len(seen) == 3
+
+
+def test_backpressure_pauses_source():
+    produced = []
+
+    async def source():
+        for point in _points(100):
+            produced.append(point)
+            yield point
+
+    async def run():
+        agen = amoving_average_batches(source(), 2, batch_size=1, queue_size=4)
+        await agen.__anext__()
+        await asyncio.sleep(0.01)
+        ahead = len(produced)
+        await agen.aclose()
+        return ahead
+
+    assert asyncio.run(run()) <= 1 + 4 + 2
+
+
+def test_extend_matches_push():
+    values = [p.value for p in _points(50)]
+    pushed = MovingAverage(4)
+    extended = MovingAverage(4)
+    assert extended.extend(values) == [pushed.push_value(v) for v in values]
+
+
+def test_invalid_batch_size():
+    with pytest.raises(ValueError, match="batch_size"):
+        asyncio.run(_collect(amoving_average(_source([]), 3, batch_size=0)))
@@ -0,0 +1,91 @@
+import math
+from datetime import datetime, timedelta
+
+import pytest
+
+from src.cache import MovingAverageCache
+from src.example import DataPoint, calculate_moving_average
+from src.series import DataPointSeries
+
+
+def _points(n, offset=0):
+    start = datetime(2024, 1, 1)
+    return [
+        DataPoint(start + timedelta(seconds=i), math.sin(i / 3) * 1e3)
+        for i in range(offset, offset + n)
+    ]
+
+
+def test_hit_returns_same_result():
+    cache = MovingAverageCache()
+    points = _points(100)
+    first = cache.moving_average(points, 5)
+    second = cache.moving_average(points, 5)
+    assert first == second == calculate_moving_average(points, 5)
+    assert (cache.stats.misses, cache.stats.hits) == (1, 1)
+
+
+def test_append_extends_bit_exactly():
+    cache = MovingAverageCache()
+    points = _points(5_000)
+    cache.moving_average(points, 7, backend="python")
+    points.extend(_points(4_000, offset=5_000))
+    result = cache.moving_average(points, 7, backend="python")
+    assert cache.stats.extends == 1
+    assert result == calculate_moving_average(points, 7, backend="python")
+
+
+def test_columnar_append_with_stable_key():
+    pytest.importorskip("numpy")
+    cache = MovingAverageCache()
+    points = _points(10_000)
+    cache.moving_average(DataPointSeries.from_points(points), 50, key="cpu")
+    points.extend(_points(3_000, offset=10_000))
+    series = DataPointSeries.from_points(points)
+    result = cache.moving_average(series, 50, key="cpu")
+    assert cache.stats.extends == 1
+    assert result == calculate_moving_average(series, 50)
+
+
+def test_modified_tail_or_version_recomputes():
+    cache = MovingAverageCache()
+    points = _points(20)
+    cache.moving_average(points, 3)
+    points[-1] = DataPoint(points[-1].timestamp, 0.0)
+    points.append(DataPoint(points[-1].timestamp, 1.0))
+    assert cache.moving_average(points, 3) == calculate_moving_average(points, 3)
+    assert cache.stats.extends == 0
+    cache.moving_average(points, 3, version=2)
+    assert cache.stats.misses == 3
+
+
+def test_windows_are_cached_separately_and_invalidated():
+    cache = MovingAverageCache()
+    points = _points(10)
+    cache.moving_average(points, 2, key="a")
+    cache.moving_average(points, 3, key="a")
+    assert len(cache) == 2
+    cache.invalidate("a", 2)
+    assert len(cache) == 1
+    cache.invalidate("a")
+    assert len(cache) == 0
+    assert cache.nbytes == 0
+
+
+def test_lru_eviction_respects_byte_bound():
+    points = _points(100)
+    entry_bytes = 100 * 8 + 3 * 8
+    cache = MovingAverageCache(max_bytes=2 * entry_bytes)
+    cache.moving_average(points, 3, key="a")
+    cache.moving_average(points, 3, key="b")
+    cache.moving_average(points, 3, key="a")
+    cache.moving_average(points, 3, key="c")
+    assert cache.stats.evictions == 1
+    assert cache.nbytes <= cache.max_bytes
+    cache.moving_average(points, 3, key="a")
+    assert cache.stats.hits == 2
+
+
+def test_rejects_time_windows():
+    with pytest.raises(ValueError, match="integer"):
+        MovingAverageCache().moving_average(_points(3), timedelta(seconds=2))
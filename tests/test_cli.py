@@ -0,0 +1,93 @@
+import io
+import json
+import random
+import subprocess
+import sys
+from datetime import datetime, timedelta
+
+import pytest
+
+from src.cli import main
+from src.example import DataPoint, calculate_moving_average
+from src.series import DataPointSeries
+
+
+def _csv(rows):
+    lines = ["timestamp,value"] + [f"{ts},{value}" for ts, value in rows]
+    return "\n".join(lines) + "\n"
+
+
+def _averages(output):
+    lines = output.strip().splitlines()
+    assert lines[0] == "timestamp,moving_average"
+    return [float(line.rsplit(",", 1)[1]) for line in lines[1:]]
+
+
+@pytest.mark.parametrize("batch_size", [1, 2, 1000])
+def test_streams_across_batches(tmp_path, capsys, batch_size):
+    path = tmp_path / "points.csv"
+    path.write_text(_csv([(i, float(i)) for i in range(7)]))
+    assert main([str(path), "-w", "3", "--batch-size", str(batch_size)]) == 0
+    assert _averages(capsys.readouterr().out) == [0, 0.5, 1, 2, 3, 4, 5]
+
+
+@pytest.mark.parametrize("backend", ["python", "numpy"])
+@pytest.mark.parametrize("window", [5, 5000])
+def test_output_independent_of_batch_size(tmp_path, capsys, backend, window):
+    if backend == "numpy":
+        pytest.importorskip("numpy")
+    rng = random.Random(window)
+    values = [rng.uniform(-1e6, 1e6) for _ in range(9000)]
+    path = tmp_path / "points.csv"
+    path.write_text(_csv([(i, repr(v)) for i, v in enumerate(values)]))
+    start = datetime(1970, 1, 1)
+    series = DataPointSeries.from_points(
+        [DataPoint(start + timedelta(seconds=i), v) for i, v in enumerate(values)]
+    )
+    expected = calculate_moving_average(series, window, backend=backend)
+
+    for batch_size in (7, 1000, 100_000):
+        args = [str(path), "-w", str(window), "-b", backend]
+        assert main([*args, "--batch-size", str(batch_size)]) == 0
+        assert _averages(capsys.readouterr().out) == expected
+
+
+def test_reads_stdin_and_jsonl_files(tmp_path, capsys, monkeypatch):
+    jsonl = tmp_path / "more.jsonl"
+    jsonl.write_text(
+        "\n".join(json.dumps({"ts": 10 + i, "v": 10.0}) for i in range(2)) + "\n"
+    )
+    monkeypatch.setattr(sys, "stdin", io.StringIO("ts,v\n1,2\n2,4\n"))
+    code = main(
+        ["-", str(jsonl), "-w", "2", "--timestamp-field", "ts", "--value-field", "v"]
+    )
+    assert code == 0
+    output = capsys.readouterr().out
+    assert _averages(output) == [2.0, 3.0, 7.0, 10.0]
+    assert "1970-01-01T00:00:01," in output
+
+
+def test_stats_and_errors(tmp_path, capsys):
+    path = tmp_path / "points.csv"
+    path.write_text(_csv([(1, 1.0)]))
+    assert main([str(path), "--stats"]) == 0
+    assert "1 points in" in capsys.readouterr().err
+
+    path.write_text("time,value\n1,1\n")
+    assert main([str(path)]) == 1
+    assert "missing field 'timestamp'" in capsys.readouterr().err
+
+    with pytest.raises(SystemExit):
+        main([str(path), "--window", "0"])
+
+
+def test_module_entry_point(tmp_path):
+    path = tmp_path / "points.csv"
+    path.write_text(_csv([(1, 1.0), (2, 3.0)]))
+    completed = subprocess.run(  # noqa: S603
+        [sys.executable, "-m", "src", str(path), "-w", "2"],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    assert _averages(completed.stdout) == [1.0, 2.0]
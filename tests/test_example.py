@@ -1,5 +1,17 @@
-from datetime import datetime
-from src.example import DataPoint, calculate_moving_average
+import math
+import random
+import statistics
+from datetime import datetime, timedelta
+
+import pytest
+
+from src.example import (
+    DataPoint,
+    calculate_moving_average,
+    calculate_moving_averages,
+)
+from src.series import DataPointSeries
+
 
 def test_moving_average():
     data = [
@@ -8,6 +20,116 @@ def test_moving_average():
         DataPoint(datetime(2024, 1, 3), 3.0, "C"),
         DataPoint(datetime(2024, 1, 4), 4.0, "D"),
     ]
-    
+
     result = calculate_moving_average(data, window_size=2)
     assert result == [1.0, 1.5, 2.5, 3.5]
+
+
+def test_moving_average_matches_statistics_mean():
+    rng = random.Random(0)
+    values = [rng.uniform(-1e6, 1e6) for _ in range(5000)]
+    data = [DataPoint(datetime(2024, 1, 1), v) for v in values]
+
+    result = calculate_moving_average(data, window_size=50)
+    for i in range(0, len(values), 37):
+        expected = statistics.mean(values[max(0, i - 49) : i + 1])
+        assert math.isclose(result[i], expected, rel_tol=0, abs_tol=1e-9)
+
+
+def test_moving_average_non_finite_values_leave_window():
+    values = [1.0, float("nan"), 2.0, 3.0, float("inf"), 5.0, 7.0]
+    data = [DataPoint(datetime(2024, 1, 1), v) for v in values]
+
+    result = calculate_moving_average(data, window_size=2)
+    assert result[0] == 1.0
+    assert math.isnan(result[1]) and math.isnan(result[2])
+    assert result[3] == 2.5
+    assert result[4] == math.inf and result[5] == math.inf
+    assert result[6] == 6.0
+
+
+def test_moving_average_rejects_empty_window():
+    with pytest.raises(ValueError):
+        calculate_moving_average([], window_size=0)
+
+
+@pytest.mark.parametrize("backend", ["python", "numpy"])
+def test_moving_averages_match_single_window_calls(backend):
+    if backend == "numpy":
+        pytest.importorskip("numpy")
+    start = datetime(2024, 1, 1)
+    data = [DataPoint(start, float(i % 17) * 0.1) for i in range(5_000)]
+    result = calculate_moving_averages(data, [5, 15, 60, 5], backend=backend)
+    assert list(result) == [5, 15, 60]
+    for window_size, averages in result.items():
+        assert averages == calculate_moving_average(data, window_size, backend=backend)
+
+
+def test_moving_averages_reject_invalid_window():
+    with pytest.raises(ValueError):
+        calculate_moving_averages([], [3, 0])
+
+
+@pytest.mark.parametrize("backend", ["python", "numpy"])
+def test_moving_average_skipna(backend):
+    if backend == "numpy":
+        pytest.importorskip("numpy")
+    nan = math.nan
+    values = [1.0, nan, 3.0, nan, nan, nan, 8.0, math.inf, 2.0]
+    data = [DataPoint(datetime(2024, 1, 1), v) for v in values]
+    result = calculate_moving_average(data, 3, backend=backend, skipna=True)
+    expected = [1.0, 1.0, 2.0, 3.0, 3.0, nan, 8.0, math.inf, math.inf]
+    assert result == pytest.approx(expected, nan_ok=True)
+
+    strict = calculate_moving_average(
+        data, 3, backend=backend, skipna=True, min_periods=2
+    )
+    assert strict == pytest.approx(
+        [nan, nan, 2.0, nan, nan, nan, nan, math.inf, math.inf], nan_ok=True
+    )
+
+
+def test_moving_average_skipna_matches_numpy_on_long_input():
+    pytest.importorskip("numpy")
+    rng = random.Random(1)
+    values = [
+        math.nan if rng.random() < 0.2 else rng.uniform(-1, 1) for _ in range(9000)
+    ]
+    data = [DataPoint(datetime(2024, 1, 1), v) for v in values]
+    python = calculate_moving_average(data, 25, backend="python", skipna=True)
+    fast = calculate_moving_average(data, 25, backend="numpy", skipna=True)
+    assert fast == pytest.approx(python, abs=1e-12, nan_ok=True)
+
+
+def test_moving_average_min_periods_validation():
+    data = [DataPoint(datetime(2024, 1, 1), 1.0)]
+    with pytest.raises(ValueError, match="skipna"):
+        calculate_moving_average(data, 3, min_periods=2)
+    with pytest.raises(ValueError, match="min_periods"):
+        calculate_moving_average(data, 3, skipna=True, min_periods=4)
+
+
+def test_moving_average_dedupe():
+    t0, t1, t2 = (datetime(2024, 1, day) for day in (1, 2, 3))
+    data = [
+        DataPoint(t0, 1.0),
+        DataPoint(t1, 2.0),
+        DataPoint(t1, 4.0),
+        DataPoint(t2, 6.0),
+    ]
+    assert calculate_moving_average(data, 2, dedupe="last") == [1.0, 2.5, 5.0]
+    assert calculate_moving_average(data, 2, dedupe="first") == [1.0, 1.5, 4.0]
+    assert calculate_moving_average(data, 2, dedupe="mean") == [1.0, 2.0, 4.5]
+    series = DataPointSeries.from_points(data)
+    assert calculate_moving_average(series, 2, dedupe="mean", backend="python") == [
+        1.0,
+        2.0,
+        4.5,
+    ]
+    assert calculate_moving_average(data, timedelta(days=2), dedupe="last") == [
+        1.0,
+        2.5,
+        5.0,
+    ]
+    with pytest.raises(ValueError, match="dedupe"):
+        calculate_moving_average(data, 2, dedupe="median")
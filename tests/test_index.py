@@ -0,0 +1,83 @@
+import math
+import random
+import statistics
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from src.example import DataPoint
+from src.index import IndexedSeries
+from src.series import DataPointSeries
+
+START = datetime(2024, 1, 1)
+
+
+def _points(values, tz=None):
+    start = START.replace(tzinfo=tz)
+    return [DataPoint(start + timedelta(minutes=i), v) for i, v in enumerate(values)]
+
+
+def _at(minutes, tz=None):
+    return START.replace(tzinfo=tz) + timedelta(minutes=minutes)
+
+
+def test_range_queries_match_direct_computation():
+    rng = random.Random(3)
+    values = [rng.uniform(-1e6, 1e6) for _ in range(2_000)]
+    index = IndexedSeries(_points(values))
+    for _ in range(100):
+        a, b = sorted(rng.randrange(2_001) for _ in range(2))
+        window = values[a:b]
+        assert index.count(_at(a), _at(b)) == len(window)
+        assert index.sum(_at(a), _at(b)) == pytest.approx(math.fsum(window), abs=1e-6)
+        if window:
+            assert index.mean(_at(a), _at(b)) == pytest.approx(
+                statistics.mean(window), rel=1e-12, abs=1e-9
+            )
+
+
+def test_unbounded_and_empty_ranges():
+    index = IndexedSeries(_points([1.0, 2.0, 3.0]))
+    assert index.mean() == 2.0
+    assert index.sum(_at(1)) == 5.0
+    assert index.count(end=_at(1)) == 1
+    assert math.isnan(index.mean(_at(10), _at(20)))
+    assert index.count(_at(2), _at(1)) == 0
+
+
+def test_columnar_and_unsorted_input():
+    points = _points([4.0, 5.0, 6.0], tz=timezone.utc)
+    columnar = IndexedSeries(DataPointSeries.from_points(points))
+    shuffled = IndexedSeries(list(reversed(points)))
+    for index in (columnar, shuffled):
+        assert index.mean(_at(0, timezone.utc), _at(2, timezone.utc)) == 4.5
+    with pytest.raises(ValueError, match="naive"):
+        columnar.mean(_at(0), _at(2))
+
+
+def test_append_extends_prefix():
+    index = IndexedSeries(_points([1.0, 2.0]))
+    index.append(DataPoint(_at(2), 6.0))
+    index.extend([DataPoint(_at(3), 7.0)])
+    assert len(index) == 4
+    assert index.mean(_at(2)) == 6.5
+    with pytest.raises(ValueError, match="precede"):
+        index.append(DataPoint(_at(0), 1.0))
+
+
+def test_non_finite_values_only_affect_their_ranges():
+    index = IndexedSeries(_points([1.0, math.nan, 3.0, 5.0]))
+    assert math.isnan(index.sum())
+    assert index.mean(_at(2)) == 4.0
+
+
+def test_query_many():
+    index = IndexedSeries(_points([1.0, 2.0, 3.0, 4.0]))
+    ranges = [(_at(0), _at(2)), (_at(2), None), (_at(9), None)]
+    assert index.query_many(ranges, "sum") == [3.0, 7.0, 0.0]
+    assert index.query_many(ranges, "count") == [2, 2, 0]
+    means = index.query_many(ranges)
+    assert means[:2] == [1.5, 3.5]
+    assert math.isnan(means[2])
+    with pytest.raises(ValueError, match="statistic"):
+        index.query_many(ranges, "median")
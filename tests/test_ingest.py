@@ -0,0 +1,81 @@
+import io
+import json
+from datetime import datetime, timezone
+
+from src.example import DataPoint, calculate_moving_average
+from src.ingest import (
+    parse_timestamp,
+    read_csv_points,
+    read_csv_series,
+    read_jsonl_points,
+    read_jsonl_series,
+)
+from src.streaming import iter_moving_average
+
+CSV = """timestamp,value,label
+2024-01-01T00:00:00,1.0,a
+2024-01-01T00:00:01,2.0,b
+2024-01-01T00:00:02,3.0,
+1704067203,4.0,a
+"""
+
+EXPECTED = [
+    DataPoint(datetime(2024, 1, 1, 0, 0, 0), 1.0, "a"),
+    DataPoint(datetime(2024, 1, 1, 0, 0, 1), 2.0, "b"),
+    DataPoint(datetime(2024, 1, 1, 0, 0, 2), 3.0),
+    DataPoint(datetime(2024, 1, 1, 0, 0, 3), 4.0, "a"),
+]
+
+
+def test_parse_timestamp_formats():
+    assert parse_timestamp("2024-01-01T00:00:00") == datetime(2024, 1, 1)
+    assert parse_timestamp("2024-01-01T00:00:00Z") == datetime(
+        2024, 1, 1, tzinfo=timezone.utc
+    )
+    assert parse_timestamp(1704067200) == datetime(2024, 1, 1)
+    assert parse_timestamp("1704067200500", epoch_unit="ms") == datetime(
+        2024, 1, 1, 0, 0, 0, 500_000
+    )
+
+
+def test_read_csv_points(tmp_path):
+    path = tmp_path / "points.csv"
+    path.write_text(CSV)
+
+    points = list(read_csv_points(path))
+    assert points == EXPECTED
+    assert points[0].label is points[3].label
+
+
+def test_read_jsonl_points_feeds_streaming():
+    rows = [
+        json.dumps({"timestamp": p.timestamp.isoformat(), "value": p.value})
+        for p in EXPECTED
+    ]
+    source = io.StringIO("\n".join(rows) + "\n\n")
+
+    assert list(iter_moving_average(read_jsonl_points(source), 2)) == [
+        1.0,
+        1.5,
+        2.5,
+        3.5,
+    ]
+
+
+def test_read_series_batches():
+    batches = list(read_csv_series(io.StringIO(CSV), batch_size=3))
+
+    assert [len(b) for b in batches] == [3, 1]
+    assert batches[0].to_points() + batches[1].to_points() == EXPECTED
+    assert calculate_moving_average(batches[0], 2) == [1.0, 1.5, 2.5]
+
+
+def test_read_jsonl_series_custom_fields():
+    source = ['{"t": 0, "v": 1.5, "k": "x"}', '{"t": 60, "v": 2.5, "k": "x"}']
+
+    (batch,) = read_jsonl_series(
+        source, timestamp_field="t", value_field="v", label_field="k"
+    )
+    assert list(batch.timestamps) == [0, 60_000_000_000]
+    assert list(batch.values) == [1.5, 2.5]
+    assert batch.categories == ("x",)
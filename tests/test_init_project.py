@@ -0,0 +1,232 @@
+"""Tests for the non-interactive project scaffolding engine."""
+
+import importlib.util
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+import tomli
+
+SCRIPT = Path(__file__).resolve().parent.parent / "scripts" / "init_project.py"
+spec = importlib.util.spec_from_file_location("init_project", SCRIPT)
+init_project = importlib.util.module_from_spec(spec)
+sys.modules["init_project"] = init_project
+spec.loader.exec_module(init_project)
+
+PYPROJECT = """\
+[project]
+name = "python-collab-template"
+description = "Add your description here"
+authors = []
+
+[project.scripts]
+moving-average = "src.cli:main"
+
+[tool.hatch.build.targets.wheel]
+packages = ["src"]
+
+[tool.ruff.lint.isort]
+known-first-party = ["python-collab-template"]
+"""
+
+
+TEMPLATE_TEST = """\
+from src.example import VALUE
+assert scripts == {"moving-average": "src.cli:main"}
+assert not (root / "src").exists()
+"""
+
+
+def make_template(root: Path) -> Path:
+    (root / "src").mkdir(parents=True)
+    (root / "tests").mkdir()
+    (root / "scripts").mkdir()
+    (root / "templates").mkdir()
+    (root / "pyproject.toml").write_text(PYPROJECT)
+    (root / "Makefile").write_text(
+        "MODULE_NAME := src\nIMAGE_NAME = registry/python-collab-template\n"
+    )
+    (root / "src" / "__init__.py").write_text("")
+    (root / "src" / "example.py").write_text("VALUE = 1\n")
+    (root / "tests" / "test_example.py").write_text(
+        "from src.example import VALUE\nfrom src import example\n"
+    )
+    (root / "tests" / "test_cli.py").write_text(
+        'import src.cli\nlogger = "src.cli"\nrun([python, "-m", "src", path])\n'
+    )
+    (root / "tests" / "test_docs_setup.py").write_text("")
+    (root / "tests" / "test_init_project.py").write_text(TEMPLATE_TEST)
+    (root / "scripts" / "benchmark.py").write_text("from src.example import VALUE\n")
+    (root / "benchmarks").mkdir()
+    (root / "benchmarks" / "baseline.json").write_text("{}\n")
+    for template in init_project.DOCS_TEMPLATES:
+        path = root / template
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text("{project_name} by {author_name}\n")
+    return root
+
+
+def config(**overrides):
+    values = {
+        "project_name": "my-service",
+        "author_name": "Ada",
+        "author_email": "ada@example.com",
+        "github_username": "ada",
+        "docs": False,
+        "setup": False,
+        "git": False,
+    }
+    values.update(overrides)
+    return init_project.ProjectConfig.from_mapping(values)
+
+
+def test_render_template_is_single_pass(tmp_path):
+    (tmp_path / "single-pass.template").write_text(
+        "# {project_name}\n{author_name} ${{ github.token }} {other}\n"
+    )
+    rendered = init_project.render_template(
+        "single-pass.template",
+        {"project_name": "{author_name}", "author_name": "Ada"},
+        tmp_path,
+    )
+    assert rendered == "# {author_name}\nAda ${{ github.token }} {other}\n"
+
+
+def test_compile_template_is_cached_across_project_copies(tmp_path):
+    for name in ("one", "two"):
+        (tmp_path / name).mkdir()
+        (tmp_path / name / "cached.template").write_text("{project_name}\n")
+    assert init_project.compile_template(
+        "cached.template", tmp_path / "one"
+    ) is init_project.compile_template("cached.template", tmp_path / "two")
+
+
+def test_initialize_keeps_example_code_under_new_module(tmp_path):
+    root = make_template(tmp_path / "project")
+    init_project.initialize(root, config(), log=lambda message: None)
+
+    pyproject = tomli.loads((root / "pyproject.toml").read_text())
+    assert pyproject["project"]["name"] == "my-service"
+    assert pyproject["project"]["authors"] == [
+        {"name": "Ada", "email": "ada@example.com"}
+    ]
+    assert pyproject["project"]["scripts"] == {"moving-average": "my_service.cli:main"}
+    assert pyproject["tool"]["hatch"]["build"]["targets"]["wheel"]["packages"] == [
+        "my_service"
+    ]
+    makefile = (root / "Makefile").read_text()
+    assert "MODULE_NAME := my_service" in makefile
+    assert "registry/my-service" in makefile
+
+    assert not (root / "src").exists()
+    assert (root / "my_service" / "example.py").exists()
+    assert (root / "tests" / "test_example.py").read_text() == (
+        "from my_service.example import VALUE\nfrom my_service import example\n"
+    )
+    assert (
+        (root / "scripts" / "benchmark.py").read_text().startswith("from my_service.")
+    )
+    assert (root / "tests" / "test_cli.py").read_text() == (
+        'import my_service.cli\nlogger = "src.cli"\n'
+        'run([python, "-m", "my_service", path])\n'
+    )
+    assert (root / "tests" / "test_init_project.py").read_text() == TEMPLATE_TEST
+
+
+@pytest.mark.parametrize("mode", ["minimal", "remove"])
+def test_initialize_replaces_example_code(tmp_path, mode):
+    root = make_template(tmp_path / "project")
+    init_project.initialize(root, config(example_code=mode), log=lambda message: None)
+
+    assert sorted(p.name for p in (root / "my_service").iterdir()) == (
+        ["__init__.py", "example.py"] if mode == "minimal" else ["__init__.py"]
+    )
+    assert not (root / "scripts" / "benchmark.py").exists()
+    assert not (root / "benchmarks").exists()
+    assert (root / "tests" / "test_docs_setup.py").exists()
+    assert (root / "tests" / "test_init_project.py").read_text() == TEMPLATE_TEST
+    assert (root / "tests" / "test_example.py").exists() == (mode == "minimal")
+    pyproject = tomli.loads((root / "pyproject.toml").read_text())
+    assert "scripts" not in pyproject["project"]
+
+
+def test_documentation_is_rendered_into_the_transaction(tmp_path):
+    root = make_template(tmp_path / "project")
+    init_project.initialize(root, config(docs=True), log=lambda message: None)
+    assert (root / "docs" / "index.md").read_text() == "my-service by Ada\n"
+    pyproject = tomli.loads((root / "pyproject.toml").read_text())
+    assert pyproject["dependency-groups"]["dev"] == init_project.DOCS_DEPENDENCIES
+
+
+def test_batch_initializes_projects_in_parallel(tmp_path, monkeypatch, capsys):
+    monkeypatch.setattr(init_project, "TEMPLATE_ROOT", make_template(tmp_path / "t"))
+    (tmp_path / "existing").mkdir()
+    batch = tmp_path / "batch.toml"
+    batch.write_text(
+        """\
+[defaults]
+author_name = "Ada"
+author_email = "ada@example.com"
+github_username = "ada"
+docs = false
+setup = false
+git = false
+
+[[projects]]
+path = "svc-one"
+
+[[projects]]
+path = "svc-two"
+example_code = "remove"
+
+[[projects]]
+path = "existing"
+"""
+    )
+    assert init_project.main(["--batch", str(batch), "--jobs", "2"]) == 1
+    assert (tmp_path / "svc-one" / "svc_one" / "example.py").exists()
+    assert not (tmp_path / "svc-two" / "svc_two" / "example.py").exists()
+    assert "already exists" in capsys.readouterr().out
+
+
+def test_copy_template_skips_gitignored_files(tmp_path):
+    root = make_template(tmp_path / "t")
+    (root / ".gitignore").write_text("venv/\n.env\n*.egg-info/\n")
+    for ignored in ("venv/bin/python", ".env", "pkg.egg-info/PKG-INFO"):
+        (root / ignored).parent.mkdir(parents=True, exist_ok=True)
+        (root / ignored).write_text("")
+
+    assert init_project.template_files(root) is None
+    init_project.copy_template(root, tmp_path / "copy")
+    subprocess.run(["git", "init", "-q", str(root)], check=True)  # noqa: S603, S607
+    assert "src/example.py" in init_project.template_files(root)
+    init_project.copy_template(root, tmp_path / "git-copy")
+
+    for copy in (tmp_path / "copy", tmp_path / "git-copy"):
+        assert (copy / "src" / "example.py").read_text() == "VALUE = 1\n"
+        assert (copy / ".gitignore").exists()
+        assert not (copy / "venv").exists()
+        assert not (copy / ".env").exists()
+        assert not (copy / "pkg.egg-info").exists()
+        assert not (copy / ".git").exists()
+
+
+def test_config_validation():
+    with pytest.raises(init_project.ScaffoldError, match="unknown config keys"):
+        init_project.ProjectConfig.from_mapping({"colour": "blue"})
+    with pytest.raises(init_project.ScaffoldError, match="example_code"):
+        init_project.ProjectConfig(example_code="some")
+    assert init_project.ProjectConfig(example_code="3").example_code == "remove"
+
+
+def test_main_renames_template_checkout_and_renders_docs(tmp_path, monkeypatch):
+    root = make_template(tmp_path / "python-collab-template")
+    monkeypatch.chdir(root)
+    args = ["-y", "--name", "demo-svc", "--author-name", "Ada", "--no-setup"]
+
+    assert init_project.main([*args, "--no-git"]) == 0
+    project = tmp_path / "demo-svc"
+    assert not root.exists()
+    assert (project / "docs" / "index.md").read_text() == "demo-svc by Ada\n"
+    assert (project / "demo_svc" / "example.py").exists()
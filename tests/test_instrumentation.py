@@ -0,0 +1,109 @@
+import io
+import logging
+import tracemalloc
+from datetime import datetime
+
+import pytest
+
+from src import instrumentation
+from src.example import DataPoint, calculate_moving_average
+from src.instrumentation import (
+    LoggingSink,
+    MetricsRegistry,
+    PrometheusFileSink,
+    instrument,
+    profile,
+)
+from src.rolling import rolling
+
+POINTS = [DataPoint(datetime(2024, 1, 1), float(i)) for i in range(100)]
+
+
+def test_disabled_by_default():
+    assert not instrumentation.enabled()
+
+
+def test_instrument_records_calls():
+    with instrument() as registry:
+        calculate_moving_average(POINTS, 5, backend="python")
+        rolling(POINTS, 5, ("max",))
+
+    assert not instrumentation.enabled()
+    first, second = registry.records
+    assert (first.function, first.points, first.window_size, first.backend) == (
+        "calculate_moving_average",
+        100,
+        5,
+        "python",
+    )
+    assert first.seconds >= 0 and first.allocated_bytes is None
+    assert second.function == "rolling"
+    assert registry.totals[("calculate_moving_average", "python")].points == 100
+
+
+def test_track_allocations():
+    with instrument(track_allocations=True) as registry:
+        calculate_moving_average(POINTS, 5, backend="python")
+
+    assert registry.records[0].allocated_bytes > 0
+
+
+def test_track_allocations_stops_tracing_when_call_raises():
+    def fail():
+        raise ValueError("boom")
+
+    with instrument(track_allocations=True):
+        with pytest.raises(ValueError, match="boom"):
+            instrumentation.record_call("f", 1, 1, "python", fail)
+
+    assert not tracemalloc.is_tracing()
+
+
+def test_logging_and_prometheus_sinks(tmp_path, caplog):
+    path = tmp_path / "rolling.prom"
+    with caplog.at_level(logging.INFO, logger=instrumentation.__name__):
+        with instrument(LoggingSink(), PrometheusFileSink(path)):
+            calculate_moving_average(POINTS, 5, backend="python")
+
+    assert "calculate_moving_average backend=python points=100" in caplog.text
+    text = path.read_text()
+    assert "# TYPE rolling_calls_total counter" in text
+    assert (
+        'rolling_points_total{function="calculate_moving_average",backend="python"} 100'
+        in text
+    )
+
+
+def test_configure_from_env(monkeypatch):
+    monkeypatch.setattr(instrumentation, "_sinks", [])
+    installed = instrumentation.configure_from_env("memory, log")
+
+    assert installed[0] is instrumentation.default_registry
+    assert isinstance(installed[1], LoggingSink)
+    with pytest.raises(ValueError):
+        instrumentation.configure_from_env("statsd")
+
+
+def test_configure_from_env_lenient_skips_unknown(monkeypatch, caplog):
+    monkeypatch.setattr(instrumentation, "_sinks", [])
+    with caplog.at_level(logging.WARNING, logger=instrumentation.__name__):
+        installed = instrumentation.configure_from_env("mem, memory", strict=False)
+
+    assert installed == [instrumentation.default_registry]
+    assert "'mem'" in caplog.text
+
+
+@pytest.mark.parametrize("mode", ["cprofile", "tracemalloc"])
+def test_profile_emits_summary(mode):
+    stream = io.StringIO()
+    with profile(mode, limit=5, stream=stream) as report:
+        calculate_moving_average(POINTS, 5)
+
+    assert report.summary.startswith(f"{mode} profile")
+    assert stream.getvalue() == report.summary
+    if mode == "tracemalloc":
+        assert report.peak_bytes > 0
+
+
+def test_registry_prometheus_empty():
+    assert "# HELP rolling_calls_total" in MetricsRegistry().to_prometheus()
@@ -0,0 +1,62 @@
+import math
+import random
+from datetime import datetime
+
+import pytest
+
+from src import _numpy_backend, _sliding, example
+from src.example import DataPoint, calculate_moving_average
+from src.series import DataPointSeries
+
+np = pytest.importorskip("numpy")
+
+
+def random_values(n, seed=0):
+    rng = random.Random(seed)
+    return [rng.uniform(-1e3, 1e3) for _ in range(n)]
+
+
+@pytest.mark.parametrize("window_size", [1, 2, 7, 4096, 6000])
+def test_numpy_matches_python_engine(window_size):
+    values = random_values(20_000)
+
+    expected = _sliding.sliding_mean(values, window_size)
+    result = _numpy_backend.sliding_mean(values, window_size)
+
+    assert len(result) == len(expected)
+    assert np.allclose(result, expected, rtol=0, atol=1e-9)
+
+
+def test_numpy_aligned_subrange_is_exact():
+    values = random_values(20_000)
+    start = _sliding.anchor_interval(5) * 2
+
+    full = _numpy_backend.sliding_mean(values, 5)
+    assert _numpy_backend.sliding_mean(values, 5, start) == full[start:]
+
+
+def test_numpy_non_finite_windows():
+    values = [1.0, math.nan, 2.0, 3.0, math.inf, -math.inf, 5.0, 7.0]
+
+    result = _numpy_backend.sliding_mean(values, 2)
+    expected = _sliding.sliding_mean(values, 2)
+    assert np.array_equal(result, expected, equal_nan=True)
+
+
+def test_auto_backend_uses_numpy_for_series(monkeypatch):
+    calls = []
+    monkeypatch.setitem(
+        example._KERNELS,
+        "numpy",
+        lambda values, window_size: calls.append(window_size) or [],
+    )
+    points = [DataPoint(datetime(2024, 1, 1), 1.0)]
+
+    calculate_moving_average(DataPointSeries.from_points(points), 3)
+    calculate_moving_average(points, 3)
+    assert calls == [3]
+
+
+def test_unknown_backend_rejected():
+    with pytest.raises(ValueError):
+        calculate_moving_average([], 3, backend="gpu")
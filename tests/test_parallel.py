@@ -0,0 +1,83 @@
+import random
+from datetime import datetime
+
+from src import _numpy_backend
+from src.example import DataPoint, calculate_moving_average
+from src.parallel import _batch, grouped_moving_average, parallel_moving_average
+from src.series import DataPointSeries
+
+
+def mixed_points(n=3000, labels=("a", "b", "c", None)):
+    return [
+        DataPoint(datetime(2024, 1, 1), float(i % 17), labels[i % len(labels)])
+        for i in range(n)
+    ]
+
+
+def expected_by_label(points, window_size):
+    groups = {}
+    for p in points:
+        groups.setdefault(p.label, []).append(p)
+    return {
+        key: calculate_moving_average(group, window_size, backend="python")
+        for key, group in groups.items()
+    }
+
+
+def test_grouped_in_process():
+    points = mixed_points()
+
+    result = grouped_moving_average(points, 5, max_workers=1, backend="python")
+    assert result == expected_by_label(points, 5)
+    assert list(result) == ["a", "b", "c", None]
+
+
+def test_grouped_process_pool():
+    points = mixed_points()
+
+    result = grouped_moving_average(
+        points, 5, max_workers=2, chunk_size=500, backend="python"
+    )
+    assert result == expected_by_label(points, 5)
+
+
+def test_grouped_columnar_and_callable_key():
+    points = mixed_points(200)
+    series = DataPointSeries.from_points(points)
+
+    assert grouped_moving_average(series, 4, backend="python") == expected_by_label(
+        points, 4
+    )
+    by_parity = grouped_moving_average(points, 2, by=lambda p: p.value % 2 == 0)
+    assert set(by_parity) == {True, False}
+
+
+def test_small_groups_are_batched():
+    groups = [("big", [0.0] * 10), ("x", [0.0] * 3), ("y", [0.0] * 3), ("z", [0.0])]
+
+    tasks = _batch(groups, chunk_size=5)
+    assert [[key for key, _ in task] for task in tasks] == [["big"], ["x", "y"], ["z"]]
+
+
+def test_parallel_matches_sequential_exactly():
+    rng = random.Random(5)
+    values = [rng.uniform(-1e6, 1e6) for _ in range(30_000)]
+    points = [DataPoint(datetime(2024, 1, 1), v) for v in values]
+
+    for backend in ("python", "numpy"):
+        if backend == "numpy" and not _numpy_backend.available():
+            continue
+        expected = calculate_moving_average(points, 100, backend=backend)
+        result = parallel_moving_average(
+            values, 100, max_workers=2, chunk_size=5000, backend=backend
+        )
+        assert result == expected
+
+
+def test_parallel_columnar_via_calculate_moving_average():
+    points = mixed_points(9000)
+    series = DataPointSeries.from_points(points)
+
+    assert calculate_moving_average(
+        series, 10, workers=2, backend="python"
+    ) == calculate_moving_average(points, 10, backend="python")
@@ -0,0 +1,118 @@
+import math
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from src.example import DataPoint, calculate_moving_average
+from src.resample import Bar, resample, resample_ohlc
+from src.series import DataPointSeries
+
+START = datetime(2024, 1, 1)
+
+
+def _points(offsets_and_values, tz=None):
+    start = START.replace(tzinfo=tz)
+    return [DataPoint(start + timedelta(seconds=s), v) for s, v in offsets_and_values]
+
+
+POINTS = _points([(0, 1.0), (20, 3.0), (59, 2.0), (60, 10.0), (185, 4.0), (200, 8.0)])
+
+
+@pytest.mark.parametrize(
+    ("how", "expected"),
+    [
+        ("mean", [2.0, 10.0, 6.0]),
+        ("sum", [6.0, 10.0, 12.0]),
+        ("count", [3.0, 1.0, 2.0]),
+        ("first", [1.0, 10.0, 4.0]),
+        ("last", [2.0, 10.0, 8.0]),
+        ("min", [1.0, 10.0, 4.0]),
+        ("max", [3.0, 10.0, 8.0]),
+    ],
+)
+def test_resample_aggregates(how, expected):
+    result = list(resample(POINTS, timedelta(minutes=1), how))
+    assert [p.value for p in result] == expected
+    assert [p.timestamp for p in result] == [
+        START,
+        START + timedelta(minutes=1),
+        START + timedelta(minutes=3),
+    ]
+
+
+def test_resample_columnar_matches_list():
+    series = DataPointSeries.from_points(POINTS)
+    assert list(resample(series, timedelta(minutes=1))) == list(
+        resample(POINTS, timedelta(minutes=1))
+    )
+    aware = _points([(0, 1.0), (90, 2.0)], tz=timezone.utc)
+    assert list(resample(DataPointSeries.from_points(aware), timedelta(minutes=1))) == (
+        list(resample(aware, timedelta(minutes=1)))
+    )
+
+
+@pytest.mark.parametrize(
+    ("fill", "gap"), [("nan", math.nan), ("zero", 0.0), ("ffill", 10.0)]
+)
+def test_resample_fill(fill, gap):
+    result = list(resample(POINTS, timedelta(minutes=1), fill=fill))
+    assert [p.timestamp for p in result] == [
+        START + timedelta(minutes=i) for i in range(4)
+    ]
+    if math.isnan(gap):
+        assert math.isnan(result[2].value)
+    else:
+        assert result[2].value == gap
+
+
+def test_resample_origin_shifts_buckets():
+    result = list(
+        resample(
+            POINTS, timedelta(minutes=1), "count", origin=START + timedelta(seconds=30)
+        )
+    )
+    assert [p.value for p in result] == [2.0, 2.0, 2.0]
+    assert [p.timestamp for p in result] == [
+        START - timedelta(seconds=30),
+        START + timedelta(seconds=30),
+        START + timedelta(seconds=150),
+    ]
+
+
+def test_resample_ohlc():
+    bars = list(resample_ohlc(POINTS, timedelta(minutes=1), fill="ffill"))
+    assert bars[0] == Bar(START, 1.0, 3.0, 1.0, 2.0, 3)
+    assert bars[2] == Bar(START + timedelta(minutes=2), 10.0, 10.0, 10.0, 10.0, 0)
+    assert bars[3] == Bar(START + timedelta(minutes=3), 4.0, 8.0, 4.0, 8.0, 2)
+
+
+def test_resample_is_lazy_and_chains():
+    def generate():
+        yield from POINTS
+        raise AssertionError("consumed too far")
+
+    first = next(resample(generate(), timedelta(minutes=1)))
+    assert first.value == 2.0
+    averaged = calculate_moving_average(resample(POINTS, timedelta(minutes=1)), 2)
+    assert averaged == [2.0, 6.0, 8.0]
+
+
+def test_resample_validation():
+    with pytest.raises(ValueError, match="how"):
+        resample(POINTS, timedelta(minutes=1), "median")
+    with pytest.raises(ValueError, match="fill"):
+        resample(POINTS, timedelta(minutes=1), fill="bfill")
+    with pytest.raises(ValueError, match="positive"):
+        resample(POINTS, timedelta(0))
+    with pytest.raises(ValueError, match="sorted"):
+        list(resample(list(reversed(POINTS)), timedelta(minutes=1)))
+    assert list(resample([], timedelta(minutes=1))) == []
+
+
+def test_resample_rejects_unsorted_points_within_a_bucket():
+    points = _points([(30, 1.0), (10, 2.0)])
+    with pytest.raises(ValueError, match="sorted"):
+        list(resample_ohlc(points, timedelta(minutes=1)))
+    series = DataPointSeries.from_points(points)
+    with pytest.raises(ValueError, match="sorted"):
+        list(resample(series, timedelta(minutes=1), "first"))
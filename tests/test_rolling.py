@@ -0,0 +1,111 @@
+import math
+import random
+import statistics
+from datetime import datetime
+
+import pytest
+
+from src.example import DataPoint, calculate_moving_average
+from src.rolling import STATISTICS, rolling, rolling_median, rolling_min
+from src.series import DataPointSeries
+
+
+def make_points(values):
+    return [DataPoint(datetime(2024, 1, 1), v) for v in values]
+
+
+def windows(values, window_size):
+    return [values[max(0, i - window_size + 1) : i + 1] for i in range(len(values))]
+
+
+@pytest.mark.parametrize("window_size", [1, 2, 5, 64])
+def test_rolling_matches_brute_force(window_size):
+    rng = random.Random(window_size)
+    # Small integer range to exercise duplicate handling in min/max/median.
+    values = [float(rng.randint(-20, 20)) for _ in range(9000)]
+
+    result = rolling(make_points(values), window_size, STATISTICS)
+
+    for i, window in enumerate(windows(values, window_size)):
+        assert result["count"][i] == len(window)
+        assert result["min"][i] == min(window)
+        assert result["max"][i] == max(window)
+        assert result["median"][i] == statistics.median(window)
+        assert math.isclose(result["sum"][i], math.fsum(window), abs_tol=1e-9)
+        if len(window) > 1:
+            expected = statistics.variance(window)
+            assert math.isclose(result["var"][i], expected, abs_tol=1e-9)
+            assert result["std"][i] == math.sqrt(result["var"][i])
+        else:
+            assert math.isnan(result["var"][i])
+
+
+def test_rolling_mean_matches_moving_average():
+    rng = random.Random(0)
+    points = make_points([rng.uniform(-1e3, 1e3) for _ in range(5000)])
+
+    assert rolling(points, 7)["mean"] == calculate_moving_average(
+        points, 7, backend="python"
+    )
+
+
+def test_rolling_accepts_series():
+    points = make_points([3.0, 1.0, 2.0, 5.0])
+    series = DataPointSeries.from_points(points)
+
+    assert rolling_min(series, 2) == [3.0, 1.0, 1.0, 2.0]
+    assert rolling_median(series, 3) == [3.0, 2.0, 2.0, 2.0]
+
+
+def test_median_heaps_stay_bounded():
+    values = [float(i) for i in range(20_000)]
+
+    assert rolling_median(make_points(values), 4)[-1] == 19_997.5
+
+
+def test_unknown_statistic_rejected():
+    with pytest.raises(ValueError):
+        rolling([], 3, ("mode",))
+
+
+def test_rolling_non_finite_values_leave_window():
+    values = [1.0] * 40
+    values[10] = math.nan
+    values[20] = math.inf
+
+    result = rolling(make_points(values), 3, STATISTICS)
+
+    for i in range(10, 13):
+        assert all(
+            math.isnan(result[name][i]) for name in STATISTICS if name != "count"
+        )
+    for i in range(20, 23):
+        assert result["sum"][i] == result["mean"][i] == result["max"][i] == math.inf
+        assert result["min"][i] == result["median"][i] == 1.0
+        assert math.isnan(result["var"][i])
+    for i in [*range(13, 20), *range(23, 40)]:
+        assert result["sum"][i] == 3.0 and result["var"][i] == 0.0
+        assert result["min"][i] == result["max"][i] == result["median"][i] == 1.0
+
+
+def test_rolling_non_finite_mean_matches_moving_average():
+    rng = random.Random(1)
+    specials = [math.nan, math.inf, -math.inf]
+    values = [rng.uniform(-1e3, 1e3) for _ in range(10_000)]
+    for i in rng.sample(range(len(values)), 40):
+        values[i] = rng.choice(specials)
+    values[4095], values[4096] = math.inf, -math.inf
+    points = make_points(values)
+
+    result = rolling(points, 5, STATISTICS)
+    expected = calculate_moving_average(points, 5, backend="python")
+    assert [str(v) for v in result["mean"]] == [str(v) for v in expected]
+    for i, window in enumerate(windows(values, 5)):
+        finite = [v for v in window if math.isfinite(v)]
+        if any(math.isnan(v) for v in window):
+            assert math.isnan(result["median"][i]) and math.isnan(result["min"][i])
+        else:
+            assert result["median"][i] == statistics.median(window)
+            assert result["min"][i] == min(window)
+        if len(finite) < len(window):
+            assert math.isnan(result["var"][i])
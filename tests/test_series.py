@@ -0,0 +1,61 @@
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from src.example import DataPoint, calculate_moving_average
+from src.series import DataPointSeries, datetime_to_ns, ns_to_datetime
+
+
+def make_points():
+    return [
+        DataPoint(datetime(2024, 1, 1, 0, 0, i), float(i), "A" if i % 2 else "B")
+        for i in range(6)
+    ] + [DataPoint(datetime(2024, 1, 1, 0, 1), 6.0)]
+
+
+def test_round_trip_points():
+    points = make_points()
+    series = DataPointSeries.from_points(points)
+
+    assert len(series) == len(points)
+    assert series.categories == ("B", "A")
+    assert series.to_points() == points
+
+
+def test_slicing_is_zero_copy():
+    series = DataPointSeries.from_points(make_points())
+    tail = series[2:5]
+
+    assert list(tail.values) == [2.0, 3.0, 4.0]
+    assert tail.values.obj is series.values.obj
+    assert tail[0] == make_points()[2]
+
+
+def test_moving_average_accepts_series():
+    points = make_points()
+    series = DataPointSeries.from_points(points)
+
+    assert calculate_moving_average(series, 3) == calculate_moving_average(points, 3)
+
+
+def test_timezone_aware_round_trip():
+    tz = timezone(timedelta(hours=2))
+    points = [DataPoint(datetime(2024, 1, 1, 12, tzinfo=tz), 1.0)]
+
+    assert DataPointSeries.from_points(points).to_points() == points
+
+
+def test_mixed_naive_and_aware_rejected():
+    points = [
+        DataPoint(datetime(2024, 1, 1), 1.0),
+        DataPoint(datetime(2024, 1, 1, tzinfo=timezone.utc), 2.0),
+    ]
+    with pytest.raises(ValueError):
+        DataPointSeries.from_points(points)
+
+
+def test_ns_conversion_round_trip():
+    dt = datetime(2031, 5, 6, 7, 8, 9, 123456)
+
+    assert datetime_to_ns(datetime(1970, 1, 1, 0, 0, 1)) == 1_000_000_000
+    assert ns_to_datetime(datetime_to_ns(dt)) == dt
@@ -0,0 +1,169 @@
+import math
+from datetime import datetime, timedelta
+
+import pytest
+
+from src.example import DataPoint
+from src.series import DataPointSeries
+from src.smoothing import (
+    EWMA,
+    ewma,
+    linear_weighted_moving_average,
+    weighted_moving_average,
+)
+
+
+def _points(values, step=timedelta(minutes=1)):
+    start = datetime(2024, 1, 1)
+    return [DataPoint(start + i * step, v) for i, v in enumerate(values)]
+
+
+def _naive_ewma(values, alpha, adjust):
+    if adjust:
+        out = []
+        for i in range(len(values)):
+            weights = [(1 - alpha) ** (i - j) for j in range(i + 1)]
+            out.append(
+                sum(w * v for w, v in zip(weights, values[: i + 1])) / sum(weights)
+            )
+        return out
+    out = [values[0]]
+    for x in values[1:]:
+        out.append((1 - alpha) * out[-1] + alpha * x)
+    return out
+
+
+@pytest.mark.parametrize("adjust", [False, True])
+def test_ewma_matches_definition(adjust):
+    values = [3.0, 1.0, 4.0, 1.0, 5.0, 9.0, 2.0, 6.0]
+    result = ewma(_points(values), span=3, adjust=adjust)
+    assert result == pytest.approx(_naive_ewma(values, 0.5, adjust))
+
+
+def test_ewma_decay_parameters_agree():
+    points = _points([1.0, 2.0, 7.0, 3.0])
+    alpha = 1 - 0.5 ** (1 / 2)
+    assert ewma(points, halflife=2) == pytest.approx(ewma(points, alpha=alpha))
+    assert ewma(points, span=1) == [p.value for p in points]
+
+
+def test_ewma_push_matches_batch():
+    points = _points([2.0, 4.0, 8.0, 16.0])
+    acc = EWMA(alpha=0.3, adjust=True)
+    assert [acc.push(p) for p in points] == ewma(points, alpha=0.3, adjust=True)
+
+
+def test_ewma_time_aware_uses_gaps():
+    start = datetime(2024, 1, 1)
+    points = [
+        DataPoint(start, 0.0),
+        DataPoint(start + timedelta(hours=1), 10.0),
+        DataPoint(start + timedelta(hours=3), 0.0),
+    ]
+    result = ewma(points, halflife=timedelta(hours=1))
+    # Decay 0.5 after one halflife, 0.25 after two.
+    assert result == pytest.approx([0.0, 5.0, 1.25])
+    columnar = ewma(DataPointSeries.from_points(points), halflife=timedelta(hours=1))
+    assert columnar == pytest.approx(result)
+
+
+def test_ewma_with_time_halflife_uses_timestamp_units():
+    acc = EWMA.with_time_halflife(60)
+    assert [acc.push_value(v, t) for t, v in [(0, 0.0), (60, 10.0), (180, 0.0)]] == (
+        pytest.approx([0.0, 5.0, 1.25])
+    )
+    with pytest.raises(ValueError, match="positive"):
+        EWMA.with_time_halflife(0)
+
+
+def test_ewma_time_aware_regular_matches_count_halflife():
+    points = _points([1.0, 5.0, 2.0, 8.0], step=timedelta(minutes=5))
+    by_time = ewma(points, halflife=timedelta(minutes=10), adjust=True)
+    assert by_time == pytest.approx(ewma(points, halflife=2, adjust=True))
+
+
+def test_ewma_validation():
+    points = _points([1.0, 2.0])
+    with pytest.raises(ValueError, match="exactly one"):
+        ewma(points)
+    with pytest.raises(ValueError, match="exactly one"):
+        ewma(points, alpha=0.5, span=3)
+    with pytest.raises(ValueError, match="alpha"):
+        ewma(points, alpha=0)
+    with pytest.raises(ValueError, match="sorted"):
+        ewma(list(reversed(points)), halflife=timedelta(minutes=1))
+    with pytest.raises(ValueError, match="timestamps"):
+        EWMA(halflife=timedelta(minutes=1)).push_value(1.0)
+
+
+def test_linear_wma_matches_dot_products():
+    values = [float((i * 37) % 11) for i in range(50)]
+    for w in (1, 2, 5, 49, 60):
+        expected = []
+        for i in range(len(values)):
+            window = values[max(0, i - w + 1) : i + 1]
+            weights = range(w - len(window) + 1, w + 1)
+            expected.append(sum(a * b for a, b in zip(weights, window)) / sum(weights))
+        assert linear_weighted_moving_average(_points(values), w) == pytest.approx(
+            expected
+        )
+
+
+def test_linear_wma_stays_accurate_past_anchor():
+    values = [1e9 if i % 2 else 1e-3 for i in range(10_000)]
+    result = linear_weighted_moving_average(_points(values), 3)
+    assert result[-1] == pytest.approx((1e9 + 2e-3 + 3e9) / 6, rel=1e-12)
+    assert result[-2] == pytest.approx((1e-3 + 2e9 + 3e-3) / 6, rel=1e-12)
+
+
+def test_linear_wma_non_finite_values_leave_window():
+    values = [1.0] * 40
+    values[10] = math.nan
+    values[20] = math.inf
+    result = linear_weighted_moving_average(_points(values), 3)
+    assert all(math.isnan(v) for v in result[10:13])
+    assert all(v == math.inf for v in result[20:23])
+    assert result[13:20] == [1.0] * 7
+    assert result[23:] == [1.0] * 17
+
+
+def test_linear_wma_opposite_infinities_at_anchor():
+    values = [1.0] * 4100
+    values[4095], values[4096] = math.inf, -math.inf
+    result = linear_weighted_moving_average(_points(values), 3)
+    assert result[4095] == math.inf
+    assert math.isnan(result[4096]) and math.isnan(result[4097])
+    assert result[4098:] == [-math.inf, 1.0]
+    assert math.isnan(weighted_moving_average(_points(values[4095:4097]), [1, 1])[1])
+
+
+def test_weighted_moving_average():
+    points = _points([1.0, 2.0, 3.0, 4.0])
+    assert weighted_moving_average(points, [1, 2, 3]) == pytest.approx(
+        [1.0, (1 * 2 + 2 * 3) / 5, 14 / 6, 20 / 6]
+    )
+    assert weighted_moving_average(points, [1, 2, 3]) == pytest.approx(
+        linear_weighted_moving_average(points, 3)
+    )
+    assert weighted_moving_average(points, [1, 1]) == pytest.approx(
+        [1.0, 1.5, 2.5, 3.5]
+    )
+
+
+def test_weighted_moving_average_numpy_matches_python(monkeypatch):
+    pytest.importorskip("numpy")
+    from src import smoothing
+
+    values = [math.sin(i / 7) for i in range(20_000)]
+    series = DataPointSeries.from_points(_points(values))
+    fast = weighted_moving_average(series, [0.5, -1.0, 2.0, 4.0])
+    monkeypatch.setattr(smoothing, "NUMPY_THRESHOLD", len(values) + 1)
+    slow = weighted_moving_average(series, [0.5, -1.0, 2.0, 4.0])
+    assert fast == pytest.approx(slow, abs=1e-12)
+
+
+def test_weighted_moving_average_validation():
+    with pytest.raises(ValueError, match="empty"):
+        weighted_moving_average(_points([1.0]), [])
+    with pytest.raises(ValueError, match="zero"):
+        weighted_moving_average(_points([1.0, 2.0]), [1.0, -1.0])
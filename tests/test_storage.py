@@ -0,0 +1,98 @@
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from src.example import DataPoint, calculate_moving_average
+from src.series import DataPointSeries
+from src.storage import COLUMNS, SeriesWriter, open_series, write_series
+
+
+def make_points(n, start=0, tz=None):
+    t = datetime(2024, 1, 1, tzinfo=tz)
+    return [
+        DataPoint(t + timedelta(seconds=i), float(i), ["a", "b", None][i % 3])
+        for i in range(start, start + n)
+    ]
+
+
+def test_round_trip(tmp_path):
+    points = make_points(10)
+    write_series(tmp_path / "s", points)
+
+    series = open_series(tmp_path / "s")
+    assert series.to_points() == points
+    assert series.values.readonly
+
+
+def test_append_across_writers(tmp_path):
+    path = tmp_path / "s"
+    write_series(path, make_points(5))
+    with SeriesWriter(path, buffer_size=2) as writer:
+        writer.extend(make_points(4, start=5))
+        writer.append(DataPoint(datetime(2024, 1, 2), 1.0, "c"))
+
+    series = open_series(path)
+    assert len(series) == 10
+    assert series.to_points()[:9] == make_points(9)
+    assert series.categories == ("a", "b", "c")
+
+
+def test_columnar_extend_and_moving_average(tmp_path):
+    points = make_points(50, tz=timezone.utc)
+    write_series(tmp_path / "s", DataPointSeries.from_points(points))
+
+    series = open_series(tmp_path / "s")
+    assert series.to_points() == points
+    assert calculate_moving_average(series[10:20], 3) == calculate_moving_average(
+        points[10:20], 3
+    )
+
+
+def test_uncommitted_bytes_are_discarded(tmp_path):
+    path = tmp_path / "s"
+    write_series(path, make_points(3))
+    with open(path / COLUMNS["values"][0], "ab") as f:
+        f.write(b"\0" * 5)
+
+    with SeriesWriter(path) as writer:
+        writer.append(make_points(1, start=3)[0])
+    assert open_series(path).to_points() == make_points(4)
+
+
+def test_empty_series(tmp_path):
+    SeriesWriter(tmp_path / "s").close()
+
+    assert len(open_series(tmp_path / "s")) == 0
+
+
+def test_mixed_awareness_rejected(tmp_path):
+    with pytest.raises(ValueError):
+        write_series(tmp_path / "s", make_points(1) + make_points(1, tz=timezone.utc))
+
+
+@pytest.mark.parametrize("tz", [timezone(timedelta(hours=5)), timezone.utc])
+def test_timezone_offset_round_trips(tmp_path, tz):
+    points = make_points(3, tz=tz)
+    write_series(tmp_path / "points", points)
+    write_series(tmp_path / "series", DataPointSeries.from_points(points))
+
+    for name in ("points", "series"):
+        series = open_series(tmp_path / name)
+        assert series.tz == tz
+        assert series.to_points() == points
+        assert series.to_points()[0].timestamp.utcoffset() == tz.utcoffset(None)
+
+
+def test_timezone_name_round_trips(tmp_path):
+    zoneinfo = pytest.importorskip("zoneinfo")
+    try:
+        tz = zoneinfo.ZoneInfo("Asia/Kolkata")
+    except zoneinfo.ZoneInfoNotFoundError:
+        pytest.skip("no IANA timezone database")
+    path = tmp_path / "s"
+    write_series(path, make_points(2, tz=tz))
+    write_series(path, make_points(2, start=2, tz=tz))
+
+    series = open_series(path)
+    assert series.tz == tz
+    assert series.to_points() == make_points(4, tz=tz)
@@ -0,0 +1,110 @@
+import math
+import random
+from datetime import datetime
+
+import pytest
+
+from src.example import DataPoint, calculate_moving_average
+from src.streaming import (
+    MovingAverage,
+    dedupe_points,
+    iter_moving_average,
+    merge_series,
+)
+
+
+def make_points(values):
+    return [DataPoint(datetime(2024, 1, 1), v) for v in values]
+
+
+@pytest.mark.parametrize("window_size", [1, 3, 50])
+def test_push_matches_batch(window_size):
+    rng = random.Random(1)
+    points = make_points([rng.uniform(-1e6, 1e6) for _ in range(10_000)])
+
+    acc = MovingAverage(window_size)
+    streamed = [acc.push(p) for p in points]
+
+    assert streamed == calculate_moving_average(points, window_size, backend="python")
+
+
+def test_window_is_bounded():
+    acc = MovingAverage(3)
+    for v in [1.0, 2.0, 3.0, 4.0, 5.0]:
+        acc.push_value(v)
+
+    assert acc.window == [3.0, 4.0, 5.0]
+    assert acc.count == 5
+    assert len(acc._buffer) == 3
+
+
+def test_non_finite_values_leave_window():
+    acc = MovingAverage(2)
+    results = [acc.push_value(v) for v in [1.0, math.inf, 2.0, 4.0]]
+
+    assert results == [1.0, math.inf, math.inf, 3.0]
+
+
+def test_iter_moving_average_is_lazy():
+    consumed = []
+
+    def source():
+        for v in [1.0, 2.0, 3.0, 4.0]:
+            consumed.append(v)
+            yield DataPoint(datetime(2024, 1, 1), v)
+
+    it = iter_moving_average(source(), window_size=2)
+    assert next(it) == 1.0
+    assert consumed == [1.0]
+    assert list(it) == [1.5, 2.5, 3.5]
+
+
+def test_reset():
+    acc = MovingAverage(2)
+    acc.push_value(10.0)
+    acc.reset()
+
+    assert acc.push_value(1.0) == 1.0
+
+
+def test_dedupe_points_keeps_one_point_per_timestamp():
+    t0 = datetime(2024, 1, 1)
+    t1 = datetime(2024, 1, 2)
+    points = [
+        DataPoint(t0, 1.0, "a"),
+        DataPoint(t0, 3.0, "b"),
+        DataPoint(t1, 5.0),
+        DataPoint(t0, 7.0),
+    ]
+    assert [p.value for p in dedupe_points(points, "first")] == [1.0, 5.0, 7.0]
+    assert [p.value for p in dedupe_points(points, "last")] == [3.0, 5.0, 7.0]
+    mean = list(dedupe_points(points, "mean"))
+    assert mean[0] == DataPoint(t0, 2.0, "b")
+    assert [p.value for p in mean] == calculate_moving_average(points, 1, dedupe="mean")
+    with pytest.raises(ValueError, match="dedupe"):
+        dedupe_points(points, "max")
+
+
+def test_merge_series_is_lazy_and_ordered():
+    t = [datetime(2024, 1, 1, hour) for hour in range(6)]
+
+    def shard(*pairs):
+        for hour, label in pairs:
+            yield DataPoint(t[hour], float(hour), label)
+
+    merged = merge_series(
+        shard((0, "b"), (2, "b"), (4, "b")),
+        shard((1, "a"), (2, "a"), (5, "a")),
+        shard((2, None)),
+    )
+    points = list(merged)
+    assert [p.timestamp for p in points] == sorted(p.timestamp for p in points)
+    assert [p.label for p in points if p.timestamp == t[2]] == [None, "a", "b"]
+
+    by_source = merge_series(shard((2, "b")), shard((2, "a")), tiebreak="source")
+    assert [p.label for p in by_source] == ["b", "a"]
+    assert calculate_moving_average(
+        merge_series(shard((0, "x"), (2, "x")), shard((1, "y"))), 2
+    ) == [0.0, 0.5, 1.5]
+    with pytest.raises(ValueError, match="tiebreak"):
+        merge_series(tiebreak="time")
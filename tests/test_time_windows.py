@@ -0,0 +1,76 @@
+import math
+import random
+import statistics
+from datetime import datetime, timedelta
+
+import pytest
+
+from src.example import DataPoint, calculate_moving_average
+from src.series import DataPointSeries
+
+
+def irregular_points(n=2000, seed=3):
+    rng = random.Random(seed)
+    t = datetime(2024, 1, 1)
+    points = []
+    for _ in range(n):
+        t += timedelta(seconds=rng.choice([0, 1, 2, 7, 30]))
+        points.append(DataPoint(t, rng.uniform(-100, 100)))
+    return points
+
+
+def brute_force(points, window):
+    return [
+        statistics.mean(
+            q.value for q in points[: i + 1] if q.timestamp > p.timestamp - window
+        )
+        for i, p in enumerate(points)
+    ]
+
+
+def test_time_window_matches_brute_force():
+    points = irregular_points()
+    window = timedelta(seconds=45)
+
+    result = calculate_moving_average(points, window)
+    expected = brute_force(points, window)
+    assert all(math.isclose(a, b, abs_tol=1e-9) for a, b in zip(result, expected))
+
+
+def test_time_window_on_series_matches_points():
+    points = irregular_points(500)
+    window = timedelta(minutes=1)
+    series = DataPointSeries.from_points(points)
+
+    assert calculate_moving_average(series, window) == calculate_moving_average(
+        points, window
+    )
+
+
+def test_time_window_evicts_by_timestamp():
+    t = datetime(2024, 1, 1)
+    points = [
+        DataPoint(t, 1.0),
+        DataPoint(t + timedelta(minutes=1), 3.0),
+        DataPoint(t + timedelta(minutes=10), 10.0),
+    ]
+
+    result = calculate_moving_average(points, timedelta(minutes=5))
+    assert result == [1.0, 2.0, 10.0]
+
+
+def test_unsorted_input_raises_or_sorts():
+    t = datetime(2024, 1, 1)
+    points = [DataPoint(t + timedelta(seconds=1), 2.0), DataPoint(t, 4.0)]
+
+    with pytest.raises(ValueError, match="sorted"):
+        calculate_moving_average(points, timedelta(seconds=5))
+    assert calculate_moving_average(points, timedelta(seconds=5), sort=True) == [
+        4.0,
+        3.0,
+    ]
+
+
+def test_time_window_rejects_numpy_backend():
+    with pytest.raises(ValueError):
+        calculate_moving_average([], timedelta(seconds=1), backend="numpy")